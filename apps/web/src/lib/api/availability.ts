@@ -0,0 +1,20 @@
+import type { AvailabilityCheckBatchResponse, AvailabilityCheckRequest } from "@namesmith/shared-ts";
+import { apiFetch } from "@/lib/api-client";
+
+export async function checkAvailability(
+  accessToken: string | null,
+  payload: AvailabilityCheckRequest,
+): Promise<AvailabilityCheckBatchResponse> {
+  return apiFetch<AvailabilityCheckBatchResponse>("/v1/availability/check", {
+    method: "POST",
+    body: JSON.stringify(payload),
+    accessToken,
+  });
+}
+
+export async function fetchAvailabilityCheck(
+  accessToken: string | null,
+  jobId: string,
+): Promise<AvailabilityCheckBatchResponse> {
+  return apiFetch<AvailabilityCheckBatchResponse>(`/v1/availability/check/${jobId}`, { accessToken });
+}
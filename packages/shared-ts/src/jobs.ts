@@ -1,4 +1,16 @@
-import type { EntryPath, JobStatus, JobType } from "./base";
+import type { AvailabilityStatus, EntryPath, JobStatus, JobType } from "./base";
+
+export interface LLMUsageSummary {
+  calls: number;
+  prompt_tokens: number;
+  completion_tokens: number;
+  total_tokens: number;
+  cost_usd: number;
+}
+
+export interface JobUsage extends LLMUsageSummary {
+  by_model: Record<string, LLMUsageSummary>;
+}
 
 export interface Job {
   id: string;
@@ -11,6 +23,7 @@ export interface Job {
   progress?: Record<string, unknown> | null;
   generation_model?: string | null;
   scoring_model?: string | null;
+  usage?: JobUsage | null;
 }
 
 export interface JobListResponse {
@@ -18,6 +31,16 @@ export interface JobListResponse {
   next_cursor?: string | null;
 }
 
+export interface JobBatchResponse {
+  items: Job[];
+}
+
+export interface JobUsageRollupResponse {
+  since?: string | null;
+  jobs: number;
+  usage: JobUsage;
+}
+
 export interface JobCreateRequest {
   entry_path: EntryPath;
   topic?: string | null;
@@ -28,3 +51,28 @@ export interface JobCreateRequest {
   generation_model?: string | null;
   scoring_model?: string | null;
 }
+
+export interface JobBatchCreateRequest {
+  jobs: JobCreateRequest[];
+}
+
+export type DomainLookup =
+  | { id: string }
+  | { full_domain: string }
+  | { label: string; tld: string };
+
+export interface AvailabilityCheckRequest {
+  domains: DomainLookup[];
+}
+
+export interface AvailabilityCheckResult {
+  full_domain: string;
+  status: AvailabilityStatus;
+  checked_at?: string | null;
+}
+
+export interface AvailabilityCheckBatchResponse {
+  status: JobStatus;
+  job_id?: string | null;
+  results?: AvailabilityCheckResult[] | null;
+}
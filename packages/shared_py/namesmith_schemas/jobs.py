@@ -21,6 +21,22 @@ class JobCreateRequest(NamesmithModel):
     scoring_model: Optional[str] = None
 
 
+class JobBatchCreateRequest(NamesmithModel):
+    jobs: list[JobCreateRequest] = Field(min_length=1, max_length=1000)
+
+
+class LLMUsageSummary(NamesmithModel):
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_tokens: int = 0
+    cost_usd: float = 0.0
+
+
+class JobUsage(LLMUsageSummary):
+    by_model: dict[str, LLMUsageSummary] = Field(default_factory=dict)
+
+
 class JobResponse(NamesmithModel):
     id: UUID
     type: JobType
@@ -32,6 +48,7 @@ class JobResponse(NamesmithModel):
     progress: Optional[dict[str, Any]] = None
     generation_model: Optional[str] = None
     scoring_model: Optional[str] = None
+    usage: Optional[JobUsage] = None
 
 
 class JobListResponse(NamesmithModel):
@@ -39,6 +56,16 @@ class JobListResponse(NamesmithModel):
     next_cursor: Optional[str] = None
 
 
+class JobBatchResponse(NamesmithModel):
+    items: list[JobResponse]
+
+
+class JobUsageRollupResponse(NamesmithModel):
+    since: Optional[datetime] = None
+    jobs: int = 0
+    usage: JobUsage = Field(default_factory=JobUsage)
+
+
 class DomainLookupBase(NamesmithModel):
     model_config = NamesmithModel.model_config | {"extra": "forbid"}
     _required_keys: ClassVar[set[str]] = set()
@@ -85,12 +112,13 @@ DomainLookup = Union[DomainLookupById, DomainLookupByFullDomain, DomainLookupByL
 
 
 class AvailabilityCheckRequest(NamesmithModel):
-    domains: list[DomainLookup]
+    domains: list[DomainLookup] = Field(min_length=1, max_length=5000)
 
 
 class AvailabilityCheckResult(NamesmithModel):
     full_domain: str
     status: AvailabilityStatus
+    checked_at: Optional[datetime] = None
 
 
 class AvailabilityCheckResponse(NamesmithModel):
@@ -99,6 +127,9 @@ class AvailabilityCheckResponse(NamesmithModel):
 
 class AvailabilityCheckBatchResponse(NamesmithModel):
     status: JobStatus
+    # Set when the check continues in the background; poll
+    # ``GET /v1/availability/check/{job_id}`` for results as they land.
+    job_id: Optional[UUID] = None
     results: Optional[list[AvailabilityCheckResult]] = None
 
 
@@ -107,7 +138,12 @@ __all__ = [
     "AvailabilityCheckRequest",
     "AvailabilityCheckResponse",
     "AvailabilityCheckResult",
+    "JobBatchCreateRequest",
+    "JobBatchResponse",
     "JobCreateRequest",
     "JobListResponse",
     "JobResponse",
+    "JobUsage",
+    "JobUsageRollupResponse",
+    "LLMUsageSummary",
 ]
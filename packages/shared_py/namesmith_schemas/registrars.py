@@ -8,6 +8,7 @@ class DomainAvailabilityProvider(str, Enum):
     STUB = "stub"
     WHOAPI = "whoapi"
     WHOISJSONAPI = "whoisjsonapi"
+    RDAP = "rdap"
 
     @classmethod
     def from_str(cls, value: str | "DomainAvailabilityProvider") -> "DomainAvailabilityProvider":
@@ -0,0 +1,222 @@
+"""Re-checking stored domains against the registrar provider."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import AsyncIterator, Mapping, Sequence
+from uuid import UUID
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from services.api.db.session import JobSessionFactory
+from services.api.metrics import JOB_DURATION
+from services.api.repositories import (
+    add_availability_job_results,
+    get_job,
+    list_stale_availability,
+    update_job_status,
+    upsert_availability_many,
+)
+
+from .providers.base import AvailabilityProvider
+from .providers.llm import build_availability_provider
+from .providers.rate_limit import RateLimiter
+from .settings import settings
+from .state import AvailabilityResult, Candidate
+
+logger = logging.getLogger(__name__)
+
+# Results persisted per commit while a background re-check runs.
+_FLUSH_SIZE = 100
+# Statuses worth storing; a failed lookup must not overwrite a known status.
+_CONCLUSIVE = {"available", "registered"}
+
+
+def _candidate(full_domain: str) -> Candidate:
+    label, _, tld = full_domain.partition(".")
+    return Candidate(label=label, tld=tld)
+
+
+async def iter_availability(
+    provider: AvailabilityProvider,
+    full_domains: Sequence[str],
+    *,
+    concurrency: int | None = None,
+    rate_per_second: float | None = None,
+) -> AsyncIterator[AvailabilityResult]:
+    """Check each domain with at most ``concurrency`` lookups in flight.
+
+    ``rate_per_second`` additionally caps how fast lookups start. Results are
+    yielded in completion order. A lookup that raises yields an ``error``
+    result instead of aborting the rest.
+    """
+    semaphore = asyncio.Semaphore(concurrency or settings.availability_concurrency_limit)
+    pacer = RateLimiter(rate_per_second) if rate_per_second else None
+
+    async def _check(full_domain: str) -> AvailabilityResult:
+        async with semaphore:
+            if pacer is not None:
+                await pacer.wait()
+            try:
+                results = await provider.check([_candidate(full_domain)])
+            except Exception:  # noqa: BLE001
+                logger.warning("Availability check for %s failed", full_domain, exc_info=True)
+                results = []
+        if results:
+            return results[0]
+        return AvailabilityResult(full_domain=full_domain, status="error")
+
+    tasks = [asyncio.ensure_future(_check(full_domain)) for full_domain in full_domains]
+    try:
+        for next_result in asyncio.as_completed(tasks):
+            yield await next_result
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def record_availability_results(
+    session: AsyncSession,
+    results: Sequence[AvailabilityResult],
+    domain_ids: Mapping[str, UUID | None],
+) -> None:
+    """Store conclusive results for domains that exist in the catalogue."""
+    await upsert_availability_many(
+        session,
+        results=[
+            {
+                "domain_id": domain_ids[result.full_domain],
+                "status": result.status,
+                "processed_by_agent": f"{settings.branding_name}-availability",
+                "agent_model": None,
+                "registrar": result.registrar,
+                "method": "registrar",
+                "raw_payload": result.raw_payload,
+                "ttl_sec": None,
+            }
+            for result in results
+            if domain_ids.get(result.full_domain) is not None and result.status in _CONCLUSIVE
+        ],
+    )
+
+
+async def recheck_domains(
+    session: AsyncSession,
+    domain_ids: Mapping[str, UUID | None],
+) -> list[AvailabilityResult]:
+    """Check ``domain_ids`` (full domain -> id, if stored) and record the results.
+
+    The caller commits.
+    """
+    async with httpx.AsyncClient() as http_client:
+        provider = build_availability_provider(http_client=http_client)
+        results = [result async for result in iter_availability(provider, list(domain_ids))]
+    await record_availability_results(session, results, domain_ids)
+    return results
+
+
+def result_payload(result: AvailabilityResult) -> dict:
+    return {"full_domain": result.full_domain, "status": result.status, "checked_at": result.checked_at}
+
+
+async def run_availability_job(job_id: UUID, domain_ids: Mapping[str, UUID | None]) -> None:
+    """Background re-check for a large request.
+
+    Results are appended to ``availability_job_results`` and committed every
+    ``_FLUSH_SIZE`` domains, with ``params['progress']``, so pollers see them
+    as they land.
+    """
+    started = time.perf_counter()
+    async with JobSessionFactory() as session:
+        job = await get_job(session, job_id)
+        if job is None:
+            return
+        await update_job_status(session, job, status="running", started_at=datetime.utcnow())
+        await session.commit()
+
+        total = len(domain_ids)
+        checked = 0
+        pending: list[AvailabilityResult] = []
+
+        async def _flush() -> None:
+            nonlocal checked
+            await record_availability_results(session, pending, domain_ids)
+            checked += len(pending)
+            await add_availability_job_results(session, job_id, [result_payload(result) for result in pending])
+            job.params = {**(job.params or {}), "progress": {"checked": checked, "total": total}}
+            pending.clear()
+            await session.commit()
+
+        try:
+            async with httpx.AsyncClient() as http_client:
+                provider = build_availability_provider(http_client=http_client)
+                async for result in iter_availability(provider, list(domain_ids)):
+                    pending.append(result)
+                    if len(pending) >= _FLUSH_SIZE:
+                        await _flush()
+            await _flush()
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Availability job %s failed", job_id)
+            await session.rollback()
+            job = await get_job(session, job_id)
+            if job is not None:
+                await update_job_status(session, job, status="failed", error=str(exc), finished_at=datetime.utcnow())
+                await session.commit()
+            JOB_DURATION.labels(status="failed").observe(time.perf_counter() - started)
+            return
+
+        await update_job_status(session, job, status="succeeded", finished_at=datetime.utcnow())
+        await session.commit()
+        JOB_DURATION.labels(status="succeeded").observe(time.perf_counter() - started)
+
+
+async def refresh_stale_availability(
+    session: AsyncSession,
+    *,
+    checked_before: datetime,
+    max_domains: int,
+    batch_size: int,
+    rate_per_second: float | None,
+) -> dict[str, int]:
+    """Re-check up to ``max_domains`` stale domains, most valuable first.
+
+    The stale set is selected and ordered once, then walked in batches of
+    ``batch_size``: each batch is checked through the configured registrar
+    provider and committed before the next one, so an interrupted run keeps
+    its progress. Domains whose check failed are not retried within the
+    run. Returns counts of checked and updated domains.
+    """
+    checked = updated = 0
+    stale = await list_stale_availability(session, checked_before=checked_before, limit=max_domains)
+    async with httpx.AsyncClient() as http_client:
+        provider = build_availability_provider(http_client=http_client)
+        for start in range(0, len(stale), batch_size):
+            rows = stale[start : start + batch_size]
+            domain_ids = {row.full_domain: row.id for row in rows}
+            results = [
+                result
+                async for result in iter_availability(provider, list(domain_ids), rate_per_second=rate_per_second)
+            ]
+            await record_availability_results(session, results, domain_ids)
+            await session.commit()
+            checked += len(rows)
+            conclusive = sum(result.status in _CONCLUSIVE for result in results)
+            updated += conclusive
+            if not conclusive:
+                # Nothing in this batch could be refreshed; the registrar is
+                # most likely down, so stop instead of burning the whole run.
+                break
+    return {"checked": checked, "updated": updated}
+
+
+__all__ = [
+    "iter_availability",
+    "record_availability_results",
+    "recheck_domains",
+    "refresh_stale_availability",
+    "result_payload",
+    "run_availability_job",
+]
@@ -0,0 +1,353 @@
+"""End-to-end throughput benchmark for the generation graph.
+
+Runs ``build_generation_graph`` with the deterministic fake providers and reports
+per-node wall time, database round trips, jobs/sec per concurrency level and peak
+memory. By default the persist node writes to an in-memory session stand-in that
+only counts round trips; pass ``--database-url`` to write to a scratch Postgres
+database instead (rows are left in place).
+
+    python -m services.agents.benchmark --jobs 32 --concurrency 1 4 16
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import statistics
+import time
+import tracemalloc
+import uuid
+from dataclasses import asdict, dataclass, field
+from types import SimpleNamespace
+from typing import Any, Callable
+
+# Agent and API settings require DATABASE_URL at import time even when the
+# benchmark only uses the in-memory stand-in.
+os.environ.setdefault("DATABASE_URL", "postgresql://localhost/namesmith_bench")
+
+from sqlalchemy import event  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine  # noqa: E402
+
+from packages.shared_py.namesmith_schemas.base import EntryPath  # noqa: E402
+
+from .graph import build_generation_graph  # noqa: E402
+from .nodes.persist import build_persist_node  # noqa: E402
+from .providers.fake import (  # noqa: E402
+    FakeAvailabilityProvider,
+    FakeGenerationProvider,
+    FakeScoringProvider,
+    LatencyProfile,
+)
+from .state import GenerationInputs  # noqa: E402
+
+NODE_NAMES = ("gather_context", "generate", "dedupe", "score", "availability", "persist")
+
+
+@dataclass
+class RoundTripCounter:
+    count: int = 0
+
+
+class _StubResult:
+    def scalar_one(self) -> SimpleNamespace:
+        return SimpleNamespace(id=uuid.uuid4())
+
+
+class RecordingSession:
+    """``AsyncSession`` stand-in that records database round trips without a database.
+
+    ``execute`` and ``commit`` always count as one round trip; ``flush`` counts only
+    when objects were added since the last flush, matching what SQLAlchemy emits.
+    """
+
+    def __init__(self, counter: RoundTripCounter) -> None:
+        self._counter = counter
+        self._pending = 0
+
+    async def execute(self, *args: Any, **kwargs: Any) -> _StubResult:
+        self._counter.count += 1
+        return _StubResult()
+
+    def add(self, instance: Any) -> None:
+        self._pending += 1
+
+    async def flush(self) -> None:
+        if self._pending:
+            self._counter.count += 1
+            self._pending = 0
+
+    async def commit(self) -> None:
+        await self.flush()
+        self._counter.count += 1
+
+    async def rollback(self) -> None:
+        self._pending = 0
+
+    async def close(self) -> None:
+        return None
+
+    async def __aenter__(self) -> "RecordingSession":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+
+@dataclass
+class BenchmarkConfig:
+    jobs: int = 16
+    count: int = 20
+    tlds: list[str] = field(default_factory=lambda: ["com", "ai"])
+    generation_latency: LatencyProfile = LatencyProfile(1.5, 4.0)
+    scoring_latency: LatencyProfile = LatencyProfile(1.0, 3.0)
+    availability_latency: LatencyProfile = LatencyProfile(0.2, 0.8)
+    generation_error_rate: float = 0.0
+    scoring_error_rate: float = 0.0
+    availability_error_rate: float = 0.05
+    availability_concurrency: int = 5
+    payload_bytes: int = 256
+    seed: int = 0
+    database_url: str | None = None
+    trace_memory: bool = False
+
+
+@dataclass
+class BenchmarkResult:
+    concurrency: int
+    jobs: int
+    failed: int
+    wall_seconds: float
+    db_round_trips: int
+    peak_memory_bytes: int
+    node_seconds: dict[str, list[float]]
+
+    @property
+    def jobs_per_second(self) -> float:
+        return (self.jobs - self.failed) / self.wall_seconds if self.wall_seconds > 0 else 0.0
+
+    @property
+    def round_trips_per_job(self) -> float:
+        return self.db_round_trips / self.jobs if self.jobs else 0.0
+
+    def summary(self) -> dict[str, Any]:
+        nodes = {
+            name: {
+                "p50_ms": round(statistics.median(samples) * 1000, 2),
+                "p95_ms": round(_percentile(samples, 0.95) * 1000, 2),
+                "total_s": round(sum(samples), 3),
+            }
+            for name, samples in self.node_seconds.items()
+            if samples
+        }
+        return {
+            "concurrency": self.concurrency,
+            "jobs": self.jobs,
+            "failed": self.failed,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "jobs_per_second": round(self.jobs_per_second, 3),
+            "db_round_trips": self.db_round_trips,
+            "round_trips_per_job": round(self.round_trips_per_job, 2),
+            "peak_memory_bytes": self.peak_memory_bytes,
+            "nodes": nodes,
+        }
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(fraction * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def _build_providers(config: BenchmarkConfig, job_index: int):
+    seed = config.seed + job_index
+    return (
+        FakeGenerationProvider(
+            latency=config.generation_latency,
+            error_rate=config.generation_error_rate,
+            seed=seed,
+        ),
+        FakeScoringProvider(
+            latency=config.scoring_latency,
+            error_rate=config.scoring_error_rate,
+            seed=seed,
+        ),
+        FakeAvailabilityProvider(
+            latency=config.availability_latency,
+            error_rate=config.availability_error_rate,
+            concurrency=config.availability_concurrency,
+            payload_bytes=config.payload_bytes,
+            seed=seed,
+        ),
+    )
+
+
+async def _create_job_ids(session_factory: Callable[[], Any], jobs: int) -> list[uuid.UUID]:
+    from services.api.repositories import create_job
+
+    async with session_factory() as session:
+        created = [
+            await create_job(
+                session,
+                entry_path=EntryPath.BUSINESS.value,
+                job_type="generate",
+                created_by=None,
+                params={"benchmark": True},
+            )
+            for _ in range(jobs)
+        ]
+        await session.commit()
+        return [job.id for job in created]
+
+
+async def run_benchmark(config: BenchmarkConfig, *, concurrency: int) -> BenchmarkResult:
+    counter = RoundTripCounter()
+    engine = None
+    if config.database_url:
+        url = config.database_url
+        if url.startswith("postgresql://"):
+            url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
+        engine = create_async_engine(url, pool_size=max(5, concurrency))
+
+        @event.listens_for(engine.sync_engine, "before_cursor_execute")
+        def _count_statement(*_: Any) -> None:
+            counter.count += 1
+
+        @event.listens_for(engine.sync_engine, "commit")
+        def _count_commit(*_: Any) -> None:
+            counter.count += 1
+
+        session_factory: Callable[[], Any] = async_sessionmaker(
+            bind=engine, expire_on_commit=False, class_=AsyncSession
+        )
+        job_ids = await _create_job_ids(session_factory, config.jobs)
+        counter.count = 0
+    else:
+        session_factory = lambda: RecordingSession(counter)  # noqa: E731
+        job_ids = [uuid.uuid4() for _ in range(config.jobs)]
+
+    node_seconds: dict[str, list[float]] = {name: [] for name in NODE_NAMES}
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    failed = 0
+
+    async def _run_job(job_index: int, job_id: uuid.UUID) -> None:
+        nonlocal failed
+        generation, scoring, availability = _build_providers(config, job_index)
+        inputs = GenerationInputs(
+            job_id=job_id,
+            entry_path=EntryPath.BUSINESS,
+            topic="benchmark",
+            tlds=config.tlds,
+            count=config.count,
+        )
+        async with semaphore:
+            async with session_factory() as session:
+                graph = build_generation_graph(
+                    generation_provider=generation,
+                    scoring_provider=scoring,
+                    availability_provider=availability,
+                    persist_node=build_persist_node(session),
+                )
+                last = time.perf_counter()
+                try:
+                    async for update in graph.astream({"inputs": inputs}, stream_mode="updates"):
+                        now = time.perf_counter()
+                        for node_name in update:
+                            node_seconds.setdefault(node_name, []).append(now - last)
+                        last = now
+                except Exception:  # noqa: BLE001
+                    failed += 1
+
+    if config.trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(_run_job(index, job_id) for index, job_id in enumerate(job_ids)))
+        wall_seconds = time.perf_counter() - started
+    finally:
+        if config.trace_memory:
+            _, peak_memory = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        else:
+            # ru_maxrss is reported in KiB on Linux and is a process-lifetime maximum.
+            peak_memory = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        if engine is not None:
+            await engine.dispose()
+
+    return BenchmarkResult(
+        concurrency=concurrency,
+        jobs=config.jobs,
+        failed=failed,
+        wall_seconds=wall_seconds,
+        db_round_trips=counter.count,
+        peak_memory_bytes=peak_memory,
+        node_seconds=node_seconds,
+    )
+
+
+def _format_result(result: BenchmarkResult) -> str:
+    summary = result.summary()
+    lines = [
+        (
+            f"concurrency={summary['concurrency']} jobs={summary['jobs']} failed={summary['failed']} "
+            f"wall={summary['wall_seconds']}s jobs/s={summary['jobs_per_second']} "
+            f"db_round_trips={summary['db_round_trips']} ({summary['round_trips_per_job']}/job) "
+            f"peak_mem={summary['peak_memory_bytes'] / (1024 * 1024):.1f}MiB"
+        )
+    ]
+    for name, stats in summary["nodes"].items():
+        lines.append(
+            f"  {name:<15} p50={stats['p50_ms']:>9.2f}ms p95={stats['p95_ms']:>9.2f}ms total={stats['total_s']:.3f}s"
+        )
+    return "\n".join(lines)
+
+
+def _latency(values: list[float]) -> LatencyProfile:
+    return LatencyProfile(median=values[0], p95=values[1])
+
+
+async def _main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the Namesmith generation graph with fake providers")
+    parser.add_argument("--jobs", type=int, default=16, help="Jobs to run per concurrency level")
+    parser.add_argument("--count", type=int, default=20, help="Names requested per job")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16], help="Concurrency levels to run")
+    parser.add_argument("--generation-latency", type=float, nargs=2, metavar=("MEDIAN", "P95"), default=[1.5, 4.0])
+    parser.add_argument("--scoring-latency", type=float, nargs=2, metavar=("MEDIAN", "P95"), default=[1.0, 3.0])
+    parser.add_argument("--availability-latency", type=float, nargs=2, metavar=("MEDIAN", "P95"), default=[0.2, 0.8])
+    parser.add_argument("--generation-error-rate", type=float, default=0.0)
+    parser.add_argument("--scoring-error-rate", type=float, default=0.0)
+    parser.add_argument("--availability-error-rate", type=float, default=0.05)
+    parser.add_argument("--availability-concurrency", type=int, default=5)
+    parser.add_argument("--payload-bytes", type=int, default=256, help="Size of each fake registrar payload")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--database-url", dest="database_url", default=None, help="Scratch Postgres database to write to")
+    parser.add_argument("--trace-memory", action="store_true", help="Measure peak Python heap with tracemalloc")
+    parser.add_argument("--json", action="store_true", help="Emit one JSON object per concurrency level")
+    args = parser.parse_args()
+
+    config = BenchmarkConfig(
+        jobs=args.jobs,
+        count=args.count,
+        generation_latency=_latency(args.generation_latency),
+        scoring_latency=_latency(args.scoring_latency),
+        availability_latency=_latency(args.availability_latency),
+        generation_error_rate=args.generation_error_rate,
+        scoring_error_rate=args.scoring_error_rate,
+        availability_error_rate=args.availability_error_rate,
+        availability_concurrency=args.availability_concurrency,
+        payload_bytes=args.payload_bytes,
+        seed=args.seed,
+        database_url=args.database_url,
+        trace_memory=args.trace_memory,
+    )
+    for concurrency in args.concurrency:
+        result = await run_benchmark(config, concurrency=concurrency)
+        if args.json:
+            print(json.dumps({"config": asdict(config) | {"database_url": bool(config.database_url)}, **result.summary()}))
+        else:
+            print(_format_result(result))
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -1,8 +1,15 @@
 """Entry points for running agent workflows."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from datetime import datetime
+from typing import Callable, Sequence
+from uuid import UUID
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession
 
 logger = logging.getLogger(__name__)
 
@@ -10,18 +17,88 @@ logger = logging.getLogger(__name__)
 
 from langgraph.graph.state import CompiledStateGraph as CompiledGraph
 
-from services.api.db.session import SessionFactory
-from services.api.repositories import get_job, update_job_status
+from services.api.db.models import Job
+from services.api.db.session import JobSessionFactory
+from services.api.metrics import JOB_DURATION
+from services.api.repositories import (
+    adopt_job_results,
+    get_job,
+    get_job_version,
+    record_agent_runs,
+    update_job_status,
+)
+from services.api.settings import settings as api_settings
 
 from .graph import build_generation_graph
+from .instrumentation import PipelineTrace
 from .settings import settings
-from .nodes.persist import build_persist_node
+from .nodes.persist import answered_models, build_persist_node
+from .pipeline import run_streaming_pipeline
+from .providers.base import AvailabilityProvider, GenerationProvider, ScoringProvider
 from .providers.llm import build_default_providers
 from .state import GenerationInputs, GenerationState, GenerationStateDict
 
 
-async def run_generation_job(inputs: GenerationInputs) -> GenerationState:
-    async with SessionFactory() as session:
+def _node_runs(trace: PipelineTrace) -> list[dict]:
+    return [
+        {
+            "agent_name": f"{settings.branding_name}-{metrics.node}",
+            "status": metrics.status,
+            "output_payload": metrics.as_output(),
+            "started_at": metrics.started_at,
+            "finished_at": metrics.finished_at,
+            "trace_id": trace.trace_id,
+        }
+        for metrics in trace.nodes
+    ]
+
+
+async def _wait_for_leader(leader_id: UUID) -> str | None:
+    """Poll the leader job until it finishes; returns its final status.
+
+    ``None`` means the leader vanished or did not finish within
+    ``job_coalesce_max_wait_seconds``.
+    """
+    deadline = time.monotonic() + api_settings.job_coalesce_max_wait_seconds
+    while True:
+        async with JobSessionFactory() as session:
+            version = await get_job_version(session, leader_id)
+        if version is None:
+            return None
+        if version.status in ("succeeded", "failed"):
+            return version.status
+        if time.monotonic() >= deadline:
+            return None
+        await asyncio.sleep(api_settings.job_coalesce_poll_interval_seconds)
+
+
+async def _adopt_leader_results(session: AsyncSession, job: Job, inputs: GenerationInputs) -> GenerationState | None:
+    """Finish a coalesced job from its leader's results, if the leader succeeded."""
+    leader_id = UUID((job.params or {})["coalesced_with"])
+    leader_status = await _wait_for_leader(leader_id)
+    if leader_status == "succeeded":
+        leader = await get_job(session, leader_id)
+        if leader is not None:
+            await adopt_job_results(session, job=job, source=leader, finished_at=datetime.utcnow())
+            await session.commit()
+            return GenerationState(inputs=inputs, progress=(job.params or {}).get("progress") or {})
+    # Run the pipeline after all; drop the link so the job reports its own results.
+    logger.info("Leader job %s of %s ended %s; running it independently", leader_id, job.id, leader_status)
+    job.params = {key: value for key, value in (job.params or {}).items() if key != "coalesced_with"}
+    await session.commit()
+    return None
+
+
+ProviderFactory = Callable[..., tuple[GenerationProvider, ScoringProvider, AvailabilityProvider]]
+
+
+async def run_generation_job(
+    inputs: GenerationInputs,
+    *,
+    build_providers: ProviderFactory = build_default_providers,
+) -> GenerationState:
+    started = time.perf_counter()
+    async with JobSessionFactory() as session:
         job = await get_job(session, inputs.job_id)
         start_time = datetime.utcnow()
         if job is not None:
@@ -32,11 +109,17 @@ async def run_generation_job(inputs: GenerationInputs) -> GenerationState:
                 started_at=start_time,
             )
             await session.commit()
+            if "coalesced_with" in (job.params or {}):
+                adopted = await _adopt_leader_results(session, job, inputs)
+                if adopted is not None:
+                    JOB_DURATION.labels(status="coalesced").observe(time.perf_counter() - started)
+                    return adopted
         # TODO check if this code can be made simpler, remove try catch, remove if else
 
         resolved_generation_model: str | None = None
         resolved_scoring_model: str | None = None
         resolved_inputs: GenerationInputs
+        trace = PipelineTrace()
         try:
             resolved_generation_model = inputs.generation_model or settings.generation_model
             resolved_scoring_model = inputs.scoring_model or settings.scoring_model
@@ -55,21 +138,36 @@ async def run_generation_job(inputs: GenerationInputs) -> GenerationState:
                 }
             )
 
-            generation_provider, scoring_provider, availability_provider = build_default_providers(
+            generation_provider, scoring_provider, availability_provider = build_providers(
                 generation_model=resolved_generation_model,
                 scoring_model=resolved_scoring_model,
             )
-            graph: CompiledGraph = build_generation_graph(
-                generation_provider=generation_provider,
-                scoring_provider=scoring_provider,
-                availability_provider=availability_provider,
-                persist_node=build_persist_node(session),
-            )
-
             state: GenerationStateDict = {"inputs": resolved_inputs}
-            final_state = await graph.ainvoke(state)
+            if settings.streaming_pipeline_enabled:
+                final_state = await run_streaming_pipeline(
+                    state,
+                    generation_provider=generation_provider,
+                    scoring_provider=scoring_provider,
+                    availability_provider=availability_provider,
+                    session=session,
+                    trace=trace,
+                )
+            else:
+                graph: CompiledGraph = build_generation_graph(
+                    generation_provider=generation_provider,
+                    scoring_provider=scoring_provider,
+                    availability_provider=availability_provider,
+                    persist_node=build_persist_node(session, trace_id=trace.trace_id),
+                    trace=trace,
+                )
+                final_state = await graph.ainvoke(state)
         except Exception as exc:  # noqa: BLE001
+            JOB_DURATION.labels(status="failed").observe(time.perf_counter() - started)
             if job is not None:
+                if trace.nodes:
+                    # Tokens spent before the failure are still billed.
+                    job.params = dict(job.params or {}) | {"usage": trace.usage(), "trace_id": trace.trace_id}
+                    await record_agent_runs(session, job_id=job.id, runs=_node_runs(trace))
                 await update_job_status(
                     session,
                     job=job,
@@ -80,15 +178,17 @@ async def run_generation_job(inputs: GenerationInputs) -> GenerationState:
                 await session.commit()
             raise
 
-        assert resolved_generation_model is not None and resolved_scoring_model is not None
-
         if job is not None:
             progress = final_state.get("progress", {})
             params = dict(job.params or {})
-            params["generation_model"] = resolved_generation_model
-            params["scoring_model"] = resolved_scoring_model
+            params["generation_model"], params["scoring_model"] = answered_models(
+                resolved_inputs, final_state.get("scored", [])
+            )
             params["progress"] = progress
+            params["trace_id"] = trace.trace_id
+            params["usage"] = trace.usage()
             job.params = params
+            await record_agent_runs(session, job_id=job.id, runs=_node_runs(trace))
             await update_job_status(
                 session,
                 job=job,
@@ -97,4 +197,43 @@ async def run_generation_job(inputs: GenerationInputs) -> GenerationState:
             )
             await session.commit()
 
+        JOB_DURATION.labels(status="succeeded").observe(time.perf_counter() - started)
         return GenerationState(**final_state)
+
+
+async def run_generation_jobs(
+    batch: Sequence[GenerationInputs],
+    *,
+    concurrency: int | None = None,
+) -> list[GenerationState | BaseException]:
+    """Run the jobs of one batch submission with shared providers.
+
+    Providers are built once per (generation, scoring) model pair and share
+    one HTTP client, so registrar connections stay open across jobs and
+    same-model LLM calls go through the same provider instances. Failures are
+    returned in place of states; each job's row records its own outcome.
+    """
+    semaphore = asyncio.Semaphore(concurrency or settings.batch_job_concurrency)
+    async with httpx.AsyncClient() as http_client:
+        providers: dict[tuple[str, str], tuple[GenerationProvider, ScoringProvider, AvailabilityProvider]] = {}
+
+        def shared_providers(*, generation_model: str, scoring_model: str):
+            key = (generation_model, scoring_model)
+            if key not in providers:
+                providers[key] = build_default_providers(
+                    generation_model=generation_model,
+                    scoring_model=scoring_model,
+                    http_client=http_client,
+                )
+            return providers[key]
+
+        async def _run(inputs: GenerationInputs) -> GenerationState:
+            async with semaphore:
+                return await run_generation_job(inputs, build_providers=shared_providers)
+
+        results = await asyncio.gather(*(_run(inputs) for inputs in batch), return_exceptions=True)
+
+    for inputs, result in zip(batch, results):
+        if isinstance(result, BaseException):
+            logger.error("Generation job %s failed", inputs.job_id, exc_info=result)
+    return list(results)
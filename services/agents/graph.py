@@ -5,6 +5,7 @@ from langgraph.constants import END
 from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph as CompiledGraph
 
+from .instrumentation import PipelineTrace
 from .nodes.availability import build_availability_node
 from .nodes.dedupe import dedupe_and_filter
 from .nodes.gather import gather_context
@@ -21,14 +22,20 @@ def build_generation_graph(
     scoring_provider: ScoringProvider,
     availability_provider: AvailabilityProvider,
     persist_node,
+    trace: PipelineTrace | None = None,
 ) -> CompiledGraph:
+    nodes = {
+        "gather_context": gather_context,
+        "generate": build_generate_node(generation_provider),
+        "dedupe": dedupe_and_filter,
+        "score": build_score_node(scoring_provider),
+        "availability": build_availability_node(availability_provider),
+        "persist": persist_node,
+    }
+
     graph = StateGraph(GenerationStateDict)
-    graph.add_node("gather_context", gather_context)
-    graph.add_node("generate", build_generate_node(generation_provider))
-    graph.add_node("dedupe", dedupe_and_filter)
-    graph.add_node("score", build_score_node(scoring_provider))
-    graph.add_node("availability", build_availability_node(availability_provider))
-    graph.add_node("persist", persist_node)
+    for name, node in nodes.items():
+        graph.add_node(name, trace.wrap(name, node) if trace is not None else node)
 
     graph.set_entry_point("gather_context")
     graph.add_edge("gather_context", "generate")
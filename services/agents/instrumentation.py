@@ -0,0 +1,180 @@
+"""Per-node timing and usage instrumentation for the generation graph."""
+from __future__ import annotations
+
+import inspect
+import time
+import uuid
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Iterator
+
+from .parsing import extract_usage
+from .state import GenerationStateDict
+
+# State keys holding each node's input and output items.
+_INPUT_KEYS = {
+    "dedupe": "candidates",
+    "score": "filtered",
+    "availability": "scored",
+    "persist": "scored",
+}
+_OUTPUT_KEYS = {
+    "generate": "candidates",
+    "dedupe": "filtered",
+    "score": "scored",
+    "availability": "availability",
+    "persist": "persisted_domain_ids",
+}
+
+
+@dataclass
+class LLMUsage:
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float = 0.0
+
+    def add(self, other: LLMUsage) -> None:
+        self.calls += other.calls
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.cost_usd += other.cost_usd
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.prompt_tokens + self.completion_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+        }
+
+
+@dataclass
+class NodeMetrics:
+    node: str
+    started_at: datetime
+    finished_at: datetime | None = None
+    status: str = "running"
+    duration_ms: float = 0.0
+    items_in: int | None = None
+    items_out: int | None = None
+    errors: int = 0
+    error: str | None = None
+    usage_by_model: dict[str, LLMUsage] = field(default_factory=dict)
+
+    def count_in(self, items: int) -> None:
+        """Add to ``items_in`` as a streaming stage receives items."""
+        self.items_in = (self.items_in or 0) + items
+
+    def as_output(self) -> dict[str, Any]:
+        usage = LLMUsage()
+        for model_usage in self.usage_by_model.values():
+            usage.add(model_usage)
+        totals = usage.as_dict()
+        return {
+            "duration_ms": round(self.duration_ms, 3),
+            "items_in": self.items_in,
+            "items_out": self.items_out,
+            "errors": self.errors,
+            "error": self.error,
+            "llm_calls": totals["calls"],
+            "prompt_tokens": totals["prompt_tokens"],
+            "completion_tokens": totals["completion_tokens"],
+            "total_tokens": totals["total_tokens"],
+            "cost_usd": totals["cost_usd"],
+            "models": list(self.usage_by_model),
+        }
+
+
+_current_node: ContextVar[NodeMetrics | None] = ContextVar("namesmith_current_node", default=None)
+
+
+def record_llm_usage(model: str, response: Any, *, cost_usd: float = 0.0) -> None:
+    """Attribute an LLM call, its token usage and cost to the node currently running.
+
+    A no-op outside an instrumented node, e.g. when a provider is used directly.
+    """
+    metrics = _current_node.get()
+    if metrics is None:
+        return
+    prompt_tokens, completion_tokens = extract_usage(response)
+    usage = metrics.usage_by_model.setdefault(model, LLMUsage())
+    usage.add(LLMUsage(calls=1, prompt_tokens=prompt_tokens, completion_tokens=completion_tokens, cost_usd=cost_usd))
+
+
+def _count(mapping: Any, key: str | None) -> int | None:
+    if key is None or not isinstance(mapping, dict):
+        return None
+    value = mapping.get(key)
+    return len(value) if value is not None else None
+
+
+class PipelineTrace:
+    """Collects ``NodeMetrics`` for one job's graph run under a shared trace id.
+
+    Metrics live on the trace rather than in graph state so they survive a node
+    raising, which is exactly when they are most useful.
+    """
+
+    def __init__(self, trace_id: str | None = None) -> None:
+        self.trace_id = trace_id or uuid.uuid4().hex
+        self.nodes: list[NodeMetrics] = []
+
+    @contextmanager
+    def stage(self, name: str, *, items_in: int | None = None) -> Iterator[NodeMetrics]:
+        """Time a node or streaming stage and attribute LLM usage inside it to ``name``.
+
+        Streaming stages run concurrently, each in its own task, so each
+        keeps its own metrics; the caller fills in item counts.
+        """
+        metrics = NodeMetrics(node=name, started_at=datetime.utcnow(), items_in=items_in)
+        self.nodes.append(metrics)
+        token = _current_node.set(metrics)
+        started = time.perf_counter()
+        try:
+            yield metrics
+        except Exception as exc:
+            metrics.status = "failed"
+            metrics.errors += 1
+            metrics.error = (str(exc) or type(exc).__name__)[:500]
+            raise
+        else:
+            metrics.status = "succeeded"
+        finally:
+            metrics.duration_ms = (time.perf_counter() - started) * 1000
+            metrics.finished_at = datetime.utcnow()
+            _current_node.reset(token)
+
+    def wrap(
+        self,
+        name: str,
+        node: Callable[[GenerationStateDict], Any],
+    ) -> Callable[[GenerationStateDict], Awaitable[Any]]:
+        async def _instrumented(state: GenerationStateDict) -> Any:
+            with self.stage(name, items_in=_count(state, _INPUT_KEYS.get(name))) as metrics:
+                result = node(state)
+                if inspect.isawaitable(result):
+                    result = await result
+
+            metrics.items_out = _count(result, _OUTPUT_KEYS.get(name))
+            if name == "availability" and isinstance(result, dict):
+                metrics.errors += sum(1 for item in result.get("availability", []) if item.status == "error")
+            return result
+
+        return _instrumented
+
+    def usage(self) -> dict[str, Any]:
+        """LLM usage for the whole run: totals plus a per-model breakdown."""
+        totals = LLMUsage()
+        by_model: dict[str, LLMUsage] = {}
+        for metrics in self.nodes:
+            for model, usage in metrics.usage_by_model.items():
+                by_model.setdefault(model, LLMUsage()).add(usage)
+                totals.add(usage)
+        return totals.as_dict() | {"by_model": {model: usage.as_dict() for model, usage in by_model.items()}}
+
+
+__all__ = ["LLMUsage", "NodeMetrics", "PipelineTrace", "record_llm_usage"]
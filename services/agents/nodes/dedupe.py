@@ -6,17 +6,24 @@ from ..state import Candidate, GenerationStateDict
 _ALLOWED_LENGTH_RANGE = (4, 15)
 
 
+def accept_candidate(candidate: Candidate, seen: set[str]) -> bool:
+    """Whether ``candidate`` is new and of an allowed length; accepted labels are added to ``seen``."""
+    label = candidate.label.lower()
+    if label in seen:
+        return False
+    if not _ALLOWED_LENGTH_RANGE[0] <= len(label) <= _ALLOWED_LENGTH_RANGE[1]:
+        return False
+    seen.add(label)
+    return True
+
+
 def dedupe_and_filter(state: GenerationStateDict) -> dict[str, list[Candidate]]:
     inputs = state["inputs"]
     seen: set[str] = set()
     filtered: list[Candidate] = []
     for candidate in state.get("candidates", []):
-        label = candidate.label.lower()
-        if label in seen:
-            continue
-        if not _ALLOWED_LENGTH_RANGE[0] <= len(label) <= _ALLOWED_LENGTH_RANGE[1]:
+        if not accept_candidate(candidate, seen):
             continue
-        seen.add(label)
         filtered.append(candidate)
         if len(filtered) >= inputs.count:
             break
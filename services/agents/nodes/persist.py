@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+from collections import Counter
 from datetime import datetime
 from typing import Iterable
 
@@ -16,75 +17,125 @@ from services.api.repositories import (
 )
 
 from ..settings import settings
-from ..state import GenerationStateDict, ScoredCandidate
+from ..state import AvailabilityResult, GenerationInputs, GenerationStateDict, ScoredCandidate
 
 
-def build_persist_node(session: AsyncSession):
-    async def _persist(state: GenerationStateDict) -> dict[str, list[str]]:
-        inputs = state["inputs"]
-        job_id = inputs.job_id
-        generation_model = inputs.generation_model or settings.generation_model
-        scoring_model = inputs.scoring_model or settings.scoring_model
-        agent_name = f"{settings.branding_name}-generation"
-        timestamp = datetime.utcnow()
+def _requested_models(inputs: GenerationInputs) -> tuple[str, str]:
+    return (
+        inputs.generation_model or settings.generation_model,
+        inputs.scoring_model or settings.scoring_model,
+    )
 
-        scored: Iterable[ScoredCandidate] = state.get("scored") or state.get("filtered") or []
-        availability_map = {
-            result.full_domain: result for result in state.get("availability", [])
-        }
 
-        domain_ids: list[str] = []
-        for candidate in scored:
-            domain = await upsert_domain(
-                session,
-                label=candidate.label,
-                tld=candidate.tld,
-                display_name=candidate.display_name,
-                processed_by_agent=agent_name,
-                agent_model=generation_model,
-            )
-            availability = availability_map.get(candidate.full_domain)
-            if availability:
-                await upsert_availability(
-                    session,
-                    domain_id=domain.id,
-                    status=availability.status,
-                    processed_by_agent=f"{settings.branding_name}-availability",
-                    agent_model=generation_model,
-                    registrar=availability.registrar,
-                    method="registrar",
-                    raw_payload=availability.raw_payload,
-                    ttl_sec=None,
-                )
-            await upsert_evaluation(
+def answered_models(inputs: GenerationInputs, scored: Iterable[ScoredCandidate]) -> tuple[str, str]:
+    """Generation and scoring models that produced most of ``scored``.
+
+    Falls back to the requested models when nothing was stamped.
+    """
+    scored = list(scored)
+    requested_generation_model, requested_scoring_model = _requested_models(inputs)
+    generation = Counter(c.generation_model for c in scored if c.generation_model).most_common(1)
+    scoring = Counter(c.scoring_model for c in scored if c.scoring_model).most_common(1)
+    return (
+        generation[0][0] if generation else requested_generation_model,
+        scoring[0][0] if scoring else requested_scoring_model,
+    )
+
+
+async def persist_candidates(
+    session: AsyncSession,
+    inputs: GenerationInputs,
+    scored: Iterable[ScoredCandidate],
+    availability: Iterable[AvailabilityResult],
+) -> list[str]:
+    """Upsert domains with their availability and evaluation, link them to the job, return their ids.
+
+    The caller records the agent run and commits.
+    """
+    job_id = inputs.job_id
+    requested_generation_model, requested_scoring_model = _requested_models(inputs)
+    agent_name = f"{settings.branding_name}-generation"
+    availability_map = {result.full_domain: result for result in availability}
+
+    domain_ids: list[str] = []
+    for candidate in scored:
+        # Stamp the models that answered; routing may have hedged or fallen back.
+        generation_model = candidate.generation_model or requested_generation_model
+        scoring_model = candidate.scoring_model or requested_scoring_model
+        domain = await upsert_domain(
+            session,
+            label=candidate.label,
+            tld=candidate.tld,
+            display_name=candidate.display_name,
+            processed_by_agent=agent_name,
+            agent_model=generation_model,
+        )
+        result = availability_map.get(candidate.full_domain)
+        if result:
+            await upsert_availability(
                 session,
                 domain_id=domain.id,
-                possible_categories=[],
-                possible_keywords=[],
-                memorability_score=candidate.memorability,
-                pronounceability_score=candidate.pronounceability,
-                brandability_score=candidate.brandability,
-                overall_score=candidate.overall,
-                description=candidate.rationale or "Generated via LLM scoring.",
-                processed_by_agent=f"{settings.branding_name}-scoring",
-                agent_model=scoring_model,
+                status=result.status,
+                processed_by_agent=f"{settings.branding_name}-availability",
+                agent_model=generation_model,
+                registrar=result.registrar,
+                method="registrar",
+                raw_payload=result.raw_payload,
+                ttl_sec=None,
             )
-            domain_ids.append(str(domain.id))
-            await link_domain_to_job(session, job_id=job_id, domain_id=domain.id)
-
-        await record_agent_run(
+        await upsert_evaluation(
             session,
-            job_id=job_id,
-            agent_name=agent_name,
-            status="succeeded",
-            input_payload=json.loads(state["inputs"].model_dump_json()),
-            output_payload={
-                "count": len(domain_ids),
-                "generation_model": generation_model,
-                "scoring_model": scoring_model,
-            },
-            started_at=timestamp,
-            finished_at=datetime.utcnow(),
+            domain_id=domain.id,
+            possible_categories=[],
+            possible_keywords=[],
+            memorability_score=candidate.memorability,
+            pronounceability_score=candidate.pronounceability,
+            brandability_score=candidate.brandability,
+            overall_score=candidate.overall,
+            description=candidate.rationale or "Generated via LLM scoring.",
+            processed_by_agent=f"{settings.branding_name}-scoring",
+            agent_model=scoring_model,
+        )
+        domain_ids.append(str(domain.id))
+        await link_domain_to_job(session, job_id=job_id, domain_id=domain.id)
+    return domain_ids
+
+
+async def record_generation_run(
+    session: AsyncSession,
+    inputs: GenerationInputs,
+    scored: Iterable[ScoredCandidate],
+    *,
+    count: int,
+    started_at: datetime,
+    trace_id: str | None,
+) -> None:
+    generation_model, scoring_model = answered_models(inputs, scored)
+    await record_agent_run(
+        session,
+        job_id=inputs.job_id,
+        agent_name=f"{settings.branding_name}-generation",
+        status="succeeded",
+        input_payload=json.loads(inputs.model_dump_json()),
+        output_payload={
+            "count": count,
+            "generation_model": generation_model,
+            "scoring_model": scoring_model,
+        },
+        started_at=started_at,
+        finished_at=datetime.utcnow(),
+        trace_id=trace_id,
+    )
+
+
+def build_persist_node(session: AsyncSession, *, trace_id: str | None = None):
+    async def _persist(state: GenerationStateDict) -> dict[str, list[str]]:
+        inputs = state["inputs"]
+        timestamp = datetime.utcnow()
+        scored: Iterable[ScoredCandidate] = state.get("scored") or state.get("filtered") or []
+        domain_ids = await persist_candidates(session, inputs, scored, state.get("availability", []))
+        await record_generation_run(
+            session, inputs, scored, count=len(domain_ids), started_at=timestamp, trace_id=trace_id
         )
         await session.commit()
         progress = dict(state.get("progress", {}))
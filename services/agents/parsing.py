@@ -0,0 +1,157 @@
+"""Decoding and validation of LLM responses into agent state models."""
+from __future__ import annotations
+
+from typing import Any, Sequence
+
+import orjson
+from pydantic import TypeAdapter
+
+from .state import Candidate, ScoredCandidate
+
+# Building a TypeAdapter compiles a validator; do it once per process, not per call.
+CANDIDATE_LIST_ADAPTER: TypeAdapter[list[Candidate]] = TypeAdapter(list[Candidate])
+SCORED_CANDIDATE_LIST_ADAPTER: TypeAdapter[list[ScoredCandidate]] = TypeAdapter(list[ScoredCandidate])
+
+
+def extract_json_payload(content: str) -> Any:
+    text = content.strip()
+    if text.startswith("```"):
+        lines = text.splitlines()
+        if len(lines) >= 2:
+            text = "\n".join(lines[1:-1]).strip()
+
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError as exc:
+        raise ValueError("LLM response was not valid JSON") from exc
+
+
+def parse_generation_payload(payload: Any) -> Sequence[dict[str, str]]:
+    if isinstance(payload, dict) and isinstance(payload.get("items"), list):
+        payload = payload["items"]
+    if not isinstance(payload, list):
+        raise ValueError("Generation response must be a JSON array or an object with 'items' array")
+    results: list[dict[str, str]] = []
+    for item in payload:
+        if not isinstance(item, dict):
+            raise ValueError("Each generation item must be an object")
+        results.append(item)
+    return results
+
+
+def parse_scoring_payload(payload: Any) -> Sequence[dict[str, Any]]:
+    if isinstance(payload, dict) and isinstance(payload.get("items"), list):
+        payload = payload["items"]
+    if not isinstance(payload, list):
+        raise ValueError("Scoring response must be a JSON array or an object with 'items' array")
+    results: list[dict[str, Any]] = []
+    for item in payload:
+        if not isinstance(item, dict):
+            raise ValueError("Each scoring item must be an object")
+        results.append(item)
+    return results
+
+
+class JsonItemStream:
+    """Incrementally decode the item objects of a streamed generation or scoring payload.
+
+    Accepts the same shapes as ``parse_generation_payload`` (a JSON array, or
+    an object whose ``items`` is one, optionally inside a code fence): the
+    first array opened holds the items, and each object directly inside it
+    is decoded as soon as its closing brace arrives.
+    """
+
+    def __init__(self) -> None:
+        self._stack: list[str] = []
+        self._items_depth: int | None = None
+        self._item: list[str] | None = None
+        self._in_string = False
+        self._escaped = False
+
+    @property
+    def started(self) -> bool:
+        """Whether the items array has been opened."""
+        return self._items_depth is not None
+
+    def feed(self, text: str) -> list[dict[str, Any]]:
+        """Consume the next chunk of text and return the items it completed."""
+        items: list[dict[str, Any]] = []
+        for char in text:
+            if self._item is not None:
+                self._item.append(char)
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+            elif char == '"':
+                self._in_string = True
+            elif char in "[{":
+                self._stack.append(char)
+                if char == "[" and self._items_depth is None:
+                    self._items_depth = len(self._stack)
+                elif char == "{" and self._items_depth is not None and len(self._stack) == self._items_depth + 1:
+                    self._item = [char]
+            elif char in "]}" and self._stack:
+                self._stack.pop()
+                if char == "}" and self._item is not None and len(self._stack) == self._items_depth:
+                    try:
+                        items.append(orjson.loads("".join(self._item)))
+                    except orjson.JSONDecodeError as exc:
+                        raise ValueError("LLM response item was not valid JSON") from exc
+                    self._item = None
+        return items
+
+
+def _usage_value(usage: Any, key: str) -> int:
+    value = usage.get(key) if isinstance(usage, dict) else getattr(usage, key, None)
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def extract_usage(response: Any) -> tuple[int, int]:
+    """Return ``(prompt_tokens, completion_tokens)`` from a LiteLLM response, or zeros."""
+    usage = response.get("usage") if isinstance(response, dict) else getattr(response, "usage", None)
+    if usage is None:
+        return 0, 0
+    return _usage_value(usage, "prompt_tokens"), _usage_value(usage, "completion_tokens")
+
+
+def parse_candidates(content: str) -> list[Candidate]:
+    """Decode a generation completion and validate its items in a single pass."""
+    raw_candidates = parse_generation_payload(extract_json_payload(content))
+    return CANDIDATE_LIST_ADAPTER.validate_python(raw_candidates)
+
+
+def parse_scored_candidates(content: str) -> list[ScoredCandidate]:
+    """Decode a scoring completion, defaulting missing ``overall`` scores.
+
+    A missing overall score is the integer mean of the three sub-scores, or 10
+    when those cannot be read as integers.
+    """
+    raw_scores = parse_scoring_payload(extract_json_payload(content))
+    for item in raw_scores:
+        if item.get("overall") is None:
+            try:
+                m, p, b = int(item.get("memorability")), int(item.get("pronounceability")), int(item.get("brandability"))
+            except Exception:
+                m, p, b = 10, 10, 10
+            item["overall"] = int((m + p + b) / 3)
+    return SCORED_CANDIDATE_LIST_ADAPTER.validate_python(raw_scores)
+
+
+__all__ = [
+    "CANDIDATE_LIST_ADAPTER",
+    "JsonItemStream",
+    "SCORED_CANDIDATE_LIST_ADAPTER",
+    "extract_json_payload",
+    "extract_usage",
+    "parse_candidates",
+    "parse_generation_payload",
+    "parse_scored_candidates",
+    "parse_scoring_payload",
+]
@@ -0,0 +1,225 @@
+"""Streaming execution of the generation pipeline.
+
+The LangGraph version runs each node to completion before the next starts.
+Here candidates flow through bounded queues instead: generation streams
+candidates as the completion is parsed, dedupe filters them online,
+scoring works in micro-batches, availability is checked per domain and
+persistence commits in micro-batches, all at the same time. Full queues
+slow the upstream stage down. The final state has the same shape as the
+graph's, so callers cannot tell which mode ran.
+"""
+from __future__ import annotations
+
+import asyncio
+from contextlib import aclosing
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .instrumentation import PipelineTrace
+from .nodes.dedupe import accept_candidate
+from .nodes.gather import gather_context
+from .nodes.persist import persist_candidates, record_generation_run
+from .providers.base import AvailabilityProvider, GenerationProvider, ScoringProvider
+from .settings import settings
+from .state import AvailabilityResult, GenerationStateDict, ScoredCandidate
+
+# Marks the end of a stage's output.
+_DONE = object()
+
+
+def _with_budget(coro: Awaitable[Any], budget: float) -> Awaitable[Any]:
+    return asyncio.wait_for(coro, timeout=budget) if budget and budget > 0 else coro
+
+
+async def _batches(queue: asyncio.Queue, size: int, wait: float) -> AsyncIterator[list]:
+    """Yield up to ``size`` items at a time from ``queue`` until ``_DONE``.
+
+    A partial batch is flushed once ``wait`` seconds pass without a new item.
+    ``_DONE`` is put back so that other workers on the same queue stop too.
+    """
+    batch: list = []
+    getter: asyncio.Future | None = None
+    try:
+        while True:
+            if getter is None:
+                getter = asyncio.ensure_future(queue.get())
+            done, _ = await asyncio.wait({getter}, timeout=wait if batch else None)
+            if not done:
+                yield batch
+                batch = []
+                continue
+            item, getter = getter.result(), None
+            if item is _DONE:
+                await queue.put(_DONE)
+                if batch:
+                    yield batch
+                return
+            batch.append(item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+    finally:
+        if getter is not None:
+            getter.cancel()
+
+
+async def _workers(count: int, worker: Callable[[], Awaitable[None]], output: asyncio.Queue) -> None:
+    await asyncio.gather(*(worker() for _ in range(count)))
+    await output.put(_DONE)
+
+
+async def run_streaming_pipeline(
+    state: GenerationStateDict,
+    *,
+    generation_provider: GenerationProvider,
+    scoring_provider: ScoringProvider,
+    availability_provider: AvailabilityProvider,
+    session: AsyncSession,
+    trace: PipelineTrace | None = None,
+) -> GenerationStateDict:
+    """Run one job through the streaming pipeline and return its final state."""
+    trace = trace or PipelineTrace()
+    inputs = state["inputs"]
+    started_at = datetime.utcnow()
+    state = {**state, **await trace.wrap("gather_context", gather_context)(state)}
+
+    queue_size = settings.streaming_queue_size
+    generated: asyncio.Queue = asyncio.Queue(queue_size)
+    filtered: asyncio.Queue = asyncio.Queue(queue_size)
+    scored: asyncio.Queue = asyncio.Queue(queue_size)
+    checked: asyncio.Queue = asyncio.Queue(queue_size)
+    enough = asyncio.Event()
+    wait = settings.streaming_batch_wait_seconds
+
+    all_scored: list[ScoredCandidate] = []
+    all_availability: list[AvailabilityResult] = []
+    persisted_ids: list[str] = []
+    progress = dict(state.get("progress", {}))
+    for key in ("generated", "filtered", "scored", "availability_checked", "persisted"):
+        progress[key] = 0
+
+    async def _generate() -> None:
+        with trace.stage("generate") as metrics:
+            stream = generation_provider.stream(
+                inputs, trends=state.get("trends", []), company_examples=state.get("company_examples", [])
+            )
+
+            async def _produce() -> None:
+                async with aclosing(stream):
+                    async for candidate in stream:
+                        if enough.is_set():
+                            break
+                        progress["generated"] += 1
+                        await generated.put(candidate)
+
+            await _with_budget(_produce(), settings.generation_time_budget_seconds)
+            metrics.items_out = progress["generated"]
+        await generated.put(_DONE)
+
+    async def _dedupe() -> None:
+        # Same rules as the dedupe node, applied as candidates arrive.
+        seen: set[str] = set()
+        with trace.stage("dedupe", items_in=0) as metrics:
+            while (candidate := await generated.get()) is not _DONE:
+                metrics.count_in(1)
+                if enough.is_set() or not accept_candidate(candidate, seen):
+                    continue
+                progress["filtered"] += 1
+                await filtered.put(candidate)
+                if progress["filtered"] >= inputs.count:
+                    enough.set()
+            metrics.items_out = progress["filtered"]
+        await filtered.put(_DONE)
+
+    async def _score() -> None:
+        with trace.stage("score", items_in=0) as metrics:
+
+            async def _worker() -> None:
+                async for batch in _batches(filtered, settings.streaming_score_batch_size, wait):
+                    metrics.count_in(len(batch))
+                    results = await _with_budget(
+                        scoring_provider.score(batch), settings.scoring_time_budget_seconds
+                    )
+                    progress["scored"] += len(results)
+                    for candidate in results:
+                        all_scored.append(candidate)
+                        await scored.put(candidate)
+
+            await _workers(settings.streaming_score_concurrency, _worker, scored)
+            metrics.items_out = progress["scored"]
+
+    async def _availability() -> None:
+        with trace.stage("availability", items_in=0) as metrics:
+
+            async def _worker() -> None:
+                while (candidate := await scored.get()) is not _DONE:
+                    metrics.count_in(1)
+                    try:
+                        results = await _with_budget(
+                            availability_provider.check([candidate]), settings.availability_time_budget_seconds
+                        )
+                    except Exception:  # noqa: BLE001
+                        results = []
+                    result = results[0] if results else AvailabilityResult(
+                        full_domain=candidate.full_domain, status="error"
+                    )
+                    metrics.errors += result.status == "error"
+                    progress["availability_checked"] += 1
+                    all_availability.append(result)
+                    await checked.put((candidate, result))
+                await scored.put(_DONE)
+
+            await _workers(settings.availability_concurrency_limit, _worker, checked)
+            metrics.items_out = progress["availability_checked"]
+
+    async def _persist() -> None:
+        with trace.stage("persist", items_in=0) as metrics:
+            async for batch in _batches(checked, settings.streaming_persist_batch_size, wait):
+                metrics.count_in(len(batch))
+                persisted_ids.extend(
+                    await persist_candidates(
+                        session,
+                        inputs,
+                        [candidate for candidate, _ in batch],
+                        [result for _, result in batch],
+                    )
+                )
+                await session.commit()
+                progress["persisted"] = len(persisted_ids)
+            await record_generation_run(
+                session,
+                inputs,
+                all_scored,
+                count=len(persisted_ids),
+                started_at=started_at,
+                trace_id=trace.trace_id,
+            )
+            await session.commit()
+            metrics.items_out = len(persisted_ids)
+
+    tasks = [
+        asyncio.ensure_future(stage())
+        for stage in (_generate, _dedupe, _score, _availability, _persist)
+    ]
+    try:
+        await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    return {
+        **state,
+        "candidates": [],
+        "filtered": [],
+        "scored": all_scored,
+        "availability": all_availability,
+        "persisted_domain_ids": persisted_ids,
+        "progress": progress,
+    }
+
+
+__all__ = ["run_streaming_pipeline"]
@@ -1,10 +1,14 @@
-"""Prompt assembly and parsing helpers for LiteLLM-backed providers."""
+"""Prompt assembly helpers for LiteLLM-backed providers.
+
+Response parsing lives in ``parsing``; its helpers are re-exported here.
+"""
 from __future__ import annotations
 
 import json
 from textwrap import dedent
-from typing import Any, Sequence
+from typing import Sequence
 
+from .parsing import extract_json_payload, parse_generation_payload, parse_scoring_payload
 from .state import Candidate, CompanyExample, GenerationInputs, Trend
 
 # TODO update the logic with old_code and our own logic to make this better
@@ -93,45 +97,6 @@ def build_scoring_messages(candidates: Sequence[Candidate]) -> list[dict[str, st
     ]
 
 
-def extract_json_payload(content: str) -> Any:
-    text = content.strip()
-    if text.startswith("```"):
-        lines = text.splitlines()
-        if len(lines) >= 2:
-            text = "\n".join(lines[1:-1]).strip()
-
-    try:
-        return json.loads(text)
-    except json.JSONDecodeError as exc:  # noqa: PERF203
-        raise ValueError("LLM response was not valid JSON") from exc
-
-
-def parse_generation_payload(payload: Any) -> Sequence[dict[str, str]]:
-    if isinstance(payload, dict) and isinstance(payload.get("items"), list):
-        payload = payload["items"]
-    if not isinstance(payload, list):
-        raise ValueError("Generation response must be a JSON array or an object with 'items' array")
-    results: list[dict[str, str]] = []
-    for item in payload:
-        if not isinstance(item, dict):
-            raise ValueError("Each generation item must be an object")
-        results.append(item)
-    return results
-
-
-def parse_scoring_payload(payload: Any) -> Sequence[dict[str, Any]]:
-    if isinstance(payload, dict) and isinstance(payload.get("items"), list):
-        payload = payload["items"]
-    if not isinstance(payload, list):
-        raise ValueError("Scoring response must be a JSON array or an object with 'items' array")
-    results: list[dict[str, Any]] = []
-    for item in payload:
-        if not isinstance(item, dict):
-            raise ValueError("Each scoring item must be an object")
-        results.append(item)
-    return results
-
-
 __all__ = [
     "build_generation_messages",
     "build_scoring_messages",
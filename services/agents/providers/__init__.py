@@ -1,22 +1,32 @@
 """Provider factories and exports."""
 from .base import AvailabilityProvider, GenerationProvider, ScoringProvider
+from .dns_prefilter import DnsPrefilterAvailabilityProvider
+from .hedged import HedgedAvailabilityProvider
 from .llm import (
     LLMGenerationProvider,
     LLMScoringProvider,
     StubAvailabilityProvider,
+    build_availability_provider,
     build_default_providers,
 )
+from .rdap import RdapAvailabilityProvider
 from .whoapi import WhoapiAvailabilityProvider
 from .whoisjson import WhoisJsonAvailabilityProvider
+from .zone_index import ZoneIndexAvailabilityProvider
 
 __all__ = [
     "AvailabilityProvider",
+    "DnsPrefilterAvailabilityProvider",
     "GenerationProvider",
+    "HedgedAvailabilityProvider",
     "LLMGenerationProvider",
     "LLMScoringProvider",
+    "RdapAvailabilityProvider",
     "ScoringProvider",
     "StubAvailabilityProvider",
+    "build_availability_provider",
     "build_default_providers",
     "WhoapiAvailabilityProvider",
     "WhoisJsonAvailabilityProvider",
+    "ZoneIndexAvailabilityProvider",
 ]
@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import abc
-from typing import Iterable, Sequence
+from typing import AsyncGenerator, Iterable, Sequence
 
 from ..state import AvailabilityResult, Candidate, CompanyExample, ScoredCandidate, Trend
 from ..state import GenerationInputs
@@ -19,6 +19,17 @@ class GenerationProvider(abc.ABC):
     ) -> Sequence[Candidate]:
         """Generate domain name candidates."""
 
+    async def stream(
+        self,
+        inputs: GenerationInputs,
+        *,
+        trends: Sequence[Trend],
+        company_examples: Sequence[CompanyExample],
+    ) -> AsyncGenerator[Candidate, None]:
+        """Yield candidates as they are produced; by default, all at once from ``generate``."""
+        for candidate in await self.generate(inputs, trends=trends, company_examples=company_examples):
+            yield candidate
+
 
 class ScoringProvider(abc.ABC):
     @abc.abstractmethod
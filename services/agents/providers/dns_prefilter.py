@@ -0,0 +1,104 @@
+"""DNS pre-filter that answers obviously registered domains before the registrar."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Iterable, Sequence
+
+import dns.asyncresolver
+import dns.exception
+import dns.resolver
+
+from services.api.metrics import observe_provider_request
+
+from ..settings import settings
+from ..state import AvailabilityResult, Candidate, ScoredCandidate
+from .base import AvailabilityProvider
+
+
+def build_resolver(
+    *,
+    nameservers: Sequence[str] | None = None,
+    port: int | None = None,
+    timeout: float | None = None,
+) -> dns.asyncresolver.Resolver:
+    """Async resolver using ``nameservers`` (default ``DNS_NAMESERVERS``, else the system's)."""
+    nameservers = list(nameservers if nameservers is not None else settings.dns_nameservers)
+    resolver = dns.asyncresolver.Resolver(configure=not nameservers)
+    if nameservers:
+        resolver.nameservers = nameservers
+    resolver.port = port or settings.dns_port
+    resolver.lifetime = timeout or settings.dns_timeout_seconds
+    resolver.timeout = resolver.lifetime
+    return resolver
+
+
+class DnsPrefilterAvailabilityProvider(AvailabilityProvider):
+    """Mark delegated domains registered from an NS lookup; check the rest with ``provider``.
+
+    A domain with NS records is registered, so it never reaches the paid
+    registrar. NXDOMAIN answers, empty answers and failed lookups are all
+    passed on, so the pre-filter can only save registrar calls, never
+    change an outcome the registrar would have given.
+    """
+
+    def __init__(
+        self,
+        provider: AvailabilityProvider,
+        *,
+        resolver: dns.asyncresolver.Resolver | None = None,
+        concurrency: int | None = None,
+    ) -> None:
+        self._provider = provider
+        self._resolver = resolver
+        self._concurrency = concurrency or settings.dns_prefilter_concurrency
+
+    async def _delegation(
+        self,
+        resolver: dns.asyncresolver.Resolver,
+        semaphore: asyncio.Semaphore,
+        candidate: Candidate | ScoredCandidate,
+    ) -> AvailabilityResult | None:
+        domain = candidate.full_domain
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                answer = await resolver.resolve(domain, "NS", raise_on_no_answer=False)
+            except dns.resolver.NXDOMAIN:
+                observe_provider_request("dns", started, "nxdomain")
+                return None
+            except dns.exception.DNSException:
+                observe_provider_request("dns", started, "error")
+                return None
+        if answer.rrset is None:
+            observe_provider_request("dns", started, "noanswer")
+            return None
+        observe_provider_request("dns", started, "delegated")
+        return AvailabilityResult(
+            full_domain=domain,
+            status="registered",
+            registrar="dns",
+            raw_payload={"nameservers": sorted(record.to_text() for record in answer.rrset)},
+        )
+
+    async def check(self, candidates: Iterable[Candidate | ScoredCandidate]) -> Sequence[AvailabilityResult]:
+        candidates = list(candidates)
+        if not candidates:
+            return []
+
+        if self._resolver is None:
+            self._resolver = build_resolver()
+        semaphore = asyncio.Semaphore(self._concurrency)
+        delegated = await asyncio.gather(
+            *(self._delegation(self._resolver, semaphore, candidate) for candidate in candidates)
+        )
+        results = {result.full_domain: result for result in delegated if result is not None}
+
+        pending = [candidate for candidate in candidates if candidate.full_domain not in results]
+        if pending:
+            for result in await self._provider.check(pending):
+                results[result.full_domain] = result
+        return [results[candidate.full_domain] for candidate in candidates if candidate.full_domain in results]
+
+
+__all__ = ["DnsPrefilterAvailabilityProvider", "build_resolver"]
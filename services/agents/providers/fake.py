@@ -0,0 +1,186 @@
+"""Deterministic fake providers for benchmarks and tests.
+
+Each provider draws latencies and failures from a seeded RNG so that a run is
+reproducible, and never touches the network.
+"""
+from __future__ import annotations
+
+import asyncio
+import math
+import random
+import string
+from dataclasses import dataclass
+from typing import Iterable, Sequence
+
+from ..state import (
+    AvailabilityResult,
+    Candidate,
+    CompanyExample,
+    GenerationInputs,
+    ScoredCandidate,
+    Trend,
+)
+from .base import AvailabilityProvider, GenerationProvider, ScoringProvider
+
+# 95th percentile of the standard normal distribution.
+_Z95 = 1.6448536269514722
+
+
+@dataclass(frozen=True)
+class LatencyProfile:
+    """Log-normal latency distribution described by its median and p95, in seconds."""
+
+    median: float = 0.0
+    p95: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        if self.median <= 0:
+            return 0.0
+        if self.p95 <= self.median:
+            return self.median
+        sigma = math.log(self.p95 / self.median) / _Z95
+        return rng.lognormvariate(math.log(self.median), sigma)
+
+
+class SimulatedProviderError(RuntimeError):
+    """Raised by fake providers to model an upstream failure."""
+
+
+async def _sleep(profile: LatencyProfile, rng: random.Random) -> None:
+    delay = profile.sample(rng)
+    if delay > 0:
+        await asyncio.sleep(delay)
+
+
+class FakeGenerationProvider(GenerationProvider):
+    """Return ``inputs.count * overgenerate`` random lowercase labels."""
+
+    def __init__(
+        self,
+        *,
+        latency: LatencyProfile = LatencyProfile(),
+        error_rate: float = 0.0,
+        overgenerate: float = 1.2,
+        label_length: tuple[int, int] = (5, 12),
+        reasoning_chars: int = 80,
+        seed: int = 0,
+    ) -> None:
+        self._latency = latency
+        self._error_rate = error_rate
+        self._overgenerate = overgenerate
+        self._label_length = label_length
+        self._reasoning = "x" * reasoning_chars
+        self._rng = random.Random(seed)
+
+    async def generate(
+        self,
+        inputs: GenerationInputs,
+        *,
+        trends: Sequence[Trend],
+        company_examples: Sequence[CompanyExample],
+    ) -> Sequence[Candidate]:
+        await _sleep(self._latency, self._rng)
+        if self._rng.random() < self._error_rate:
+            raise SimulatedProviderError("Simulated generation failure")
+        tlds = inputs.tlds or ["com"]
+        total = max(1, math.ceil(inputs.count * self._overgenerate))
+        candidates: list[Candidate] = []
+        for index in range(total):
+            length = self._rng.randint(*self._label_length)
+            label = "".join(self._rng.choices(string.ascii_lowercase, k=length))
+            candidates.append(
+                Candidate(label=label, tld=tlds[index % len(tlds)], reasoning=self._reasoning)
+            )
+        return candidates
+
+
+class FakeScoringProvider(ScoringProvider):
+    """Assign random rubric scores in a single simulated call."""
+
+    def __init__(
+        self,
+        *,
+        latency: LatencyProfile = LatencyProfile(),
+        error_rate: float = 0.0,
+        rationale_chars: int = 120,
+        seed: int = 0,
+    ) -> None:
+        self._latency = latency
+        self._error_rate = error_rate
+        self._rationale = "y" * rationale_chars
+        self._rng = random.Random(seed)
+
+    async def score(self, candidates: Sequence[Candidate]) -> Sequence[ScoredCandidate]:
+        if not candidates:
+            return []
+        await _sleep(self._latency, self._rng)
+        if self._rng.random() < self._error_rate:
+            raise SimulatedProviderError("Simulated scoring failure")
+        scored: list[ScoredCandidate] = []
+        for candidate in candidates:
+            memorability, pronounceability, brandability = (self._rng.randint(1, 10) for _ in range(3))
+            scored.append(
+                ScoredCandidate(
+                    label=candidate.label,
+                    tld=candidate.tld,
+                    display_name=candidate.display_name,
+                    memorability=memorability,
+                    pronounceability=pronounceability,
+                    brandability=brandability,
+                    overall=(memorability + pronounceability + brandability) // 3,
+                    rationale=self._rationale,
+                )
+            )
+        return scored
+
+
+class FakeAvailabilityProvider(AvailabilityProvider):
+    """Check domains concurrently with per-domain latency and error injection."""
+
+    def __init__(
+        self,
+        *,
+        latency: LatencyProfile = LatencyProfile(),
+        error_rate: float = 0.0,
+        available_ratio: float = 0.3,
+        concurrency: int = 5,
+        payload_bytes: int = 256,
+        seed: int = 0,
+    ) -> None:
+        self._latency = latency
+        self._error_rate = error_rate
+        self._available_ratio = available_ratio
+        self._concurrency = max(1, concurrency)
+        self._payload = "z" * payload_bytes
+        self._rng = random.Random(seed)
+
+    async def check(self, candidates: Iterable[Candidate | ScoredCandidate]) -> Sequence[AvailabilityResult]:
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def _check_one(candidate: Candidate | ScoredCandidate) -> AvailabilityResult:
+            async with semaphore:
+                await _sleep(self._latency, self._rng)
+            roll = self._rng.random()
+            if roll < self._error_rate:
+                status = "error"
+            elif roll < self._error_rate + self._available_ratio:
+                status = "available"
+            else:
+                status = "registered"
+            return AvailabilityResult(
+                full_domain=candidate.full_domain,
+                status=status,
+                registrar="fake",
+                raw_payload={"source": "fake", "blob": self._payload},
+            )
+
+        return list(await asyncio.gather(*(_check_one(candidate) for candidate in candidates)))
+
+
+__all__ = [
+    "FakeAvailabilityProvider",
+    "FakeGenerationProvider",
+    "FakeScoringProvider",
+    "LatencyProfile",
+    "SimulatedProviderError",
+]
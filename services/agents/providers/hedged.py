@@ -0,0 +1,162 @@
+"""Composite registrar provider with hedged requests and fallback."""
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from typing import Iterable, Sequence
+
+from services.api.metrics import AVAILABILITY_HEDGES
+
+from ..settings import settings
+from ..state import AvailabilityResult, Candidate, ScoredCandidate
+from .base import AvailabilityProvider
+
+_CONCLUSIVE = {"available", "registered"}
+# Weight of the newest sample in the latency and error EWMAs.
+_EWMA_ALPHA = 0.2
+# Recent latencies kept per provider, and how many are needed before the
+# hedge delay follows the observed percentile instead of the default.
+_LATENCY_WINDOW = 200
+_MIN_SAMPLES = 20
+
+
+class ProviderStats:
+    """Latency and error EWMAs plus a window of recent latencies for one provider."""
+
+    def __init__(self) -> None:
+        self.latency_ewma: float | None = None
+        self.error_ewma = 0.0
+        self._recent: deque[float] = deque(maxlen=_LATENCY_WINDOW)
+
+    def record(self, latency: float, *, ok: bool | None) -> None:
+        """Add a sample; ``ok=None`` (a request cancelled after losing a hedge) only counts its latency."""
+        if self.latency_ewma is None:
+            self.latency_ewma = latency
+        else:
+            self.latency_ewma = _EWMA_ALPHA * latency + (1 - _EWMA_ALPHA) * self.latency_ewma
+        if ok is not None:
+            self.error_ewma = _EWMA_ALPHA * (0.0 if ok else 1.0) + (1 - _EWMA_ALPHA) * self.error_ewma
+        self._recent.append(latency)
+
+    def percentile(self, fraction: float) -> float | None:
+        if len(self._recent) < _MIN_SAMPLES:
+            return None
+        ordered = sorted(self._recent)
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+    def cost(self, default_latency: float) -> float:
+        """Expected time to a usable answer: latency inflated by the error rate."""
+        latency = self.latency_ewma if self.latency_ewma is not None else default_latency
+        return latency / max(1.0 - self.error_ewma, 0.05)
+
+
+# Stats outlive provider instances (built per job) so ordering reflects
+# everything this process has seen.
+_STATS: dict[str, ProviderStats] = {}
+
+
+def provider_stats(name: str) -> ProviderStats:
+    return _STATS.setdefault(name, ProviderStats())
+
+
+class HedgedAvailabilityProvider(AvailabilityProvider):
+    """Check each domain with the best provider, hedging and falling back to the others.
+
+    Providers are tried in order of their observed cost (latency EWMA
+    inflated by error EWMA); the configured order breaks ties until stats
+    exist. If the current request has not answered within the provider's
+    ``hedge_percentile`` latency, the next provider is queried too, and
+    the first conclusive answer wins. An error or inconclusive answer
+    moves on to the next provider straight away; if none is conclusive,
+    an ``unknown`` answer is preferred over an error.
+    """
+
+    def __init__(
+        self,
+        providers: Sequence[tuple[str, AvailabilityProvider]],
+        *,
+        hedge_percentile: float | None = None,
+        hedge_delay_seconds: float | None = None,
+        concurrency: int | None = None,
+    ) -> None:
+        if not providers:
+            raise ValueError("At least one registrar provider is required")
+        self._providers = list(providers)
+        self._hedge_percentile = hedge_percentile or settings.availability_hedge_percentile
+        self._hedge_delay_seconds = hedge_delay_seconds or settings.availability_hedge_delay_seconds
+        self._concurrency = concurrency or settings.availability_concurrency_limit
+
+    def _ordered(self) -> list[tuple[str, AvailabilityProvider]]:
+        return sorted(self._providers, key=lambda entry: provider_stats(entry[0]).cost(self._hedge_delay_seconds))
+
+    def _hedge_delay(self, name: str) -> float:
+        observed = provider_stats(name).percentile(self._hedge_percentile)
+        return observed if observed is not None else self._hedge_delay_seconds
+
+    @staticmethod
+    async def _timed(
+        name: str, provider: AvailabilityProvider, candidate: Candidate | ScoredCandidate
+    ) -> AvailabilityResult:
+        started = time.perf_counter()
+        try:
+            results = await provider.check([candidate])
+        except asyncio.CancelledError:
+            # The elapsed time is a lower bound on this provider's latency.
+            provider_stats(name).record(time.perf_counter() - started, ok=None)
+            raise
+        except Exception:  # noqa: BLE001
+            results = []
+        result = results[0] if results else AvailabilityResult(
+            full_domain=candidate.full_domain, status="error", registrar=name
+        )
+        provider_stats(name).record(time.perf_counter() - started, ok=result.status != "error")
+        return result
+
+    async def _check_one(self, candidate: Candidate | ScoredCandidate) -> AvailabilityResult:
+        remaining = self._ordered()
+        pending: set[asyncio.Task] = set()
+        last_launched = ""
+        fallback: AvailabilityResult | None = None
+
+        def _launch() -> None:
+            nonlocal last_launched
+            last_launched, provider = remaining.pop(0)
+            pending.add(asyncio.ensure_future(self._timed(last_launched, provider, candidate)))
+
+        _launch()
+        try:
+            while pending:
+                timeout = self._hedge_delay(last_launched) if remaining else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    AVAILABILITY_HEDGES.labels(provider=remaining[0][0], reason="slow").inc()
+                    _launch()
+                    continue
+                for task in done:
+                    pending.discard(task)
+                    result = task.result()
+                    if result.status in _CONCLUSIVE:
+                        return result
+                    if fallback is None or fallback.status == "error":
+                        fallback = result
+                if remaining:
+                    AVAILABILITY_HEDGES.labels(provider=remaining[0][0], reason="failed").inc()
+                    _launch()
+        finally:
+            for task in pending:
+                task.cancel()
+        assert fallback is not None
+        return fallback
+
+    async def check(self, candidates: Iterable[Candidate | ScoredCandidate]) -> Sequence[AvailabilityResult]:
+        semaphore = asyncio.Semaphore(self._concurrency)
+
+        async def _bounded(candidate: Candidate | ScoredCandidate) -> AvailabilityResult:
+            async with semaphore:
+                return await self._check_one(candidate)
+
+        return await asyncio.gather(*(_bounded(candidate) for candidate in candidates))
+
+
+__all__ = ["HedgedAvailabilityProvider", "ProviderStats", "provider_stats"]
@@ -1,24 +1,25 @@
 """LLM-backed providers for generation, scoring, and availability."""
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import random
+import time
+from contextlib import aclosing
 from dataclasses import dataclass
-from typing import Any, Callable, Iterable, Sequence
+from typing import Any, AsyncGenerator, Callable, Iterable, Sequence
 
-from litellm import acompletion
-from pydantic import BaseModel, TypeAdapter
+import httpx
+import orjson
+from litellm import acompletion, completion_cost, stream_chunk_builder
+from pydantic import BaseModel
 
-from ..prompts import (
-    build_generation_messages,
-    build_scoring_messages,
-    extract_json_payload,
-    parse_generation_payload,
-    parse_scoring_payload,
-)
+from ..instrumentation import record_llm_usage
+from ..parsing import JsonItemStream, extract_usage, parse_candidates, parse_scored_candidates
+from ..prompts import build_generation_messages, build_scoring_messages
 from ..settings import settings
 from packages.shared_py.namesmith_schemas.registrars import DomainAvailabilityProvider
+from services.api.metrics import observe_llm_request
 
 from ..state import (
     AvailabilityResult,
@@ -29,6 +30,7 @@ from ..state import (
     Trend,
 )
 from .base import AvailabilityProvider, GenerationProvider, ScoringProvider
+from .routing import is_retryable, record_attempt, route_completion, route_models
 
 
 class CandidateList(BaseModel):
@@ -39,8 +41,89 @@ class ScoredCandidateList(BaseModel):
     items: list[ScoredCandidate]
 
 
+async def _complete(kind: str, *, model: str, **kwargs: Any) -> Any:
+    """Call ``acompletion`` and record its latency and token usage."""
+    started = time.perf_counter()
+    try:
+        response = await acompletion(model=model, **kwargs)
+    except Exception:
+        observe_llm_request(model, kind, started, None)
+        raise
+    cost_usd = _completion_cost(response)
+    observe_llm_request(model, kind, started, extract_usage(response), cost_usd=cost_usd)
+    record_llm_usage(model, response, cost_usd=cost_usd)
+    return response
+
+
+async def _stream_complete(kind: str, *, model: str, **kwargs: Any) -> AsyncGenerator[str, None]:
+    """Stream ``acompletion`` text deltas; latency and usage are recorded when the stream ends.
+
+    A consumer that stops early still gets the call recorded, from the chunks
+    received so far: the tokens were billed all the same.
+    """
+    started = time.perf_counter()
+    chunks: list[Any] = []
+    stream: Any = None
+    failed = False
+    try:
+        stream = await acompletion(model=model, stream=True, stream_options={"include_usage": True}, **kwargs)
+        async for chunk in stream:
+            chunks.append(chunk)
+            text = _delta_content(chunk)
+            if text:
+                yield text
+    except Exception:
+        failed = True
+        observe_llm_request(model, kind, started, None)
+        raise
+    finally:
+        if stream is not None and hasattr(stream, "aclose"):
+            await stream.aclose()
+        if not failed:
+            response = _rebuild_stream(chunks, kwargs.get("messages"))
+            cost_usd = _completion_cost(response)
+            observe_llm_request(model, kind, started, extract_usage(response), cost_usd=cost_usd)
+            record_llm_usage(model, response, cost_usd=cost_usd)
+
+
+def _delta_content(chunk: Any) -> str:
+    choices = chunk.get("choices") if isinstance(chunk, dict) else getattr(chunk, "choices", None)
+    if not choices:
+        return ""
+    delta = choices[0].get("delta") if isinstance(choices[0], dict) else getattr(choices[0], "delta", None)
+    content = delta.get("content") if isinstance(delta, dict) else getattr(delta, "content", None)
+    return content or ""
+
+
+def _rebuild_stream(chunks: list[Any], messages: Any = None) -> Any:
+    """Full response for a stream, so usage and cost read as for ``_complete``.
+
+    Without a final usage chunk (the stream was closed early), LiteLLM
+    estimates usage from ``messages`` and the text received.
+    """
+    try:
+        return stream_chunk_builder(chunks, messages=messages)
+    except Exception:  # noqa: BLE001
+        # The final chunk carries usage when the provider honours include_usage.
+        logger.debug("Could not rebuild streamed LLM response", exc_info=True)
+        return chunks[-1] if chunks else {}
+
+
+def _completion_cost(response: Any) -> float:
+    # LiteLLM raises for models missing from its price map (e.g. self-hosted ones).
+    try:
+        return float(completion_cost(completion_response=response) or 0.0)
+    except Exception:  # noqa: BLE001
+        logger.debug("No price available for LLM response", exc_info=True)
+        return 0.0
+
+
 class LLMGenerationProvider(GenerationProvider):
-    """Delegate generation to an injected LLM callable."""
+    """Delegate generation to an injected LLM callable.
+
+    Calls are routed over ``model_allowlist`` (see ``routing``): a slow or
+    failing ``model_name`` is hedged or replaced by another allowed model.
+    """
 
     def __init__(
         self,
@@ -61,26 +144,92 @@ class LLMGenerationProvider(GenerationProvider):
         company_examples: Sequence[CompanyExample],
     ) -> Sequence[Candidate]:
         messages = build_generation_messages(inputs, trends, company_examples)
-        response = await acompletion(
-            model=self._model_name,
+        model, response = await route_completion(
+            "generation",
+            lambda model: _complete(
+                "generation",
+                model=model,
+                messages=messages,
+                temperature=self._temperature,
+                # Hint to supported providers to produce a JSON object with 'items'
+                response_format=CandidateList,
+                **self._completion_kwargs,
+            ),
+            models=route_models(self._model_name, settings.model_allowlist),
+        )
+        _log_llm_response("generation", response)
+        candidates = parse_candidates(_extract_message_content(response))
+        for candidate in candidates:
+            candidate.generation_model = model
+        return candidates
+
+    async def stream(
+        self,
+        inputs: GenerationInputs,
+        *,
+        trends: Sequence[Trend],
+        company_examples: Sequence[CompanyExample],
+    ) -> AsyncGenerator[Candidate, None]:
+        """Yield each candidate as soon as its object closes in the streamed completion.
+
+        Each model must produce its first candidate within the per-attempt
+        deadline. A retryable failure moves on to the next routed model, but
+        only before the first candidate has been yielded; streams are not
+        hedged. Attempts feed the same health stats as routed calls.
+        """
+        messages = build_generation_messages(inputs, trends, company_examples)
+        models = route_models(self._model_name, settings.model_allowlist)
+        for attempt, model in enumerate(models):
+            started = time.perf_counter()
+            yielded = 0
+            try:
+                async with aclosing(self._stream_candidates(model, messages)) as candidates:
+                    while True:
+                        pending = anext(candidates)
+                        try:
+                            candidate = await (
+                                pending
+                                if yielded
+                                else asyncio.wait_for(pending, timeout=settings.llm_attempt_timeout_seconds)
+                            )
+                        except StopAsyncIteration:
+                            break
+                        yield candidate
+                        yielded += 1
+            except GeneratorExit:
+                # The consumer has all the candidates it wants.
+                record_attempt(model, started)
+                raise
+            except Exception as exc:
+                record_attempt(model, started, exc)
+                if yielded or attempt == len(models) - 1 or not is_retryable(exc):
+                    raise
+                logger.warning("Streaming generation with %s failed; trying %s", model, models[attempt + 1])
+                continue
+            record_attempt(model, started)
+            return
+
+    async def _stream_candidates(
+        self, model: str, messages: list[dict[str, str]]
+    ) -> AsyncGenerator[Candidate, None]:
+        parser = JsonItemStream()
+        texts = _stream_complete(
+            "generation",
+            model=model,
             messages=messages,
             temperature=self._temperature,
-            # Hint to supported providers to produce a JSON object with 'items'
             response_format=CandidateList,
             **self._completion_kwargs,
         )
-        logger.info("LLM response (generation): %s", _format_llm_response(response))
-        content = _extract_message_content(response)
-        payload = extract_json_payload(content)
-        # Accept either {items: [...]} or raw list for backward compatibility
-        if isinstance(payload, dict) and "items" in payload:
-            try:
-                parsed = CandidateList.model_validate(payload)
-                return list(TypeAdapter(list[Candidate]).validate_python(parsed.items))
-            except Exception:
-                pass
-        raw_candidates = parse_generation_payload(payload)
-        return list(TypeAdapter(list[Candidate]).validate_python(raw_candidates))
+        # Closed with this generator, so usage is recorded when the consumer stops early.
+        async with aclosing(texts):
+            async for text in texts:
+                for item in parser.feed(text):
+                    candidate = Candidate.model_validate(item)
+                    candidate.generation_model = model
+                    yield candidate
+        if not parser.started:
+            raise ValueError("Generation response must be a JSON array or an object with 'items' array")
 
 
 class LLMScoringProvider(ScoringProvider):
@@ -100,39 +249,25 @@ class LLMScoringProvider(ScoringProvider):
         if not candidates:
             return []
         messages = build_scoring_messages(candidates)
-        response = await acompletion(
-            model=self._model_name,
-            messages=messages,
-            temperature=self._temperature,
-            response_format=ScoredCandidateList,
-            **self._completion_kwargs,
+        model, response = await route_completion(
+            "scoring",
+            lambda model: _complete(
+                "scoring",
+                model=model,
+                messages=messages,
+                temperature=self._temperature,
+                response_format=ScoredCandidateList,
+                **self._completion_kwargs,
+            ),
+            models=route_models(self._model_name, settings.model_allowlist),
         )
-        logger.info("LLM response (scoring): %s", _format_llm_response(response))
-        content = _extract_message_content(response)
-        payload = extract_json_payload(content)
-        raw_scores = parse_scoring_payload(payload)
-        adjusted: list[dict[str, Any]] = []
-        weights = settings.scoring_rubric_weights or {}
-        total_weight = sum(weights.values())
-        for item in raw_scores:
-            if item.get("overall") is None:
-                m = item.get("memorability")
-                p = item.get("pronounceability")
-                b = item.get("brandability")
-                try:
-                    m_f, p_f, b_f = int(m), int(p), int(b)
-                except Exception:
-                    m_f, p_f, b_f = 10, 10, 10
-                item["overall"] = int((m_f + p_f + b_f) / 3)
-            adjusted.append(item)
-        # Try strict schema first if provider returned object
-        if isinstance(payload, dict) and "items" in payload:
-            try:
-                parsed = ScoredCandidateList.model_validate({"items": adjusted})
-                return list(TypeAdapter(list[ScoredCandidate]).validate_python(parsed.items))
-            except Exception:
-                pass
-        return list(TypeAdapter(list[ScoredCandidate]).validate_python(adjusted))
+        _log_llm_response("scoring", response)
+        generated_by = {candidate.full_domain: candidate.generation_model for candidate in candidates}
+        scored = parse_scored_candidates(_extract_message_content(response))
+        for candidate in scored:
+            candidate.generation_model = generated_by.get(candidate.full_domain)
+            candidate.scoring_model = model
+        return scored
 
 
 class StubAvailabilityProvider(AvailabilityProvider):
@@ -167,11 +302,13 @@ class StubAvailabilityProvider(AvailabilityProvider):
 @dataclass(frozen=True)
 class AvailabilityProviderRegistration:
     requires_api_key: bool
-    factory: Callable[[str], AvailabilityProvider]
+    # Called with the API key and an optional shared HTTP client.
+    factory: Callable[[str, httpx.AsyncClient | None], AvailabilityProvider]
     missing_key_error: str | None = None
 
 
 def _create_availability_provider_registry() -> dict[DomainAvailabilityProvider, AvailabilityProviderRegistration]:
+    from .rdap import RdapAvailabilityProvider
     from .whoapi import WhoapiAvailabilityProvider
     from .whoisjson import WhoisJsonAvailabilityProvider
 
@@ -181,32 +318,32 @@ def _create_availability_provider_registry() -> dict[DomainAvailabilityProvider,
     return {
         DomainAvailabilityProvider.STUB: AvailabilityProviderRegistration(
             requires_api_key=False,
-            factory=lambda api_key: StubAvailabilityProvider(api_key=api_key, timeout=timeout),
+            factory=lambda api_key, client: StubAvailabilityProvider(api_key=api_key, timeout=timeout),
         ),
         DomainAvailabilityProvider.WHOAPI: AvailabilityProviderRegistration(
             requires_api_key=True,
-            factory=lambda api_key: WhoapiAvailabilityProvider(api_key=api_key, timeout=timeout),
+            factory=lambda api_key, client: WhoapiAvailabilityProvider(api_key=api_key, timeout=timeout, client=client),
             missing_key_error="WhoAPI API key must be configured to use 'whoapi' registrar provider.",
         ),
         DomainAvailabilityProvider.WHOISJSONAPI: AvailabilityProviderRegistration(
             requires_api_key=True,
-            factory=lambda api_key: WhoisJsonAvailabilityProvider(api_key=api_key, timeout=timeout),
+            factory=lambda api_key, client: WhoisJsonAvailabilityProvider(
+                api_key=api_key, timeout=timeout, client=client
+            ),
             missing_key_error="WhoisJSON API key must be configured to use 'whoisjson' registrar provider.",
         ),
+        DomainAvailabilityProvider.RDAP: AvailabilityProviderRegistration(
+            requires_api_key=False,
+            factory=lambda api_key, client: RdapAvailabilityProvider(timeout=timeout, client=client),
+        ),
     }
 
 
 _AVAILABILITY_PROVIDER_REGISTRY = _create_availability_provider_registry()
 
 
-def build_default_providers(
-    *,
-    generation_model: str | None = None,
-    scoring_model: str | None = None,
-) -> tuple[GenerationProvider, ScoringProvider, AvailabilityProvider]:
-    generation = LLMGenerationProvider(model_name=generation_model or settings.generation_model)
-    scoring = LLMScoringProvider(model_name=scoring_model or settings.scoring_model)
-
+def build_availability_provider(*, http_client: httpx.AsyncClient | None = None) -> AvailabilityProvider:
+    """Registrar provider selected by ``REGISTRAR_PROVIDER``."""
     provider_setting = settings.registrar_provider
     if provider_setting is None:
         raise ValueError("Registrar provider must be configured; stub provider is reserved for tests.")
@@ -220,6 +357,30 @@ def build_default_providers(
         except ValueError as exc:
             raise ValueError(f"Unsupported registrar provider '{provider_setting}'") from exc
 
+    provider = _build_registrar(provider_setting, http_client)
+    if provider_setting is DomainAvailabilityProvider.STUB:
+        return provider
+
+    fallbacks = [
+        fallback
+        for fallback in dict.fromkeys(map(DomainAvailabilityProvider.from_str, settings.registrar_fallback_providers))
+        if fallback is not provider_setting
+    ]
+    if fallbacks:
+        from .hedged import HedgedAvailabilityProvider
+
+        provider = HedgedAvailabilityProvider(
+            [
+                (provider_setting.value, provider),
+                *((fallback.value, _build_registrar(fallback, http_client)) for fallback in fallbacks),
+            ]
+        )
+    return _with_local_checks(provider)
+
+
+def _build_registrar(
+    provider_setting: DomainAvailabilityProvider, http_client: httpx.AsyncClient | None
+) -> AvailabilityProvider:
     registration = _AVAILABILITY_PROVIDER_REGISTRY.get(provider_setting)
     if registration is None:
         raise ValueError(f"Unsupported registrar provider '{provider_setting}'")
@@ -231,8 +392,30 @@ def build_default_providers(
         )
         raise ValueError(message)
 
-    availability = registration.factory(api_key or "mock-api-key")
+    return registration.factory(api_key or "mock-api-key", http_client)
+
+
+def _with_local_checks(provider: AvailabilityProvider) -> AvailabilityProvider:
+    """Put the zone index, then the DNS pre-filter, in front of a registrar provider."""
+    from .dns_prefilter import DnsPrefilterAvailabilityProvider
+    from .zone_index import ZoneIndexAvailabilityProvider
+
+    if settings.dns_prefilter_enabled:
+        provider = DnsPrefilterAvailabilityProvider(provider)
+    if settings.zone_index_dir:
+        provider = ZoneIndexAvailabilityProvider(provider, index_dir=settings.zone_index_dir)
+    return provider
 
+
+def build_default_providers(
+    *,
+    generation_model: str | None = None,
+    scoring_model: str | None = None,
+    http_client: httpx.AsyncClient | None = None,
+) -> tuple[GenerationProvider, ScoringProvider, AvailabilityProvider]:
+    generation = LLMGenerationProvider(model_name=generation_model or settings.generation_model)
+    scoring = LLMScoringProvider(model_name=scoring_model or settings.scoring_model)
+    availability = build_availability_provider(http_client=http_client)
     return generation, scoring, availability
 
 
@@ -256,15 +439,37 @@ def _format_llm_response(response: Any) -> str:
             pass
     if hasattr(response, "model_dump"):
         try:
-            return json.dumps(response.model_dump(), ensure_ascii=False)
+            return orjson.dumps(response.model_dump()).decode("utf-8")
         except Exception:
             pass
     try:
-        return json.dumps(response, ensure_ascii=False)
+        return orjson.dumps(response).decode("utf-8")
     except TypeError:
         return repr(response)
 
 
+class _LazyLLMResponse:
+    """Defer formatting a response until a handler actually emits the record."""
+
+    __slots__ = ("_response",)
+
+    def __init__(self, response: Any) -> None:
+        self._response = response
+
+    def __str__(self) -> str:
+        return _format_llm_response(self._response)
+
+
+def _log_llm_response(kind: str, response: Any) -> None:
+    """Log full responses at DEBUG, or a sampled fraction of them at INFO."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("LLM response (%s): %s", kind, _LazyLLMResponse(response))
+        return
+    sample_rate = settings.llm_response_log_sample_rate
+    if sample_rate > 0 and logger.isEnabledFor(logging.INFO) and random.random() < sample_rate:
+        logger.info("LLM response (%s, sampled): %s", kind, _LazyLLMResponse(response))
+
+
 logger = logging.getLogger(__name__)
 
 
@@ -272,5 +477,6 @@ __all__ = [
     "LLMGenerationProvider",
     "LLMScoringProvider",
     "StubAvailabilityProvider",
+    "build_availability_provider",
     "build_default_providers",
 ]
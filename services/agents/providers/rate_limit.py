@@ -0,0 +1,25 @@
+"""Rate limiting shared by registrar providers."""
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class RateLimiter:
+    """Spaces call starts at least ``1 / rate_per_second`` apart."""
+
+    def __init__(self, rate_per_second: float) -> None:
+        self._interval = 1.0 / rate_per_second
+        self._next_slot = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_slot - now
+            self._next_slot = max(now, self._next_slot) + self._interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+__all__ = ["RateLimiter"]
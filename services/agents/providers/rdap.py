@@ -0,0 +1,197 @@
+"""Registrar provider querying registry RDAP servers directly."""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import time
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Iterable, Sequence
+from urllib.parse import urlsplit
+
+import httpx
+import orjson
+
+from services.api.metrics import observe_provider_request
+
+from ..settings import settings
+from ..state import AvailabilityResult, Candidate, ScoredCandidate
+from .base import AvailabilityProvider
+from .rate_limit import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Parsed bootstrap registries by cache path: (expires at, TLD -> base URLs).
+# Shared by provider instances so each process reads the file once per refresh.
+_BOOTSTRAP_CACHE: dict[str, tuple[float, dict[str, list[str]]]] = {}
+# How soon a failed refresh is retried, whether it fell back to a stale file
+# or had nothing at all.
+_RETRY_AFTER_FAILURE_SECONDS = 60.0
+
+
+def parse_bootstrap(document: dict) -> dict[str, list[str]]:
+    """Map each TLD in an IANA DNS bootstrap document to its RDAP base URLs.
+
+    HTTPS URLs are listed first.
+    """
+    services: dict[str, list[str]] = {}
+    for entry in document.get("services", []):
+        if len(entry) < 2:
+            continue
+        tlds, urls = entry[0], entry[1]
+        ordered = sorted(urls, key=lambda url: not url.startswith("https://"))
+        for tld in tlds:
+            services[tld.lower()] = [url.rstrip("/") + "/" for url in ordered]
+    return services
+
+
+class RdapBootstrap:
+    """IANA RDAP bootstrap registry, cached on disk and refreshed periodically.
+
+    A fetch failure falls back to the cached file however old it is; without
+    one, every TLD is treated as unsupported. Either way the fetch is
+    retried a minute later rather than after a full refresh period.
+    """
+
+    def __init__(self, *, url: str, cache_path: str | os.PathLike, refresh_seconds: float) -> None:
+        self._url = url
+        self._path = Path(cache_path)
+        self._refresh_seconds = refresh_seconds
+        self._lock = asyncio.Lock()
+
+    async def base_urls(self, tld: str, client: httpx.AsyncClient) -> list[str]:
+        services = await self._services(client)
+        return services.get(tld.lower().rsplit(".", 1)[-1], [])
+
+    async def _services(self, client: httpx.AsyncClient) -> dict[str, list[str]]:
+        cached = _BOOTSTRAP_CACHE.get(str(self._path))
+        if cached is not None and time.time() < cached[0]:
+            return cached[1]
+        async with self._lock:
+            cached = _BOOTSTRAP_CACHE.get(str(self._path))
+            if cached is not None and time.time() < cached[0]:
+                return cached[1]
+            document, fresh = await self._document(client)
+            services = parse_bootstrap(document)
+            ttl = self._refresh_seconds if fresh and services else _RETRY_AFTER_FAILURE_SECONDS
+            _BOOTSTRAP_CACHE[str(self._path)] = (time.time() + ttl, services)
+            return services
+
+    async def _document(self, client: httpx.AsyncClient) -> tuple[dict, bool]:
+        """The bootstrap document, and whether it is within its refresh period."""
+        file_age = time.time() - self._path.stat().st_mtime if self._path.exists() else None
+        if file_age is not None and file_age < self._refresh_seconds:
+            return orjson.loads(await asyncio.to_thread(self._path.read_bytes)), True
+        try:
+            response = await client.get(self._url, timeout=settings.dns_timeout_seconds)
+            response.raise_for_status()
+            document = orjson.loads(response.content)
+        except (httpx.HTTPError, orjson.JSONDecodeError):
+            logger.warning("Could not refresh RDAP bootstrap from %s", self._url, exc_info=True)
+            if file_age is None:
+                return {}, False
+            return orjson.loads(await asyncio.to_thread(self._path.read_bytes)), False
+        await asyncio.to_thread(self._write, response.content)
+        return document, True
+
+    def _write(self, content: bytes) -> None:
+        # Write then rename so concurrent readers never see a partial file.
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self._path.with_name(f"{self._path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(content)
+        os.replace(tmp_path, self._path)
+
+
+class RdapAvailabilityProvider(AvailabilityProvider):
+    """Look domains up on their registry's RDAP server: 404 is available, 200 registered.
+
+    TLDs without an RDAP server in the bootstrap registry come back as
+    ``unknown``. Requests to each registry host are limited to
+    ``max_connections_per_host`` in flight and ``requests_per_second_per_host``.
+    """
+
+    def __init__(
+        self,
+        *,
+        timeout: float | None = None,
+        client: httpx.AsyncClient | None = None,
+        bootstrap: RdapBootstrap | None = None,
+        max_connections_per_host: int | None = None,
+        requests_per_second_per_host: float | None = None,
+    ) -> None:
+        self._timeout = timeout or settings.dns_timeout_seconds
+        self._client = client
+        self._bootstrap = bootstrap or RdapBootstrap(
+            url=settings.rdap_bootstrap_url,
+            cache_path=settings.rdap_bootstrap_cache_path,
+            refresh_seconds=settings.rdap_bootstrap_refresh_seconds,
+        )
+        self._max_connections_per_host = max_connections_per_host or settings.rdap_max_connections_per_host
+        self._requests_per_second_per_host = (
+            requests_per_second_per_host or settings.rdap_requests_per_second_per_host
+        )
+        self._hosts: dict[str, tuple[asyncio.Semaphore, RateLimiter]] = {}
+
+    def _host_limits(self, base_url: str) -> tuple[asyncio.Semaphore, RateLimiter]:
+        host = urlsplit(base_url).netloc
+        if host not in self._hosts:
+            self._hosts[host] = (
+                asyncio.Semaphore(self._max_connections_per_host),
+                RateLimiter(self._requests_per_second_per_host),
+            )
+        return self._hosts[host]
+
+    async def check(self, candidates: Iterable[Candidate | ScoredCandidate]) -> Sequence[AvailabilityResult]:
+        candidates = list(candidates)
+        if not candidates:
+            return []
+
+        # Per-host concurrency is bounded by the host semaphores, not the pool.
+        client_context = nullcontext(self._client) if self._client is not None else httpx.AsyncClient()
+        async with client_context as client:
+            return await asyncio.gather(*(self._check_one(client, candidate) for candidate in candidates))
+
+    async def _check_one(self, client: httpx.AsyncClient, candidate: Candidate | ScoredCandidate) -> AvailabilityResult:
+        domain = candidate.full_domain
+        base_urls = await self._bootstrap.base_urls(candidate.tld, client)
+        if not base_urls:
+            return AvailabilityResult(
+                full_domain=domain,
+                status="unknown",
+                registrar="rdap",
+                raw_payload={"error": f"no RDAP server for .{candidate.tld}"},
+            )
+
+        semaphore, rate_limiter = self._host_limits(base_urls[0])
+        status = "error"
+        raw_payload: dict | None = None
+        response: httpx.Response | None = None
+        async with semaphore:
+            await rate_limiter.wait()
+            started = time.perf_counter()
+            try:
+                response = await client.get(
+                    f"{base_urls[0]}domain/{domain}",
+                    headers={"Accept": "application/rdap+json"},
+                    timeout=self._timeout,
+                )
+            except httpx.HTTPError:
+                status = "error"
+            else:
+                if response.status_code == 404:
+                    status = "available"
+                    raw_payload = {"http_status": 404}
+                elif response.status_code == 200:
+                    status = "registered"
+                    try:
+                        raw_payload = response.json()
+                    except ValueError:
+                        raw_payload = {"http_status": 200}
+                else:
+                    raw_payload = {"http_status": response.status_code}
+            observe_provider_request("rdap", started, response.status_code if response is not None else "error")
+        return AvailabilityResult(full_domain=domain, status=status, registrar="rdap", raw_payload=raw_payload)
+
+
+__all__ = ["RdapAvailabilityProvider", "RdapBootstrap", "parse_bootstrap"]
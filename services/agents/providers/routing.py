@@ -0,0 +1,150 @@
+"""Routing LLM completions across the model allowlist.
+
+Each attempt has its own deadline. A slow attempt is hedged with the next
+model once it runs past that model's latency percentile, and rate limits,
+server errors and timeouts fall back to the next model at once. Per-model
+latency and error rates are tracked for the whole process and a
+rate-limited model is skipped for a cool-down period.
+"""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Sequence
+
+from services.api.metrics import LLM_HEDGES
+
+from ..settings import settings
+from .hedged import ProviderStats
+
+# A model whose error EWMA reaches this is tried after the healthy ones.
+_UNHEALTHY_ERROR_RATE = 0.5
+
+_MODEL_STATS: dict[str, ProviderStats] = {}
+_COOLDOWN_UNTIL: dict[str, float] = {}
+
+
+def model_stats(model: str) -> ProviderStats:
+    return _MODEL_STATS.setdefault(model, ProviderStats())
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Timeouts, rate limits and server-side failures; another model may succeed."""
+    if isinstance(exc, asyncio.TimeoutError):
+        return True
+    status = getattr(exc, "status_code", None)
+    return isinstance(status, int) and (status in {408, 429} or status >= 500)
+
+
+def _healthy(model: str) -> bool:
+    return (
+        _COOLDOWN_UNTIL.get(model, 0.0) <= time.monotonic()
+        and model_stats(model).error_ewma < _UNHEALTHY_ERROR_RATE
+    )
+
+
+def route_models(primary: str, allowlist: Sequence[str]) -> list[str]:
+    """``primary`` followed by the other allowlisted models, cheapest first.
+
+    The requested model stays first while it is healthy. An alternate
+    answers when the primary fails or, with hedging on, when a hedged
+    request to it finishes before a slow primary.
+    """
+    default_latency = settings.llm_hedge_delay_seconds
+    alternates = sorted(
+        (model for model in dict.fromkeys(allowlist) if model != primary),
+        key=lambda model: model_stats(model).cost(default_latency),
+    )
+    return sorted([primary, *alternates], key=lambda model: not _healthy(model))
+
+
+def record_attempt(model: str, started: float, exc: BaseException | None = None) -> None:
+    """Record the outcome of one call to ``model`` that began at ``started``.
+
+    Only retryable errors count against the model's health, and a 429 also
+    starts its cool-down. A cancelled attempt (one that lost a hedge) only
+    adds its latency.
+    """
+    stats = model_stats(model)
+    latency = time.perf_counter() - started
+    if exc is None:
+        stats.record(latency, ok=True)
+    elif isinstance(exc, asyncio.CancelledError):
+        stats.record(latency, ok=None)
+    elif is_retryable(exc):
+        stats.record(latency, ok=False)
+        if getattr(exc, "status_code", None) == 429:
+            _COOLDOWN_UNTIL[model] = time.monotonic() + settings.llm_rate_limit_cooldown_seconds
+
+
+async def _attempt(model: str, call: Callable[[str], Awaitable[Any]], timeout: float | None) -> Any:
+    started = time.perf_counter()
+    try:
+        response = await asyncio.wait_for(call(model), timeout=timeout)
+    except BaseException as exc:
+        record_attempt(model, started, exc)
+        raise
+    record_attempt(model, started)
+    return response
+
+
+async def route_completion(
+    kind: str,
+    call: Callable[[str], Awaitable[Any]],
+    *,
+    models: Sequence[str],
+    attempt_timeout_seconds: float | None = None,
+    hedge: bool | None = None,
+) -> tuple[str, Any]:
+    """Return the first successful ``call(model)`` over ``models`` with the model that answered.
+
+    Slow attempts are hedged and failed ones fall back to the next model.
+
+    A non-retryable error (bad request, auth failure) is raised straight
+    away unless another attempt is still running, since a hedged model may
+    reject a request the primary accepts. If every model fails, the last
+    error is raised.
+    """
+    remaining = list(models)
+    timeout = attempt_timeout_seconds or settings.llm_attempt_timeout_seconds
+    hedge = settings.llm_hedging_enabled if hedge is None else hedge
+    pending: dict[asyncio.Task, str] = {}
+    last_launched = ""
+    last_error: BaseException | None = None
+
+    def _launch() -> None:
+        nonlocal last_launched
+        last_launched = remaining.pop(0)
+        pending[asyncio.ensure_future(_attempt(last_launched, call, timeout))] = last_launched
+
+    _launch()
+    try:
+        while pending:
+            hedge_after = None
+            if hedge and remaining:
+                observed = model_stats(last_launched).percentile(settings.llm_hedge_percentile)
+                hedge_after = observed if observed is not None else settings.llm_hedge_delay_seconds
+            done, _ = await asyncio.wait(pending, timeout=hedge_after, return_when=asyncio.FIRST_COMPLETED)
+            if not done:
+                LLM_HEDGES.labels(model=remaining[0], kind=kind, reason="slow").inc()
+                _launch()
+                continue
+            for task in done:
+                model = pending.pop(task)
+                exc = task.exception()
+                if exc is None:
+                    return model, task.result()
+                if not is_retryable(exc) and not pending:
+                    raise exc
+                last_error = exc
+            if remaining and not pending:
+                LLM_HEDGES.labels(model=remaining[0], kind=kind, reason="failed").inc()
+                _launch()
+    finally:
+        for task in pending:
+            task.cancel()
+    assert last_error is not None
+    raise last_error
+
+
+__all__ = ["is_retryable", "model_stats", "record_attempt", "route_completion", "route_models"]
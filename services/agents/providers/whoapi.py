@@ -1,10 +1,14 @@
 """Registrar provider implementation using WhoAPI."""
 from __future__ import annotations
 
+import time
+from contextlib import nullcontext
 from typing import Iterable, Sequence
 
 import httpx
 
+from services.api.metrics import observe_provider_request
+
 from ..settings import settings
 from ..state import AvailabilityResult, Candidate, ScoredCandidate
 from .base import AvailabilityProvider
@@ -22,18 +26,23 @@ class WhoapiAvailabilityProvider(AvailabilityProvider):
         base_url: str = "https://api.whoapi.com",
         request_type: str = "taken",
         timeout: float | None = None,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         self._api_key = api_key
         self._request_type = request_type
         self._base_url = base_url.rstrip("/") + "/"
         self._timeout = timeout or settings.dns_timeout_seconds
+        # A caller-owned client is reused across checks (e.g. for a whole job
+        # batch) so connections stay warm; otherwise each check opens its own.
+        self._client = client
 
     async def check(self, candidates: Iterable[Candidate | ScoredCandidate]) -> Sequence[AvailabilityResult]:
         results: list[AvailabilityResult] = []
         if not candidates:
             return results
 
-        async with httpx.AsyncClient(base_url=self._base_url, timeout=self._timeout) as client:
+        client_context = nullcontext(self._client) if self._client is not None else httpx.AsyncClient()
+        async with client_context as client:
             for candidate in candidates:
                 domain = candidate.full_domain
                 params = {
@@ -43,8 +52,10 @@ class WhoapiAvailabilityProvider(AvailabilityProvider):
                 }
                 status = "unknown"
                 raw_payload: dict | None = None
+                response: httpx.Response | None = None
+                started = time.perf_counter()
                 try:
-                    response = await client.get("", params=params)
+                    response = await client.get(self._base_url, params=params, timeout=self._timeout)
                     response.raise_for_status()
                     raw_payload = response.json()
                 except (httpx.HTTPError, ValueError):
@@ -61,6 +72,9 @@ class WhoapiAvailabilityProvider(AvailabilityProvider):
                             status = "unknown"
                     else:
                         status = "error"
+                observe_provider_request(
+                    "whoapi", started, response.status_code if response is not None else "error"
+                )
                 results.append(
                     AvailabilityResult(
                         full_domain=domain,
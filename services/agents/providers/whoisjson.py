@@ -1,10 +1,14 @@
 """Registrar provider implementation using WhoisJSON API."""
 from __future__ import annotations
 
+import time
+from contextlib import nullcontext
 from typing import Iterable, Sequence
 
 import httpx
 
+from services.api.metrics import observe_provider_request
+
 from ..settings import settings
 from ..state import AvailabilityResult, Candidate, ScoredCandidate
 from .base import AvailabilityProvider
@@ -21,24 +25,31 @@ class WhoisJsonAvailabilityProvider(AvailabilityProvider):
         *,
         base_url: str = "https://whoisjsonapi.com/v1/",
         timeout: float | None = None,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         self._api_key = api_key
         self._base_url = base_url.rstrip("/") + "/"
         self._timeout = timeout or settings.dns_timeout_seconds
+        self._client = client
 
     async def check(self, candidates: Iterable[Candidate | ScoredCandidate]) -> Sequence[AvailabilityResult]:
         results: list[AvailabilityResult] = []
         if not candidates:
             return results
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
+        client_context = nullcontext(self._client) if self._client is not None else httpx.AsyncClient()
+        async with client_context as client:
             for candidate in candidates:
                 domain = candidate.full_domain
                 url = f"{self._base_url}status/{domain}"
                 status = "unknown"
                 raw_payload: dict | None = None
+                response: httpx.Response | None = None
+                started = time.perf_counter()
                 try:
-                    response = await client.get(url, headers={"Authorization": f"Bearer {self._api_key}"})
+                    response = await client.get(
+                        url, headers={"Authorization": f"Bearer {self._api_key}"}, timeout=self._timeout
+                    )
                     response.raise_for_status()
                     raw_payload = response.json()
                 except (httpx.HTTPError, ValueError):
@@ -51,6 +62,9 @@ class WhoisJsonAvailabilityProvider(AvailabilityProvider):
                         status = "registered"
                     else:
                         status = "unknown"
+                observe_provider_request(
+                    "whoisjson", started, response.status_code if response is not None else "error"
+                )
                 results.append(
                     AvailabilityResult(
                         full_domain=domain,
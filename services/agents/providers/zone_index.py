@@ -0,0 +1,207 @@
+"""Registered-domain lookups against zone-file snapshots, without network calls.
+
+An index file holds the sorted, de-duplicated 64-bit hashes of every
+delegated second-level label in one TLD's zone, after a 16-byte header
+(magic, count), all little-endian. Opening it maps the file into memory; a
+lookup is a binary search, so even the .com index loads instantly and
+answers in microseconds.
+Build indexes with ``python -m services.agents.zone_ingest``.
+"""
+from __future__ import annotations
+
+import bisect
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+from ..state import AvailabilityResult, Candidate, ScoredCandidate
+from .base import AvailabilityProvider
+
+_MAGIC = b"NSZONE1\0"
+_HEADER = struct.Struct("<8sQ")
+# Hashes are partitioned by their top byte while building, so only one
+# partition has to be sorted in memory at a time.
+_PARTITIONS = 256
+_SPILL_SIZE = 65536
+# Index files are little-endian, like the header; big-endian hosts swap
+# hashes when writing and reading. Spill files never leave the writer, so
+# they stay in native order.
+_SWAP_BYTES = sys.byteorder == "big"
+
+
+def label_hash(label: str) -> int:
+    return int.from_bytes(hashlib.blake2b(label.lower().encode(), digest_size=8).digest(), "little")
+
+
+def index_path(index_dir: str | os.PathLike, tld: str) -> Path:
+    return Path(index_dir) / f"{tld.lower().strip('.')}.zidx"
+
+
+def iter_zone_labels(lines: Iterable[str], *, tld: str) -> Iterator[str]:
+    """Yield the second-level label of each NS record for ``tld`` in a zone file.
+
+    Understands ``$ORIGIN``, relative and ``@`` owners, blank owners
+    continuing the previous record, and optional TTL/class fields. A label
+    with several NS records is yielded once per record.
+    """
+    suffix = "." + tld.lower().strip(".") + "."
+    origin = suffix[1:]
+    owner = None
+    for raw in lines:
+        line = raw.split(";", 1)[0]
+        if not line.strip():
+            continue
+        if line.startswith("$"):
+            directive = line.split()
+            if directive[0].upper() == "$ORIGIN" and len(directive) > 1:
+                origin = directive[1].lower()
+            continue
+        tokens = line.split()
+        if not line[0].isspace():
+            owner, tokens = tokens[0].lower(), tokens[1:]
+        while tokens and (tokens[0].isdigit() or tokens[0].upper() in {"IN", "CH", "HS"}):
+            tokens = tokens[1:]
+        if owner is None or not tokens or tokens[0].upper() != "NS":
+            continue
+        if owner == "@":
+            name = origin
+        elif owner.endswith("."):
+            name = owner
+        else:
+            name = f"{owner}.{origin}"
+        label = name[: -len(suffix)]
+        if name.endswith(suffix) and label and "." not in label:
+            yield label
+
+
+def write_zone_index(labels: Iterable[str], path: str | os.PathLike) -> int:
+    """Write the index for ``labels`` to ``path`` and return how many distinct labels it holds.
+
+    The file is written next to ``path`` and renamed into place, so readers
+    never map a partial index.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    count = 0
+    with tempfile.TemporaryDirectory(dir=path.parent) as spill_dir:
+        spill_files = [open(Path(spill_dir) / f"{i:02x}", "wb") for i in range(_PARTITIONS)]
+        buffers = [array("Q") for _ in range(_PARTITIONS)]
+        try:
+            for label in labels:
+                value = label_hash(label)
+                buffer = buffers[value >> 56]
+                buffer.append(value)
+                if len(buffer) >= _SPILL_SIZE:
+                    buffer.tofile(spill_files[value >> 56])
+                    del buffer[:]
+            for buffer, spill_file in zip(buffers, spill_files, strict=True):
+                buffer.tofile(spill_file)
+        finally:
+            for spill_file in spill_files:
+                spill_file.close()
+        del buffers
+
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as out:
+            out.write(_HEADER.pack(_MAGIC, 0))
+            for i in range(_PARTITIONS):
+                partition = array("Q")
+                partition.frombytes((Path(spill_dir) / f"{i:02x}").read_bytes())
+                unique = array("Q", sorted(set(partition)))
+                count += len(unique)
+                if _SWAP_BYTES:
+                    unique.byteswap()
+                unique.tofile(out)
+            out.seek(0)
+            out.write(_HEADER.pack(_MAGIC, count))
+        os.replace(tmp_path, path)
+    return count
+
+
+class ZoneIndex:
+    """Memory-mapped membership index for one TLD's zone snapshot."""
+
+    def __init__(self, path: str | os.PathLike) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as handle:
+            self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, count = _HEADER.unpack_from(self._mmap)
+        if magic != _MAGIC:
+            self._mmap.close()
+            raise ValueError(f"{self.path} is not a zone index")
+        hashes = memoryview(self._mmap)[_HEADER.size : _HEADER.size + count * 8].cast("Q")
+        if _SWAP_BYTES:
+            # Searching the mapping needs native integers, so big-endian
+            # hosts hold a swapped copy instead.
+            swapped = array("Q", hashes)
+            swapped.byteswap()
+            hashes = memoryview(swapped)
+        self._hashes = hashes
+        self.snapshot_at = datetime.fromtimestamp(self.path.stat().st_mtime, tz=timezone.utc)
+
+    def __len__(self) -> int:
+        return len(self._hashes)
+
+    def __contains__(self, label: str) -> bool:
+        value = label_hash(label)
+        position = bisect.bisect_left(self._hashes, value)
+        return position < len(self._hashes) and self._hashes[position] == value
+
+
+class ZoneIndexAvailabilityProvider(AvailabilityProvider):
+    """Answer ``registered`` from zone indexes and defer the misses to ``provider``.
+
+    A hit means the domain was delegated when the zone snapshot was taken.
+    A miss is not proof of availability (registered domains without name
+    servers are absent from the zone), so misses and TLDs without an index
+    always go to the live provider.
+    """
+
+    def __init__(self, provider: AvailabilityProvider, *, index_dir: str | os.PathLike) -> None:
+        self._provider = provider
+        self._index_dir = index_dir
+        self._indexes: dict[str, ZoneIndex | None] = {}
+
+    def _index(self, tld: str) -> ZoneIndex | None:
+        if tld not in self._indexes:
+            path = index_path(self._index_dir, tld)
+            self._indexes[tld] = ZoneIndex(path) if path.exists() else None
+        return self._indexes[tld]
+
+    async def check(self, candidates: Iterable[Candidate | ScoredCandidate]) -> Sequence[AvailabilityResult]:
+        candidates = list(candidates)
+        results: dict[str, AvailabilityResult] = {}
+        pending: list[Candidate | ScoredCandidate] = []
+        for candidate in candidates:
+            index = self._index(candidate.tld)
+            if index is not None and candidate.label in index:
+                results[candidate.full_domain] = AvailabilityResult(
+                    full_domain=candidate.full_domain,
+                    status="registered",
+                    registrar="zone",
+                    raw_payload={"zone_snapshot_at": index.snapshot_at.isoformat()},
+                )
+            else:
+                pending.append(candidate)
+
+        if pending:
+            for result in await self._provider.check(pending):
+                results[result.full_domain] = result
+        return [results[candidate.full_domain] for candidate in candidates if candidate.full_domain in results]
+
+
+__all__ = [
+    "ZoneIndex",
+    "ZoneIndexAvailabilityProvider",
+    "index_path",
+    "iter_zone_labels",
+    "label_hash",
+    "write_zone_index",
+]
@@ -11,7 +11,7 @@ logger = logging.getLogger(__name__)
 
 from packages.shared_py.namesmith_schemas.base import EntryPath
 
-from ..api.db.session import SessionFactory
+from ..api.db.session import JobSessionFactory
 from ..api.repositories import create_job
 from .executor import run_generation_job
 from .state import GenerationInputs
@@ -29,7 +29,7 @@ async def _create_job_record(args: argparse.Namespace) -> uuid.UUID:
     # Remove optional keys that were not provided
     filtered_params = {key: value for key, value in job_params.items() if value is not None}
 
-    async with SessionFactory() as session:
+    async with JobSessionFactory() as session:
         job = await create_job(
             session,
             entry_path=args.entry_path,
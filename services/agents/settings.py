@@ -28,17 +28,63 @@ class AgentSettings(BaseSettings):
         default=DomainAvailabilityProvider.WHOISJSONAPI,
         alias="REGISTRAR_PROVIDER",
     )
+    # Further providers to hedge and fall back to, e.g. ["rdap","whoapi"];
+    # a request is hedged once the current one exceeds the given latency
+    # percentile (the fixed delay until enough samples exist).
+    registrar_fallback_providers: list[DomainAvailabilityProvider] = Field(
+        default_factory=list, alias="REGISTRAR_FALLBACK_PROVIDERS"
+    )
+    availability_hedge_percentile: float = Field(default=0.95, alias="AVAILABILITY_HEDGE_PERCENTILE")
+    availability_hedge_delay_seconds: float = Field(default=2.0, alias="AVAILABILITY_HEDGE_DELAY_SECONDS")
     whoapi_key: Optional[str] = Field(default=None, alias="WHOAPI_KEY")
     whoisjsonapi_key: Optional[str] = Field(default=None, alias="WHOISJSON_API_KEY")
     openai_api_key: Optional[str] = Field(default=None, alias="OPENAI_API_KEY")
 
     generation_concurrency_limit: int = Field(default=8, alias="GENERATION_CONCURRENCY_LIMIT")
     availability_concurrency_limit: int = Field(default=5, alias="AVAILABILITY_CONCURRENCY_LIMIT")
+    # Jobs from one batch submission that run at the same time.
+    batch_job_concurrency: int = Field(default=4, alias="BATCH_JOB_CONCURRENCY")
     generation_time_budget_seconds: float = Field(default=60.0, alias="GENERATION_TIME_BUDGET_SECONDS")
     scoring_time_budget_seconds: float = Field(default=60.0, alias="SCORING_TIME_BUDGET_SECONDS")
+    # Streaming pipeline: stages connected by bounded queues instead of
+    # graph nodes that each wait for the previous one to finish.
+    streaming_pipeline_enabled: bool = Field(default=False, alias="STREAMING_PIPELINE_ENABLED")
+    streaming_queue_size: int = Field(default=64, alias="STREAMING_QUEUE_SIZE")
+    streaming_score_batch_size: int = Field(default=10, alias="STREAMING_SCORE_BATCH_SIZE")
+    streaming_score_concurrency: int = Field(default=2, alias="STREAMING_SCORE_CONCURRENCY")
+    streaming_persist_batch_size: int = Field(default=20, alias="STREAMING_PERSIST_BATCH_SIZE")
+    streaming_batch_wait_seconds: float = Field(default=0.25, alias="STREAMING_BATCH_WAIT_SECONDS")
     availability_time_budget_seconds: float = Field(default=90.0, alias="AVAILABILITY_TIME_BUDGET_SECONDS")
     availability_success_threshold: float = Field(default=0.8, alias="AVAILABILITY_SUCCESS_THRESHOLD")
     dns_timeout_seconds: float = Field(default=5.0, alias="DNS_TIMEOUT_SECONDS")
+    # DNS pre-filter: delegated domains are marked registered without a
+    # registrar call. Empty nameservers means the system resolver.
+    dns_prefilter_enabled: bool = Field(default=True, alias="DNS_PREFILTER_ENABLED")
+    dns_prefilter_concurrency: int = Field(default=50, alias="DNS_PREFILTER_CONCURRENCY")
+    dns_nameservers: list[str] = Field(default_factory=list, alias="DNS_NAMESERVERS")
+    dns_port: int = Field(default=53, alias="DNS_PORT")
+    # Directory of zone indexes built by ``services.agents.zone_ingest``;
+    # domains found there are registered without a network call.
+    zone_index_dir: Optional[str] = Field(default=None, alias="ZONE_INDEX_DIR")
+    # RDAP provider: IANA bootstrap (TLD -> registry server) cached on disk,
+    # plus per-registry-host connection and request-rate limits.
+    rdap_bootstrap_url: str = Field(default="https://data.iana.org/rdap/dns.json", alias="RDAP_BOOTSTRAP_URL")
+    rdap_bootstrap_cache_path: str = Field(
+        default=".cache/namesmith/rdap_dns.json", alias="RDAP_BOOTSTRAP_CACHE_PATH"
+    )
+    rdap_bootstrap_refresh_seconds: float = Field(default=86400.0, alias="RDAP_BOOTSTRAP_REFRESH_SECONDS")
+    rdap_max_connections_per_host: int = Field(default=4, alias="RDAP_MAX_CONNECTIONS_PER_HOST")
+    rdap_requests_per_second_per_host: float = Field(default=5.0, alias="RDAP_REQUESTS_PER_SECOND_PER_HOST")
+    # LLM routing across model_allowlist: each attempt's deadline, when a
+    # slow attempt is duplicated to the next model (latency percentile, or
+    # the fixed delay until enough samples exist), and how long a
+    # rate-limited model is skipped.
+    llm_attempt_timeout_seconds: float = Field(default=45.0, alias="LLM_ATTEMPT_TIMEOUT_SECONDS")
+    llm_hedging_enabled: bool = Field(default=True, alias="LLM_HEDGING_ENABLED")
+    llm_hedge_percentile: float = Field(default=0.95, alias="LLM_HEDGE_PERCENTILE")
+    llm_hedge_delay_seconds: float = Field(default=20.0, alias="LLM_HEDGE_DELAY_SECONDS")
+    llm_rate_limit_cooldown_seconds: float = Field(default=30.0, alias="LLM_RATE_LIMIT_COOLDOWN_SECONDS")
+    llm_response_log_sample_rate: float = Field(default=0.0, alias="LLM_RESPONSE_LOG_SAMPLE_RATE")
     scoring_rubric_weights: dict[str, float] = Field(
         default_factory=lambda: {
             "memorability": 7,
@@ -1,11 +1,14 @@
 """State definitions for Namesmith agent workflows."""
 from __future__ import annotations
 
+import hashlib
 from datetime import datetime
 from typing import Literal, Optional
 from uuid import UUID
 
+import orjson
 from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic.json_schema import SkipJsonSchema
 from typing import TypedDict
 
 from packages.shared_py.namesmith_schemas.base import EntryPath
@@ -32,6 +35,9 @@ class Candidate(BaseModel):
     tld: str
     display_name: Optional[str] = None
     reasoning: Optional[str] = None
+    # Model that actually answered, which routing may have changed from the
+    # requested one. Stamped by the provider; hidden from the LLM's schema.
+    generation_model: SkipJsonSchema[Optional[str]] = None
 
     @property
     def full_domain(self) -> str:
@@ -53,6 +59,7 @@ class ScoredCandidate(Candidate):
     overall: float
     rubric_version: str = "v1"
     rationale: Optional[str] = None
+    scoring_model: SkipJsonSchema[Optional[str]] = None
 
     @field_validator("memorability", "pronounceability", "brandability", "overall")
     @classmethod
@@ -101,6 +108,29 @@ class GenerationInputs(BaseModel):
         self.tlds = [tld.lower().lstrip(".") for tld in self.tlds]
         return self
 
+    def fingerprint(self) -> str:
+        """SHA-256 of the fields that determine the pipeline's output.
+
+        Job and user ids are excluded, text is whitespace-normalized and list
+        order is ignored. Resolve default models first so that an explicit
+        default and an omitted model hash the same.
+        """
+
+        def _text(value: Optional[str]) -> str:
+            return " ".join((value or "").split())
+
+        canonical = {
+            "entry_path": EntryPath(self.entry_path).value,
+            "topic": _text(self.topic).lower(),
+            "prompt": _text(self.prompt),
+            "categories": sorted({category.strip().lower() for category in self.categories if category.strip()}),
+            "tlds": sorted(set(self.tlds)),
+            "count": self.count,
+            "generation_model": self.generation_model,
+            "scoring_model": self.scoring_model,
+        }
+        return hashlib.sha256(orjson.dumps(canonical, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
 
 class GenerationState(BaseModel):
     inputs: GenerationInputs
@@ -126,4 +156,5 @@ class GenerationStateDict(TypedDict, total=False):
     filtered: list[Candidate]
     scored: list[ScoredCandidate]
     availability: list[AvailabilityResult]
+    persisted_domain_ids: list[str]
     progress: dict[str, int]
@@ -0,0 +1,41 @@
+"""Build a zone index from a TLD zone file (plain or gzip-compressed).
+
+    python -m services.agents.zone_ingest com.zone.gz --tld com --out-dir /var/lib/namesmith/zones
+
+Point ``ZONE_INDEX_DIR`` at the output directory so registrar checks answer
+domains delegated in the snapshot without a network call. Re-run whenever a
+new zone file is downloaded; the index is replaced atomically.
+"""
+from __future__ import annotations
+
+import argparse
+import gzip
+import time
+from pathlib import Path
+
+from .providers.zone_index import index_path, iter_zone_labels, write_zone_index
+
+
+def build_index(zone_path: str | Path, *, tld: str, out_dir: str | Path) -> tuple[Path, int]:
+    zone_path = Path(zone_path)
+    opener = gzip.open if zone_path.suffix == ".gz" else open
+    target = index_path(out_dir, tld)
+    with opener(zone_path, "rt", encoding="ascii", errors="replace") as lines:
+        count = write_zone_index(iter_zone_labels(lines, tld=tld), target)
+    return target, count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build a registered-domain index from a zone file")
+    parser.add_argument("zone", help="Zone file, optionally .gz")
+    parser.add_argument("--tld", required=True, help="TLD the zone file covers, e.g. com")
+    parser.add_argument("--out-dir", required=True, help="Directory served through ZONE_INDEX_DIR")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    target, count = build_index(args.zone, tld=args.tld, out_dir=args.out_dir)
+    print(f"Indexed {count} .{args.tld.strip('.')} domains into {target} in {time.perf_counter() - started:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
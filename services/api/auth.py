@@ -5,7 +5,9 @@ import base64
 import binascii
 import json
 import re
+import time
 import uuid
+from collections import OrderedDict
 from typing import Optional
 
 from fastapi import Depends, Header
@@ -13,7 +15,9 @@ from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from .dependencies import db_session
+from .metrics import record_cache_lookup
 from .repositories import get_user_by_id, upsert_user
+from .settings import settings
 
 _BEARER_PATTERN = re.compile(r"Bearer\s+(?P<token>\S+)", re.IGNORECASE)
 
@@ -24,6 +28,53 @@ class UserContext(BaseModel):
     role: str = "viewer"
 
 
+class UserContextCache:
+    """Bounded per-process LRU of users known to exist in the database.
+
+    Entries expire after ``ttl_seconds`` so role changes made by another worker
+    become visible within that window. Only committed rows should be stored.
+    """
+
+    def __init__(self, *, max_entries: int, ttl_seconds: float) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[uuid.UUID, tuple[float, UserContext]] = OrderedDict()
+
+    def get(self, user_id: uuid.UUID) -> UserContext | None:
+        entry = self._entries.get(user_id)
+        if entry is None:
+            return None
+        expires_at, context = entry
+        if expires_at <= time.monotonic():
+            del self._entries[user_id]
+            return None
+        self._entries.move_to_end(user_id)
+        return context
+
+    def matches(self, context: UserContext) -> bool:
+        return context.id is not None and self.get(context.id) == context
+
+    def put(self, context: UserContext) -> None:
+        if context.id is None or self._max_entries <= 0 or self._ttl_seconds <= 0:
+            return
+        self._entries[context.id] = (time.monotonic() + self._ttl_seconds, context)
+        self._entries.move_to_end(context.id)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, user_id: uuid.UUID) -> None:
+        self._entries.pop(user_id, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+user_context_cache = UserContextCache(
+    max_entries=settings.user_cache_max_entries,
+    ttl_seconds=settings.user_cache_ttl_seconds,
+)
+
+
 def _decode_token(token: str) -> tuple[uuid.UUID, str] | None:
     try:
         padded = token + "=" * (-len(token) % 4)
@@ -52,8 +103,18 @@ async def get_current_user(
         return UserContext()
 
     user_id, email = decoded
+    cached = user_context_cache.get(user_id)
+    record_cache_lookup("user", cached is not None)
+    if cached is not None:
+        return cached
+
     user = await get_user_by_id(session, user_id)
     if user is None:
         fallback_email = email or "unknown@example.com"
         user = await upsert_user(session, user_id=user_id, email=fallback_email, role="viewer")
-    return UserContext(id=user.id, email=user.email, role=user.role)
+        # The insert is only committed if the endpoint commits, so it is not cached here.
+        return UserContext(id=user.id, email=user.email, role=user.role)
+
+    context = UserContext(id=user.id, email=user.email, role=user.role)
+    user_context_cache.put(context)
+    return context
@@ -3,30 +3,49 @@ from .base import Base, metadata_obj
 from .models import (
     AgentRun,
     AvailabilityCheck,
+    AvailabilityJobResult,
     DomainAvailabilityStatus,
     DomainEvaluation,
     DomainName,
     DomainSeoAnalysis,
+    DomainSummary,
+    DomainSummaryVersion,
     Job,
     JobDomainLink,
     User,
 )
-from .session import SessionFactory, engine, get_session, init_models
+from .session import (
+    JobSessionFactory,
+    SessionFactory,
+    engine,
+    get_read_session,
+    get_session,
+    init_models,
+    jobs_engine,
+    read_router,
+)
 
 __all__ = [
     "AgentRun",
     "AvailabilityCheck",
+    "AvailabilityJobResult",
     "Base",
     "DomainAvailabilityStatus",
     "DomainEvaluation",
     "DomainName",
     "DomainSeoAnalysis",
+    "DomainSummary",
+    "DomainSummaryVersion",
     "Job",
     "JobDomainLink",
     "User",
+    "JobSessionFactory",
     "SessionFactory",
     "engine",
+    "get_read_session",
     "get_session",
     "init_models",
+    "jobs_engine",
+    "read_router",
     "metadata_obj",
 ]
@@ -4,7 +4,18 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Integer, String, UniqueConstraint, func
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    CheckConstraint,
+    DateTime,
+    ForeignKey,
+    Integer,
+    String,
+    UniqueConstraint,
+    func,
+    true,
+)
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -115,7 +126,10 @@ class DomainSeoAnalysis(Base):
 
 
 class AvailabilityCheck(Base):
+    """Append-only check history, range partitioned by month on ``checked_at``."""
+
     __tablename__ = "availability_checks"
+    __table_args__ = {"postgresql_partition_by": "RANGE (checked_at)"}
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     domain_id: Mapped[uuid.UUID] = mapped_column(
@@ -124,8 +138,12 @@ class AvailabilityCheck(Base):
     method: Mapped[str] = mapped_column(String(32), nullable=False)
     registrar: Mapped[str | None] = mapped_column(String(64))
     status: Mapped[str] = mapped_column(String(32), nullable=False)
-    checked_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    checked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), primary_key=True, server_default=func.now()
+    )
+    # Trimmed provider payload plus a digest of the full one.
     raw: Mapped[dict | None] = mapped_column(JSONB)
+    raw_digest: Mapped[str | None] = mapped_column(String(64))
     ttl_sec: Mapped[int | None] = mapped_column(Integer)
 
     domain: Mapped[DomainName] = relationship("DomainName", back_populates="availability_checks")
@@ -142,10 +160,15 @@ class Job(Base):
         UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True
     )
     params: Mapped[dict | None] = mapped_column(JSONB)
+    # GenerationInputs.fingerprint(), used to coalesce identical jobs.
+    inputs_hash: Mapped[str | None] = mapped_column(String(64))
     started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     error: Mapped[str | None] = mapped_column(String)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
 
     runs: Mapped[list[AgentRun]] = relationship("AgentRun", back_populates="job")
     created_by_user: Mapped[User | None] = relationship("User", back_populates="jobs")
@@ -209,13 +232,91 @@ class JobDomainLink(Base):
     )
 
 
+class AvailabilityJobResult(Base):
+    """One domain's result in a background availability re-check, appended as it lands."""
+
+    __tablename__ = "availability_job_results"
+
+    job_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True
+    )
+    full_domain: Mapped[str] = mapped_column(String(276), primary_key=True)
+    status: Mapped[str] = mapped_column(String(32), nullable=False)
+    checked_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+
+class DomainSummary(Base):
+    """One denormalized row per domain for the explorer.
+
+    Maintained by database triggers on the source tables (migration 0004);
+    the application only reads it.
+    """
+
+    __tablename__ = "domain_summary"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("domain_names.id", ondelete="CASCADE"), primary_key=True
+    )
+    label: Mapped[str] = mapped_column(String(255), nullable=False)
+    tld: Mapped[str] = mapped_column(String(20), nullable=False)
+    full_domain: Mapped[str] = mapped_column(String(276), nullable=False)
+    display_name: Mapped[str | None] = mapped_column(String(255))
+    length: Mapped[int] = mapped_column(Integer, nullable=False)
+    processed_by_agent: Mapped[str | None] = mapped_column(String(255))
+    agent_model: Mapped[str | None] = mapped_column(String(255))
+    created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    availability_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
+    availability_status: Mapped[str | None] = mapped_column(String(32))
+    availability_agent_model: Mapped[str | None] = mapped_column(String(255))
+    availability_created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    evaluation_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
+    evaluation_possible_categories: Mapped[list[str] | None] = mapped_column(ARRAY(String(120)))
+    evaluation_possible_keywords: Mapped[list[str] | None] = mapped_column(ARRAY(String(120)))
+    evaluation_memorability_score: Mapped[int | None] = mapped_column(Integer)
+    evaluation_pronounceability_score: Mapped[int | None] = mapped_column(Integer)
+    evaluation_brandability_score: Mapped[int | None] = mapped_column(Integer)
+    evaluation_overall_score: Mapped[int | None] = mapped_column(Integer)
+    evaluation_description: Mapped[str | None] = mapped_column(String)
+    evaluation_processed_by_agent: Mapped[str | None] = mapped_column(String(255))
+    evaluation_agent_model: Mapped[str | None] = mapped_column(String(255))
+    evaluation_created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    seo_id: Mapped[uuid.UUID | None] = mapped_column(UUID(as_uuid=True))
+    seo_keywords: Mapped[list[str] | None] = mapped_column(ARRAY(String(120)))
+    seo_keyword_relevance_score: Mapped[int | None] = mapped_column(Integer)
+    seo_industry_relevance_score: Mapped[int | None] = mapped_column(Integer)
+    seo_domain_age: Mapped[int | None] = mapped_column(Integer)
+    seo_potential_resale_value: Mapped[int | None] = mapped_column(Integer)
+    seo_language: Mapped[str | None] = mapped_column(String(32))
+    seo_trademark_status: Mapped[str | None] = mapped_column(String(120))
+    seo_scored_by_agent: Mapped[str | None] = mapped_column(String(255))
+    seo_agent_model: Mapped[str | None] = mapped_column(String(255))
+    seo_description: Mapped[str | None] = mapped_column(String)
+    seo_created_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
+    job_ids: Mapped[list[uuid.UUID]] = mapped_column(
+        ARRAY(UUID(as_uuid=True)), nullable=False, server_default="{}"
+    )
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+
+class DomainSummaryVersion(Base):
+    """Single-row counter bumped by every transaction that changes ``domain_summary`` (migration 0007)."""
+
+    __tablename__ = "domain_summary_version"
+
+    id: Mapped[bool] = mapped_column(Boolean, primary_key=True, server_default=true())
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, server_default="0")
+
+
 __all__ = [
     "AgentRun",
     "AvailabilityCheck",
+    "AvailabilityJobResult",
     "DomainAvailabilityStatus",
     "DomainEvaluation",
     "DomainName",
     "DomainSeoAnalysis",
+    "DomainSummary",
+    "DomainSummaryVersion",
     "Job",
     "JobDomainLink",
     "User",
@@ -0,0 +1,91 @@
+"""Read-replica routing for read-only sessions."""
+from __future__ import annotations
+
+import itertools
+import logging
+import time
+from collections.abc import AsyncIterator, Sequence
+from contextlib import asynccontextmanager
+
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+logger = logging.getLogger(__name__)
+
+# Errors raised while checking out a connection, i.e. the server is unreachable.
+_CONNECT_ERRORS = (DBAPIError, OSError, TimeoutError)
+
+
+class ReplicaRouter:
+    """Hands out read-only sessions bound to a healthy replica, else the primary.
+
+    Replicas are used round-robin. One that fails to hand out a connection is
+    skipped for ``cooldown_seconds`` before being tried again; when none is
+    available the session falls back to the primary.
+    """
+
+    def __init__(
+        self,
+        primary: AsyncEngine,
+        replicas: Sequence[AsyncEngine] = (),
+        *,
+        cooldown_seconds: float = 30.0,
+    ) -> None:
+        self._primary = primary
+        self._replicas = list(replicas)
+        self._cooldown_seconds = cooldown_seconds
+        self._down_until: dict[int, float] = {}
+        self._next = itertools.count()
+        self._factories = {
+            id(engine): async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
+            for engine in [primary, *self._replicas]
+        }
+
+    @property
+    def replicas(self) -> list[AsyncEngine]:
+        return list(self._replicas)
+
+    def healthy_replicas(self) -> list[AsyncEngine]:
+        """Replicas not in cooldown, rotated so successive calls spread load."""
+        if not self._replicas:
+            return []
+        now = time.monotonic()
+        start = next(self._next) % len(self._replicas)
+        rotated = self._replicas[start:] + self._replicas[:start]
+        return [engine for engine in rotated if self._down_until.get(id(engine), 0.0) <= now]
+
+    def mark_down(self, engine: AsyncEngine) -> None:
+        self._down_until[id(engine)] = time.monotonic() + self._cooldown_seconds
+
+    def mark_up(self, engine: AsyncEngine) -> None:
+        self._down_until.pop(id(engine), None)
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        # Checking the connection out up front costs nothing extra (the first
+        # query needs it anyway) and lets an unreachable replica fail over
+        # before any statement runs.
+        for engine in self.healthy_replicas():
+            session = self._factories[id(engine)]()
+            try:
+                await session.connection()
+            except _CONNECT_ERRORS:
+                await session.close()
+                self.mark_down(engine)
+                logger.warning("Read replica %s unavailable; failing over", engine.url.host, exc_info=True)
+                continue
+            self.mark_up(engine)
+            try:
+                yield session
+            finally:
+                await session.close()
+            return
+
+        session = self._factories[id(self._primary)]()
+        try:
+            yield session
+        finally:
+            await session.close()
+
+
+__all__ = ["ReplicaRouter"]
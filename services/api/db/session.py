@@ -6,32 +6,78 @@ from contextlib import asynccontextmanager
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 
+from ..metrics import instrument_engine
 from ..settings import settings
 from .base import Base
+from .routing import ReplicaRouter
 
-def create_engine() -> AsyncEngine:
-    url = settings.database_url
+
+def _connect_args(*, application_name: str, statement_timeout_ms: int | None) -> dict[str, object]:
+    server_settings = {"application_name": application_name}
+    if statement_timeout_ms is not None:
+        server_settings["statement_timeout"] = str(statement_timeout_ms)
+    return {
+        "server_settings": server_settings,
+        # asyncpg's own cache and SQLAlchemy's prepared statement cache.
+        "statement_cache_size": settings.db_statement_cache_size,
+        "prepared_statement_cache_size": settings.db_statement_cache_size,
+    }
+
+
+def create_engine(
+    *,
+    url: str | None = None,
+    application_name: str = "namesmith_api",
+    pool_size: int | None = None,
+    max_overflow: int | None = None,
+    statement_timeout_ms: int | None = None,
+) -> AsyncEngine:
+    url = url or settings.database_url
     if url.startswith("postgresql://"):
         url = url.replace("postgresql://", "postgresql+asyncpg://", 1)
-    
-    connect_args: dict[str, object] = {
-        "server_settings": {
-            "application_name": "namesmith_api",
-        }
-    }
-    
+
     return create_async_engine(
         url,
         echo=False,
         future=True,
-        pool_pre_ping=True,
-        connect_args=connect_args,
+        pool_size=settings.db_pool_size if pool_size is None else pool_size,
+        max_overflow=settings.db_max_overflow if max_overflow is None else max_overflow,
+        pool_timeout=settings.db_pool_timeout_seconds,
+        pool_recycle=settings.db_pool_recycle_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        connect_args=_connect_args(
+            application_name=application_name,
+            statement_timeout_ms=statement_timeout_ms,
+        ),
     )
 
 
-engine: AsyncEngine = create_engine()
+engine: AsyncEngine = create_engine(statement_timeout_ms=settings.db_statement_timeout_ms)
+instrument_engine(engine, "api")
 SessionFactory = async_sessionmaker(bind=engine, expire_on_commit=False, class_=AsyncSession)
 
+# Background generation jobs persist through their own pool.
+jobs_engine: AsyncEngine = create_engine(
+    application_name="namesmith_jobs",
+    pool_size=settings.db_jobs_pool_size,
+    max_overflow=settings.db_jobs_max_overflow,
+    statement_timeout_ms=settings.db_jobs_statement_timeout_ms,
+)
+instrument_engine(jobs_engine, "jobs")
+JobSessionFactory = async_sessionmaker(bind=jobs_engine, expire_on_commit=False, class_=AsyncSession)
+
+replica_engines: list[AsyncEngine] = [
+    create_engine(
+        url=replica_url,
+        application_name="namesmith_api_replica",
+        statement_timeout_ms=settings.db_statement_timeout_ms,
+    )
+    for replica_url in settings.database_replica_urls
+]
+for index, replica_engine in enumerate(replica_engines):
+    instrument_engine(replica_engine, f"replica{index}")
+read_router = ReplicaRouter(engine, replica_engines, cooldown_seconds=settings.db_replica_cooldown_seconds)
+
 
 @asynccontextmanager
 async def get_session() -> AsyncIterator[AsyncSession]:
@@ -42,6 +88,13 @@ async def get_session() -> AsyncIterator[AsyncSession]:
         await session.close()
 
 
+@asynccontextmanager
+async def get_read_session() -> AsyncIterator[AsyncSession]:
+    """Session for read-only work that tolerates replica lag; writes use ``get_session``."""
+    async with read_router.session() as session:
+        yield session
+
+
 async def init_models() -> None:
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
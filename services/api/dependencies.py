@@ -3,9 +3,15 @@ from __future__ import annotations
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from .db.session import get_session
+from .db.session import get_read_session, get_session
 
 
 async def db_session() -> AsyncSession:
     async with get_session() as session:
         yield session
+
+
+async def db_read_session() -> AsyncSession:
+    """Session for read-only endpoints; may be served by a lagging replica."""
+    async with get_read_session() as session:
+        yield session
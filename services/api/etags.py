@@ -0,0 +1,45 @@
+"""ETag helpers for conditional GET handling."""
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+from fastapi import Response
+
+from .metrics import record_cache_lookup
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a weak ETag from the validator values describing a response.
+
+    The tag identifies the state the response was rendered from rather than its
+    bytes, so it is always weak.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\x1f")
+    return f'W/"{digest.hexdigest()}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an ``If-None-Match`` header against ``etag``.
+
+    Requests that send a validator are counted as ``etag`` cache lookups.
+    """
+    if not if_none_match:
+        return False
+    opaque = etag.removeprefix("W/")
+    matched = any(
+        candidate == "*" or candidate.removeprefix("W/") == opaque
+        for candidate in (part.strip() for part in if_none_match.split(","))
+    )
+    record_cache_lookup("etag", matched)
+    return matched
+
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={"ETag": etag})
+
+
+__all__ = ["etag_matches", "make_etag", "not_modified"]
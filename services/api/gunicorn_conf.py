@@ -0,0 +1,12 @@
+"""Gunicorn hooks for the API server."""
+from __future__ import annotations
+
+import os
+
+
+def child_exit(server, worker) -> None:
+    # Drop the exiting worker's live gauges from the multiprocess metrics directory.
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
@@ -6,7 +6,8 @@ import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from .routers import auth, domains, health, jobs
+from .metrics import http_metrics_middleware
+from .routers import auth, availability, domains, health, jobs, metrics
 from .settings import settings
 
 logger = logging.getLogger(__name__)
@@ -19,12 +20,16 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
+app.middleware("http")(http_metrics_middleware)
 
 app.include_router(health.router)
+app.include_router(metrics.router)
 app.include_router(auth.router)
 app.include_router(jobs.router)
 app.include_router(domains.router)
+app.include_router(availability.router)
 
 
 @app.get("/")
@@ -0,0 +1,138 @@
+"""Database maintenance commands.
+
+Run daily, e.g. from cron or a scheduled container:
+
+    python -m services.api.maintenance availability
+
+Creates upcoming monthly partitions of ``availability_checks``, drops
+partitions older than the retention window and compacts older history to the
+latest check per domain per day.
+
+    python -m services.api.maintenance domain-summary
+
+Rebuilds the ``domain_summary`` read model in batches. Triggers keep it current
+during normal operation; run this after bulk loads or restores.
+
+    python -m services.api.maintenance availability-refresh
+
+Re-checks stale availability statuses off-peak, highest-scored and most
+recently requested domains first, through the configured registrar provider.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from .db.session import JobSessionFactory
+from .repositories import (
+    backfill_domain_summary,
+    compact_availability_checks,
+    drop_expired_availability_partitions,
+    ensure_availability_partitions,
+)
+from .settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def maintain_availability_checks(
+    *,
+    partitions_ahead: int,
+    retention_months: int,
+    compact_after_days: int | None,
+) -> dict[str, object]:
+    async with JobSessionFactory() as session:
+        created = await ensure_availability_partitions(session, months_ahead=partitions_ahead)
+        dropped = await drop_expired_availability_partitions(session, retention_months=retention_months)
+        await session.commit()
+
+        compacted = 0
+        if compact_after_days is not None:
+            before = datetime.now(timezone.utc) - timedelta(days=compact_after_days)
+            compacted = await compact_availability_checks(session, before=before)
+            await session.commit()
+
+    summary = {"created": created, "dropped": dropped, "compacted": compacted}
+    logger.info("availability_checks maintenance: %s", summary)
+    return summary
+
+
+async def rebuild_domain_summary(*, batch_size: int) -> int:
+    async with JobSessionFactory() as session:
+        refreshed = await backfill_domain_summary(session, batch_size=batch_size)
+    logger.info("domain_summary backfill: %s domains refreshed", refreshed)
+    return refreshed
+
+
+async def refresh_availability(
+    *,
+    ttl_seconds: int,
+    max_domains: int,
+    batch_size: int,
+    rate_per_second: float | None,
+) -> dict[str, int]:
+    # The registrar providers live with the agent stack.
+    from ..agents.availability_recheck import refresh_stale_availability
+
+    checked_before = datetime.now(timezone.utc) - timedelta(seconds=ttl_seconds)
+    async with JobSessionFactory() as session:
+        summary = await refresh_stale_availability(
+            session,
+            checked_before=checked_before,
+            max_domains=max_domains,
+            batch_size=batch_size,
+            rate_per_second=rate_per_second,
+        )
+    logger.info("availability refresh: %s", summary)
+    return summary
+
+
+async def _main() -> None:
+    parser = argparse.ArgumentParser(description="Namesmith database maintenance")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    availability = subparsers.add_parser("availability", help="Partition, expire and compact availability_checks")
+    availability.add_argument("--partitions-ahead", type=int, default=settings.availability_partitions_ahead)
+    availability.add_argument("--retention-months", type=int, default=settings.availability_retention_months)
+    availability.add_argument(
+        "--compact-after-days",
+        type=int,
+        default=settings.availability_compact_after_days,
+        help="Compact checks older than this many days to one per domain per day",
+    )
+    availability.add_argument("--no-compact", action="store_true", help="Skip compaction")
+    domain_summary = subparsers.add_parser("domain-summary", help="Rebuild the domain_summary read model")
+    domain_summary.add_argument("--batch-size", type=int, default=1000)
+    refresh = subparsers.add_parser("availability-refresh", help="Re-check stale domain availability")
+    refresh.add_argument("--ttl-seconds", type=int, default=settings.availability_refresh_ttl_seconds)
+    refresh.add_argument("--max-domains", type=int, default=settings.availability_refresh_max_domains)
+    refresh.add_argument("--batch-size", type=int, default=settings.availability_refresh_batch_size)
+    refresh.add_argument(
+        "--rate-per-second",
+        type=float,
+        default=settings.availability_refresh_rate_per_second,
+        help="Registrar lookups started per second; 0 disables the limit",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s %(name)s: %(message)s")
+    if args.command == "availability":
+        await maintain_availability_checks(
+            partitions_ahead=args.partitions_ahead,
+            retention_months=args.retention_months,
+            compact_after_days=None if args.no_compact else args.compact_after_days,
+        )
+    elif args.command == "domain-summary":
+        await rebuild_domain_summary(batch_size=args.batch_size)
+    elif args.command == "availability-refresh":
+        await refresh_availability(
+            ttl_seconds=args.ttl_seconds,
+            max_domains=args.max_domains,
+            batch_size=args.batch_size,
+            rate_per_second=args.rate_per_second or None,
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,216 @@
+"""Prometheus metrics shared by the API and the in-process agent workflow.
+
+When ``PROMETHEUS_MULTIPROC_DIR`` is set (see ``start.sh``), every gunicorn worker
+writes its samples to that directory and ``/metrics`` aggregates all of them, so
+scraping any worker reports the whole server.
+"""
+from __future__ import annotations
+
+import os
+import time
+from typing import Any
+
+from fastapi import Request, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client import multiprocess
+
+_LLM_BUCKETS = (0.25, 0.5, 1, 2, 4, 8, 15, 30, 60, 120)
+_JOB_BUCKETS = (1, 5, 10, 20, 30, 60, 90, 120, 180, 300, 600)
+
+HTTP_REQUESTS = Counter(
+    "namesmith_http_requests_total",
+    "HTTP requests handled, by route template and status code.",
+    ["method", "route", "status"],
+)
+HTTP_REQUEST_DURATION = Histogram(
+    "namesmith_http_request_duration_seconds",
+    "HTTP request latency by route template.",
+    ["method", "route"],
+)
+
+DB_POOL_CHECKOUTS = Counter(
+    "namesmith_db_pool_checkouts_total",
+    "Connections checked out of the SQLAlchemy pool.",
+    ["engine"],
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "namesmith_db_pool_checked_out",
+    "Connections currently checked out of the SQLAlchemy pool.",
+    ["engine"],
+    multiprocess_mode="livesum",
+)
+DB_POOL_OVERFLOW = Gauge(
+    "namesmith_db_pool_overflow",
+    "Connections open beyond pool_size at the last checkout.",
+    ["engine"],
+    multiprocess_mode="livemax",
+)
+
+PROVIDER_REQUESTS = Counter(
+    "namesmith_provider_requests_total",
+    "Registrar provider HTTP requests, by provider and status code ('error' for transport failures).",
+    ["provider", "status"],
+)
+PROVIDER_REQUEST_DURATION = Histogram(
+    "namesmith_provider_request_duration_seconds",
+    "Registrar provider HTTP request latency.",
+    ["provider"],
+)
+
+AVAILABILITY_HEDGES = Counter(
+    "namesmith_availability_hedges_total",
+    "Availability checks also sent to a further registrar provider, by that provider and reason (slow or failed).",
+    ["provider", "reason"],
+)
+
+LLM_REQUESTS = Counter(
+    "namesmith_llm_requests_total",
+    "LLM completion calls by model, purpose and outcome.",
+    ["model", "kind", "outcome"],
+)
+LLM_REQUEST_DURATION = Histogram(
+    "namesmith_llm_request_duration_seconds",
+    "LLM completion latency by model and purpose.",
+    ["model", "kind"],
+    buckets=_LLM_BUCKETS,
+)
+LLM_HEDGES = Counter(
+    "namesmith_llm_hedges_total",
+    "LLM calls also sent to an alternate model, by that model, purpose and reason (slow or failed).",
+    ["model", "kind", "reason"],
+)
+LLM_TOKENS = Counter(
+    "namesmith_llm_tokens_total",
+    "LLM tokens consumed by model, purpose and token type.",
+    ["model", "kind", "type"],
+)
+
+LLM_COST = Counter(
+    "namesmith_llm_cost_usd_total",
+    "Estimated LLM spend in US dollars by model and purpose.",
+    ["model", "kind"],
+)
+
+JOBS_IN_FLIGHT = Gauge(
+    "namesmith_jobs_in_flight",
+    "Generation jobs scheduled in this process that have not finished.",
+    multiprocess_mode="livesum",
+)
+JOB_DURATION = Histogram(
+    "namesmith_job_duration_seconds",
+    "Generation job wall time by final status.",
+    ["status"],
+    buckets=_JOB_BUCKETS,
+)
+
+CACHE_REQUESTS = Counter(
+    "namesmith_cache_requests_total",
+    "Cache lookups by cache name and result (hit or miss).",
+    ["cache", "result"],
+)
+
+
+def record_cache_lookup(cache: str, hit: bool) -> None:
+    CACHE_REQUESTS.labels(cache=cache, result="hit" if hit else "miss").inc()
+
+
+def observe_provider_request(provider: str, started: float, status: int | str) -> None:
+    PROVIDER_REQUEST_DURATION.labels(provider=provider).observe(time.perf_counter() - started)
+    PROVIDER_REQUESTS.labels(provider=provider, status=str(status)).inc()
+
+
+def observe_llm_request(
+    model: str,
+    kind: str,
+    started: float,
+    usage: tuple[int, int] | None,
+    *,
+    cost_usd: float = 0.0,
+) -> None:
+    """Record one completion call; ``usage`` is ``(prompt, completion)`` tokens, or None if it raised."""
+    LLM_REQUEST_DURATION.labels(model=model, kind=kind).observe(time.perf_counter() - started)
+    LLM_REQUESTS.labels(model=model, kind=kind, outcome="error" if usage is None else "ok").inc()
+    if usage is None:
+        return
+    prompt_tokens, completion_tokens = usage
+    if prompt_tokens:
+        LLM_TOKENS.labels(model=model, kind=kind, type="prompt").inc(prompt_tokens)
+    if completion_tokens:
+        LLM_TOKENS.labels(model=model, kind=kind, type="completion").inc(completion_tokens)
+    if cost_usd > 0:
+        LLM_COST.labels(model=model, kind=kind).inc(cost_usd)
+
+
+def instrument_engine(engine: Any, name: str) -> None:
+    """Attach pool checkout/checkin listeners to an ``AsyncEngine``."""
+    from sqlalchemy import event
+
+    pool = engine.sync_engine.pool
+
+    @event.listens_for(pool, "checkout")
+    def _on_checkout(*_: Any) -> None:
+        DB_POOL_CHECKOUTS.labels(engine=name).inc()
+        DB_POOL_CHECKED_OUT.labels(engine=name).inc()
+        overflow = getattr(pool, "overflow", None)
+        if callable(overflow):
+            DB_POOL_OVERFLOW.labels(engine=name).set(max(0, overflow()))
+
+    @event.listens_for(pool, "checkin")
+    def _on_checkin(*_: Any) -> None:
+        DB_POOL_CHECKED_OUT.labels(engine=name).dec()
+
+
+async def http_metrics_middleware(request: Request, call_next):
+    started = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        # Label by route template so path parameters don't explode cardinality.
+        route = request.scope.get("route")
+        template = getattr(route, "path", None) or "unmatched"
+        HTTP_REQUEST_DURATION.labels(method=request.method, route=template).observe(time.perf_counter() - started)
+        HTTP_REQUESTS.labels(method=request.method, route=template, status=str(status)).inc()
+
+
+def metrics_response() -> Response:
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return Response(content=generate_latest(registry), media_type=CONTENT_TYPE_LATEST)
+
+
+__all__ = [
+    "CACHE_REQUESTS",
+    "DB_POOL_CHECKED_OUT",
+    "DB_POOL_CHECKOUTS",
+    "DB_POOL_OVERFLOW",
+    "HTTP_REQUESTS",
+    "HTTP_REQUEST_DURATION",
+    "JOBS_IN_FLIGHT",
+    "JOB_DURATION",
+    "LLM_COST",
+    "LLM_REQUESTS",
+    "LLM_REQUEST_DURATION",
+    "LLM_TOKENS",
+    "PROVIDER_REQUESTS",
+    "PROVIDER_REQUEST_DURATION",
+    "http_metrics_middleware",
+    "instrument_engine",
+    "metrics_response",
+    "observe_llm_request",
+    "observe_provider_request",
+    "record_cache_lookup",
+]
@@ -0,0 +1,50 @@
+"""Indexes for the hot list/filter query shapes."""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+# (name, table, columns, extra create_index kwargs)
+_INDEXES = [
+    # list_jobs / get_jobs_version: WHERE created_by = ? ORDER BY created_at DESC
+    ("ix_jobs_created_by_created_at", "jobs", ["created_by", "created_at"], {}),
+    # Domain list job filter join; the link primary key leads with job_id.
+    ("ix_job_domain_links_domain_id", "job_domain_links", ["domain_id"], {}),
+    # Default ordering, cursor range and max(created_at) list validators.
+    ("ix_domain_names_created_at", "domain_names", ["created_at"], {}),
+    ("ix_domain_names_agent_model", "domain_names", ["agent_model"], {}),
+    ("ix_dn_evaluations_overall_score", "dn_evaluations", ["overall_score"], {}),
+    # possible_categories && ARRAY[...]
+    (
+        "ix_dn_evaluations_possible_categories",
+        "dn_evaluations",
+        ["possible_categories"],
+        {"postgresql_using": "gin"},
+    ),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the tables writable while the indexes build; it cannot
+    # run inside the migration transaction.
+    with op.get_context().autocommit_block():
+        for name, table, columns, kwargs in _INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **kwargs,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _columns, _kwargs in reversed(_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,109 @@
+"""Partition availability_checks by month on checked_at."""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+# Monthly partitions created ahead of the current month; later months are
+# added by ``python -m services.api.maintenance``.
+_MONTHS_AHEAD = 3
+
+
+def upgrade() -> None:
+    op.rename_table("availability_checks", "availability_checks_legacy")
+    op.execute("ALTER INDEX ix_availability_checks_domain_id RENAME TO ix_availability_checks_legacy_domain_id")
+    op.execute("ALTER TABLE availability_checks_legacy RENAME CONSTRAINT pk_availability_checks TO pk_availability_checks_legacy")
+
+    # The partition key must be part of the primary key.
+    op.create_table(
+        "availability_checks",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("domain_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("method", sa.String(length=32), nullable=False),
+        sa.Column("registrar", sa.String(length=64), nullable=True),
+        sa.Column("status", sa.String(length=32), nullable=False),
+        sa.Column("checked_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("raw", postgresql.JSONB(), nullable=True),
+        sa.Column("raw_digest", sa.String(length=64), nullable=True),
+        sa.Column("ttl_sec", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["domain_id"], ["domain_names.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id", "checked_at", name="pk_availability_checks"),
+        postgresql_partition_by="RANGE (checked_at)",
+    )
+    op.create_index("ix_availability_checks_domain_id", "availability_checks", ["domain_id", "checked_at"])
+
+    # Catches rows outside every monthly partition so inserts never fail; the
+    # maintenance job keeps it empty by creating partitions ahead of time.
+    op.execute("CREATE TABLE availability_checks_default PARTITION OF availability_checks DEFAULT")
+
+    # One partition per month from the oldest existing check through
+    # _MONTHS_AHEAD months from now.
+    op.execute(
+        f"""
+        DO $$
+        DECLARE
+            month_start date;
+            last_month date := date_trunc('month', now() + interval '{_MONTHS_AHEAD} months')::date;
+        BEGIN
+            SELECT date_trunc('month', coalesce(min(checked_at), now()))::date
+              INTO month_start
+              FROM availability_checks_legacy;
+            WHILE month_start <= last_month LOOP
+                EXECUTE format(
+                    'CREATE TABLE %I PARTITION OF availability_checks FOR VALUES FROM (%L) TO (%L)',
+                    'availability_checks_p' || to_char(month_start, 'YYYYMM'),
+                    month_start,
+                    (month_start + interval '1 month')::date
+                );
+                month_start := (month_start + interval '1 month')::date;
+            END LOOP;
+        END
+        $$;
+        """
+    )
+
+    op.execute(
+        """
+        INSERT INTO availability_checks (id, domain_id, method, registrar, status, checked_at, raw, ttl_sec)
+        SELECT id, domain_id, method, registrar, status, checked_at, raw, ttl_sec
+          FROM availability_checks_legacy
+        """
+    )
+    op.drop_table("availability_checks_legacy")
+
+
+def downgrade() -> None:
+    op.rename_table("availability_checks", "availability_checks_partitioned")
+    op.execute("ALTER INDEX ix_availability_checks_domain_id RENAME TO ix_availability_checks_partitioned_domain_id")
+    op.execute(
+        "ALTER TABLE availability_checks_partitioned RENAME CONSTRAINT pk_availability_checks TO pk_availability_checks_partitioned"
+    )
+    op.create_table(
+        "availability_checks",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        sa.Column("domain_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("method", sa.String(length=32), nullable=False),
+        sa.Column("registrar", sa.String(length=64), nullable=True),
+        sa.Column("status", sa.String(length=32), nullable=False),
+        sa.Column("checked_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("raw", postgresql.JSONB(), nullable=True),
+        sa.Column("ttl_sec", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["domain_id"], ["domain_names.id"], ondelete="CASCADE"),
+    )
+    op.create_index("ix_availability_checks_domain_id", "availability_checks", ["domain_id", "checked_at"], unique=False)
+    op.execute(
+        """
+        INSERT INTO availability_checks (id, domain_id, method, registrar, status, checked_at, raw, ttl_sec)
+        SELECT id, domain_id, method, registrar, status, checked_at, raw, ttl_sec
+          FROM availability_checks_partitioned
+        """
+    )
+    # Dropping the parent drops every partition with it.
+    op.drop_table("availability_checks_partitioned")
@@ -0,0 +1,151 @@
+"""Denormalized domain_summary read model maintained by triggers."""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+# (summary column, type, source expression over d/a/e/s)
+_COLUMNS = [
+    ("label", sa.String(length=255), "d.label"),
+    ("tld", sa.String(length=20), "d.tld"),
+    ("full_domain", sa.String(length=276), "lower(d.label || '.' || d.tld)"),
+    ("display_name", sa.String(length=255), "d.display_name"),
+    ("length", sa.Integer(), "d.length"),
+    ("processed_by_agent", sa.String(length=255), "d.processed_by_agent"),
+    ("agent_model", sa.String(length=255), "d.agent_model"),
+    ("created_at", sa.DateTime(timezone=True), "d.created_at"),
+    ("availability_id", postgresql.UUID(as_uuid=True), "a.id"),
+    ("availability_status", sa.String(length=32), "a.status"),
+    ("availability_agent_model", sa.String(length=255), "a.agent_model"),
+    ("availability_created_at", sa.DateTime(timezone=True), "a.created_at"),
+    ("evaluation_id", postgresql.UUID(as_uuid=True), "e.id"),
+    ("evaluation_possible_categories", postgresql.ARRAY(sa.String(length=120)), "e.possible_categories"),
+    ("evaluation_possible_keywords", postgresql.ARRAY(sa.String(length=120)), "e.possible_keywords"),
+    ("evaluation_memorability_score", sa.Integer(), "e.memorability_score"),
+    ("evaluation_pronounceability_score", sa.Integer(), "e.pronounceability_score"),
+    ("evaluation_brandability_score", sa.Integer(), "e.brandability_score"),
+    ("evaluation_overall_score", sa.Integer(), "e.overall_score"),
+    ("evaluation_description", sa.String(), "e.description"),
+    ("evaluation_processed_by_agent", sa.String(length=255), "e.processed_by_agent"),
+    ("evaluation_agent_model", sa.String(length=255), "e.agent_model"),
+    ("evaluation_created_at", sa.DateTime(timezone=True), "e.created_at"),
+    ("seo_id", postgresql.UUID(as_uuid=True), "s.id"),
+    ("seo_keywords", postgresql.ARRAY(sa.String(length=120)), "s.seo_keywords"),
+    ("seo_keyword_relevance_score", sa.Integer(), "s.seo_keyword_relevance_score"),
+    ("seo_industry_relevance_score", sa.Integer(), "s.industry_relevance_score"),
+    ("seo_domain_age", sa.Integer(), "s.domain_age"),
+    ("seo_potential_resale_value", sa.Integer(), "s.potential_resale_value"),
+    ("seo_language", sa.String(length=32), "s.language"),
+    ("seo_trademark_status", sa.String(length=120), "s.trademark_status"),
+    ("seo_scored_by_agent", sa.String(length=255), "s.scored_by_agent"),
+    ("seo_agent_model", sa.String(length=255), "s.agent_model"),
+    ("seo_description", sa.String(), "s.description"),
+    ("seo_created_at", sa.DateTime(timezone=True), "s.created_at"),
+    (
+        "job_ids",
+        postgresql.ARRAY(postgresql.UUID(as_uuid=True)),
+        "coalesce((SELECT array_agg(l.job_id ORDER BY l.job_id) FROM job_domain_links l WHERE l.domain_id = d.id),"
+        " '{}'::uuid[])",
+    ),
+    ("updated_at", sa.DateTime(timezone=True), "now()"),
+]
+
+_SOURCE_TABLES = ["domain_names", "dn_availability_status", "dn_evaluations", "dn_seo_analyses", "job_domain_links"]
+
+
+def _refresh_function_sql() -> str:
+    names = ", ".join(name for name, _type, _source in _COLUMNS)
+    sources = ",\n               ".join(source for _name, _type, source in _COLUMNS)
+    updates = ",\n            ".join(f"{name} = EXCLUDED.{name}" for name, _type, _source in _COLUMNS)
+    return f"""
+    CREATE OR REPLACE FUNCTION refresh_domain_summaries(domain_ids uuid[]) RETURNS void AS $$
+    BEGIN
+        INSERT INTO domain_summary (id, {names})
+        SELECT d.id,
+               {sources}
+          FROM domain_names d
+          LEFT JOIN dn_availability_status a ON a.domain_id = d.id
+          LEFT JOIN dn_evaluations e ON e.domain_id = d.id
+          LEFT JOIN dn_seo_analyses s ON s.domain_id = d.id
+         WHERE d.id = ANY(domain_ids)
+        ON CONFLICT (id) DO UPDATE SET
+            {updates};
+    END
+    $$ LANGUAGE plpgsql
+    """
+
+
+def upgrade() -> None:
+    op.create_table(
+        "domain_summary",
+        sa.Column("id", postgresql.UUID(as_uuid=True), primary_key=True),
+        *[
+            sa.Column(
+                name,
+                type_,
+                nullable=name not in {"label", "tld", "full_domain", "length", "job_ids", "updated_at"},
+                server_default=sa.text("'{}'::uuid[]") if name == "job_ids" else None,
+            )
+            for name, type_, _source in _COLUMNS
+        ],
+        sa.ForeignKeyConstraint(["id"], ["domain_names.id"], ondelete="CASCADE"),
+    )
+    op.create_index("ix_domain_summary_created_at", "domain_summary", ["created_at"])
+    op.create_index("ix_domain_summary_updated_at", "domain_summary", ["updated_at"])
+    op.create_index("ix_domain_summary_tld", "domain_summary", ["tld"])
+    op.create_index("ix_domain_summary_agent_model", "domain_summary", ["agent_model"])
+    op.create_index("ix_domain_summary_availability_status", "domain_summary", ["availability_status"])
+    op.create_index("ix_domain_summary_overall_score", "domain_summary", ["evaluation_overall_score"])
+    op.create_index(
+        "ix_domain_summary_categories",
+        "domain_summary",
+        ["evaluation_possible_categories"],
+        postgresql_using="gin",
+    )
+    op.create_index("ix_domain_summary_job_ids", "domain_summary", ["job_ids"], postgresql_using="gin")
+
+    op.execute(_refresh_function_sql())
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION domain_summary_refresh_trigger() RETURNS trigger AS $$
+        BEGIN
+            IF TG_TABLE_NAME = 'domain_names' THEN
+                PERFORM refresh_domain_summaries(ARRAY[NEW.id]);
+            ELSIF TG_OP = 'DELETE' THEN
+                PERFORM refresh_domain_summaries(ARRAY[OLD.domain_id]);
+            ELSE
+                PERFORM refresh_domain_summaries(ARRAY[NEW.domain_id]);
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in _SOURCE_TABLES:
+        # Deleting a domain cascades to its summary row, so domain_names only
+        # needs insert/update triggers.
+        events = "INSERT OR UPDATE" if table == "domain_names" else "INSERT OR UPDATE OR DELETE"
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_domain_summary AFTER {events} ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION domain_summary_refresh_trigger()"
+        )
+
+    # Existing domains are summarized in one statement here; the
+    # ``python -m services.api.maintenance domain-summary`` backfill rebuilds in
+    # batches, e.g. after bulk loads with triggers disabled.
+    op.execute("SELECT refresh_domain_summaries(array_agg(id)) FROM domain_names")
+
+
+def downgrade() -> None:
+    for table in _SOURCE_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_domain_summary ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS domain_summary_refresh_trigger()")
+    op.execute("DROP FUNCTION IF EXISTS refresh_domain_summaries(uuid[])")
+    op.drop_table("domain_summary")
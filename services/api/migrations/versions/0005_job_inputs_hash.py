@@ -0,0 +1,33 @@
+"""Add jobs.inputs_hash for coalescing identical generation jobs."""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("jobs", sa.Column("inputs_hash", sa.String(length=64), nullable=True))
+    # Coalescing looks up the newest job per hash; older jobs stay unhashed.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_jobs_inputs_hash_created_at",
+            "jobs",
+            ["inputs_hash", "created_at"],
+            postgresql_where=sa.text("inputs_hash IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_jobs_inputs_hash_created_at", table_name="jobs", postgresql_concurrently=True, if_exists=True
+        )
+    op.drop_column("jobs", "inputs_hash")
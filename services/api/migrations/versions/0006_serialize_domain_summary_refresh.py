@@ -0,0 +1,44 @@
+"""Serialize domain_summary rebuilds per domain.
+
+Two transactions writing different child tables of the same domain used to
+rebuild its summary row from their own snapshots, and the later upsert
+could overwrite the earlier one with stale columns. The rebuild now locks
+the domains first, so it waits for any other writer to commit and then
+reads committed state.
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The upsert built by 0004 keeps its column list; the locking wrapper
+    # takes over its name so triggers and the backfill pick it up unchanged.
+    op.execute("ALTER FUNCTION refresh_domain_summaries(uuid[]) RENAME TO rebuild_domain_summaries")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION refresh_domain_summaries(domain_ids uuid[]) RETURNS void AS $$
+        BEGIN
+            -- FOR NO KEY UPDATE does not conflict with the KEY SHARE locks that
+            -- foreign key checks on the child tables take, so writers cannot
+            -- deadlock on a domain they both reference. Sorting the ids keeps
+            -- multi-domain refreshes in a consistent lock order.
+            PERFORM 1 FROM domain_names WHERE id = ANY(domain_ids) ORDER BY id FOR NO KEY UPDATE;
+            -- In READ COMMITTED each statement takes a new snapshot, so the
+            -- rebuild sees whatever the previous lock holder committed.
+            PERFORM rebuild_domain_summaries(domain_ids);
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP FUNCTION IF EXISTS refresh_domain_summaries(uuid[])")
+    op.execute("ALTER FUNCTION rebuild_domain_summaries(uuid[]) RENAME TO refresh_domain_summaries")
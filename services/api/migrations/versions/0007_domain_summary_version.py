@@ -0,0 +1,54 @@
+"""Version counter for domain_summary, read by listing ETags.
+
+Listing validators used to aggregate count and max(updated_at) over the
+whole summary table on every request. A one-row counter is bumped instead
+whenever a transaction changes ``domain_summary``.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "domain_summary_version",
+        sa.Column("id", sa.Boolean(), primary_key=True, server_default=sa.true()),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.CheckConstraint("id", name="ck_domain_summary_version_single_row"),
+    )
+    op.execute("INSERT INTO domain_summary_version (id, version) VALUES (true, 0)")
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION domain_summary_version_bump() RETURNS trigger AS $$
+        BEGIN
+            -- Once per transaction: the trigger fires for every changed row.
+            IF current_setting('domain_summary.version_bumped', true) IS DISTINCT FROM 'on' THEN
+                UPDATE domain_summary_version SET version = version + 1;
+                PERFORM set_config('domain_summary.version_bumped', 'on', true);
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    # Deferred to commit, so the counter row is only locked for the commit
+    # itself rather than for the whole writing transaction, and the new
+    # version becomes visible together with the rows it describes.
+    op.execute(
+        "CREATE CONSTRAINT TRIGGER trg_domain_summary_version AFTER INSERT OR UPDATE OR DELETE "
+        "ON domain_summary DEFERRABLE INITIALLY DEFERRED "
+        "FOR EACH ROW EXECUTE FUNCTION domain_summary_version_bump()"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS trg_domain_summary_version ON domain_summary")
+    op.execute("DROP FUNCTION IF EXISTS domain_summary_version_bump()")
+    op.drop_table("domain_summary_version")
@@ -0,0 +1,39 @@
+"""Append-only results for availability jobs, and jobs.updated_at.
+
+Background re-checks used to rewrite the whole ``params['results']`` array
+on every flush. Each flush now inserts its results as rows. ``updated_at``
+moves with every change to a job, including mid-run progress, so list
+validators see it.
+"""
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "0008"
+down_revision = "0007"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "availability_job_results",
+        sa.Column("job_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("full_domain", sa.String(length=276), nullable=False),
+        sa.Column("status", sa.String(length=32), nullable=False),
+        sa.Column("checked_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["job_id"], ["jobs.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("job_id", "full_domain"),
+    )
+    op.add_column(
+        "jobs",
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("jobs", "updated_at")
+    op.drop_table("availability_job_results")
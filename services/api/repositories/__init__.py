@@ -1,30 +1,78 @@
 """Repository exports for Namesmith services."""
+from .availability_checks import (
+    compact_availability_checks,
+    drop_expired_availability_partitions,
+    ensure_availability_partitions,
+    trim_provider_payload,
+)
 from .domains import (
+    backfill_domain_summary,
     get_domain_by_id,
     get_domain_filters_metadata,
-    list_domains,
+    get_domain_version,
+    get_domains_version,
+    list_domain_rows,
+    list_stale_availability,
     normalize_label,
+    resolve_domain_lookups,
     upsert_availability,
+    upsert_availability_many,
     upsert_domain,
     upsert_evaluation,
     link_domain_to_job,
 )
-from .jobs import create_job, get_job, list_jobs, record_agent_run, update_job_status
+from .jobs import (
+    add_availability_job_results,
+    adopt_job_results,
+    create_job,
+    create_jobs,
+    find_coalescable_jobs,
+    get_job,
+    get_job_version,
+    get_jobs_version,
+    list_availability_job_results,
+    list_jobs,
+    lock_inputs_hashes,
+    record_agent_run,
+    record_agent_runs,
+    summarize_job_usage,
+    update_job_status,
+)
 from .users import ensure_user_by_email, get_user_by_email, get_user_by_id, upsert_user
 
 __all__ = [
+    "add_availability_job_results",
+    "adopt_job_results",
+    "backfill_domain_summary",
+    "compact_availability_checks",
     "create_job",
+    "create_jobs",
+    "drop_expired_availability_partitions",
+    "ensure_availability_partitions",
+    "find_coalescable_jobs",
     "get_domain_by_id",
     "get_domain_filters_metadata",
+    "get_domain_version",
+    "get_domains_version",
     "get_job",
+    "get_job_version",
+    "get_jobs_version",
     "get_user_by_email",
     "get_user_by_id",
-    "list_domains",
+    "list_domain_rows",
+    "list_availability_job_results",
     "list_jobs",
+    "list_stale_availability",
+    "lock_inputs_hashes",
     "normalize_label",
     "record_agent_run",
+    "record_agent_runs",
+    "resolve_domain_lookups",
+    "summarize_job_usage",
+    "trim_provider_payload",
     "update_job_status",
     "upsert_availability",
+    "upsert_availability_many",
     "upsert_domain",
     "upsert_evaluation",
     "link_domain_to_job",
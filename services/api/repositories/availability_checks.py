@@ -0,0 +1,181 @@
+"""Availability check history: payload trimming, partitions, retention and compaction."""
+from __future__ import annotations
+
+import hashlib
+import re
+from datetime import date, datetime, timezone
+from typing import Any
+
+import orjson
+from sqlalchemy import and_, delete, func, select, text, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..db.models import AvailabilityCheck
+
+PARTITION_PREFIX = "availability_checks_p"
+_PARTITION_NAME = re.compile(rf"^{PARTITION_PREFIX}(\d{{4}})(\d{{2}})$")
+# Longest string value kept when a payload has to be trimmed.
+_MAX_STRING_CHARS = 256
+
+
+def trim_provider_payload(payload: dict | None, *, max_bytes: int) -> tuple[dict | None, str | None]:
+    """Return ``(stored_payload, sha256_hex)`` for a registrar response.
+
+    Payloads that fit in ``max_bytes`` are stored as-is. Larger ones keep only
+    their top-level scalar fields, with long strings cut short, and are
+    flagged with ``"_truncated": true``. The digest always covers the full
+    payload, so identical responses can still be recognised.
+    """
+    if payload is None:
+        return None, None
+    encoded = orjson.dumps(payload, option=orjson.OPT_SORT_KEYS)
+    digest = hashlib.sha256(encoded).hexdigest()
+    if len(encoded) <= max_bytes:
+        return payload, digest
+
+    trimmed: dict[str, Any] = {"_truncated": True}
+    size = len(orjson.dumps(trimmed))
+    for key in sorted(payload):
+        value = payload[key]
+        if isinstance(value, str):
+            value = value[:_MAX_STRING_CHARS]
+        elif not isinstance(value, (int, float, bool)) and value is not None:
+            continue
+        entry_size = len(orjson.dumps({key: value})) - 1
+        if size + entry_size > max_bytes:
+            break
+        trimmed[key] = value
+        size += entry_size
+    return trimmed, digest
+
+
+def _month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+def _partition_month(name: str) -> date | None:
+    match = _PARTITION_NAME.match(name)
+    if match is None:
+        return None
+    return date(int(match.group(1)), int(match.group(2)), 1)
+
+
+def _today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+async def list_availability_partitions(session: AsyncSession) -> list[str]:
+    stmt = text(
+        """
+        SELECT child.relname
+          FROM pg_inherits
+          JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+         WHERE pg_inherits.inhparent = 'availability_checks'::regclass
+         ORDER BY child.relname
+        """
+    )
+    return list((await session.execute(stmt)).scalars().all())
+
+
+async def ensure_availability_partitions(
+    session: AsyncSession,
+    *,
+    months_ahead: int,
+    today: date | None = None,
+) -> list[str]:
+    """Create monthly partitions from the current month through ``months_ahead``.
+
+    Returns the names of partitions that were created.
+    """
+    existing = set(await list_availability_partitions(session))
+    current = _month_start(today or _today())
+    created: list[str] = []
+    for offset in range(months_ahead + 1):
+        month = _add_months(current, offset)
+        name = partition_name(month)
+        if name in existing:
+            continue
+        await session.execute(
+            text(
+                f'CREATE TABLE "{name}" PARTITION OF availability_checks '
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{_add_months(month, 1).isoformat()}')"
+            )
+        )
+        created.append(name)
+    return created
+
+
+async def drop_expired_availability_partitions(
+    session: AsyncSession,
+    *,
+    retention_months: int,
+    today: date | None = None,
+) -> list[str]:
+    """Drop monthly partitions that end before the retention window.
+
+    The window covers the current month plus ``retention_months`` full months
+    before it. Expired rows that landed in the default partition are deleted.
+    Returns the names of dropped partitions.
+    """
+    cutoff = _add_months(_month_start(today or _today()), -retention_months)
+    dropped: list[str] = []
+    for name in await list_availability_partitions(session):
+        month = _partition_month(name)
+        if month is None or _add_months(month, 1) > cutoff:
+            continue
+        await session.execute(text(f'ALTER TABLE availability_checks DETACH PARTITION "{name}"'))
+        await session.execute(text(f'DROP TABLE "{name}"'))
+        dropped.append(name)
+    cutoff_at = datetime(cutoff.year, cutoff.month, cutoff.day, tzinfo=timezone.utc)
+    await session.execute(text("DELETE FROM availability_checks_default WHERE checked_at < :cutoff"), {"cutoff": cutoff_at})
+    return dropped
+
+
+async def compact_availability_checks(session: AsyncSession, *, before: datetime) -> int:
+    """Keep only the latest check per domain per UTC day for checks older than ``before``.
+
+    Returns the number of rows deleted.
+    """
+    day = func.date_trunc("day", func.timezone("UTC", AvailabilityCheck.checked_at))
+    ranked = (
+        select(
+            AvailabilityCheck.id,
+            AvailabilityCheck.checked_at,
+            func.row_number()
+            .over(
+                partition_by=(AvailabilityCheck.domain_id, day),
+                order_by=(AvailabilityCheck.checked_at.desc(), AvailabilityCheck.id.desc()),
+            )
+            .label("rank"),
+        )
+        .where(AvailabilityCheck.checked_at < before)
+        .subquery()
+    )
+    superseded = select(ranked.c.id, ranked.c.checked_at).where(ranked.c.rank > 1)
+    stmt = delete(AvailabilityCheck).where(
+        and_(
+            AvailabilityCheck.checked_at < before,
+            tuple_(AvailabilityCheck.id, AvailabilityCheck.checked_at).in_(superseded),
+        )
+    )
+    result = await session.execute(stmt)
+    return result.rowcount or 0
+
+
+__all__ = [
+    "compact_availability_checks",
+    "drop_expired_availability_partitions",
+    "ensure_availability_partitions",
+    "list_availability_partitions",
+    "partition_name",
+    "trim_provider_payload",
+]
@@ -3,12 +3,12 @@ from __future__ import annotations
 
 import uuid
 from datetime import datetime
-from typing import Iterable, Sequence
+from typing import Any, Iterable, Sequence
 
-from sqlalchemy import Select, and_, func, or_, select
+from sqlalchemy import Row, RowMapping, Select, and_, func, or_, select, tuple_
 from sqlalchemy.dialects.postgresql import array, insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import aliased, selectinload
+from sqlalchemy.orm import selectinload
 
 from ..db.models import (
     AvailabilityCheck,
@@ -16,8 +16,12 @@ from ..db.models import (
     DomainEvaluation,
     DomainName,
     DomainSeoAnalysis,
+    DomainSummary,
+    DomainSummaryVersion,
     JobDomainLink,
 )
+from ..settings import settings
+from .availability_checks import trim_provider_payload
 
 
 def normalize_label(label: str) -> str:
@@ -95,12 +99,14 @@ async def upsert_availability(
     result = await session.execute(stmt)
     availability = result.scalar_one()
 
+    raw, raw_digest = trim_provider_payload(raw_payload, max_bytes=settings.availability_raw_max_bytes)
     check = AvailabilityCheck(
         domain_id=domain_id,
         method=method,
         registrar=registrar,
         status=status_value,
-        raw=raw_payload,
+        raw=raw,
+        raw_digest=raw_digest,
         ttl_sec=ttl_sec,
     )
     session.add(check)
@@ -108,6 +114,98 @@ async def upsert_availability(
     return availability
 
 
+async def upsert_availability_many(session: AsyncSession, *, results: Sequence[dict[str, Any]]) -> int:
+    """Bulk form of ``upsert_availability``: two statements for any number of domains.
+
+    Each mapping takes the keyword arguments of ``upsert_availability``. When a
+    domain appears more than once its last result becomes the current status;
+    every result is kept in the check history. Returns the number of domains
+    updated.
+    """
+    if not results:
+        return 0
+    latest = {result["domain_id"]: result for result in results}
+    stmt = insert(DomainAvailabilityStatus).values(
+        [
+            {
+                "domain_id": domain_id,
+                "status": result["status"].lower(),
+                "processed_by_agent": result.get("processed_by_agent"),
+                "agent_model": result.get("agent_model"),
+            }
+            for domain_id, result in latest.items()
+        ]
+    )
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[DomainAvailabilityStatus.domain_id],
+            set_={
+                "status": stmt.excluded.status,
+                "processed_by_agent": stmt.excluded.processed_by_agent,
+                "agent_model": stmt.excluded.agent_model,
+                "created_at": func.now(),
+            },
+        )
+    )
+
+    checks = []
+    for result in results:
+        raw, raw_digest = trim_provider_payload(
+            result.get("raw_payload"), max_bytes=settings.availability_raw_max_bytes
+        )
+        checks.append(
+            {
+                "id": uuid.uuid4(),
+                "domain_id": result["domain_id"],
+                "method": result["method"],
+                "registrar": result.get("registrar"),
+                "status": result["status"].lower(),
+                "raw": raw,
+                "raw_digest": raw_digest,
+                "ttl_sec": result.get("ttl_sec"),
+            }
+        )
+    await session.execute(insert(AvailabilityCheck).values(checks))
+    return len(latest)
+
+
+async def list_stale_availability(
+    session: AsyncSession,
+    *,
+    checked_before: datetime,
+    limit: int,
+) -> list[Row]:
+    """Domains to re-check, most valuable first.
+
+    Covers domains never checked or last checked before ``checked_before``,
+    ordered by overall score, then by the latest job that produced them (the
+    most recent user interest), then oldest check first. Rows carry ``id`` and
+    ``full_domain``.
+    """
+    last_interest = (
+        select(func.max(JobDomainLink.created_at))
+        .where(JobDomainLink.domain_id == DomainSummary.id)
+        .correlate(DomainSummary)
+        .scalar_subquery()
+    )
+    stmt = (
+        select(DomainSummary.id, DomainSummary.full_domain)
+        .where(
+            or_(
+                DomainSummary.availability_created_at.is_(None),
+                DomainSummary.availability_created_at < checked_before,
+            ),
+        )
+        .order_by(
+            DomainSummary.evaluation_overall_score.desc().nulls_last(),
+            last_interest.desc().nulls_last(),
+            DomainSummary.availability_created_at.asc().nulls_first(),
+        )
+        .limit(limit)
+    )
+    return list((await session.execute(stmt)).all())
+
+
 async def upsert_evaluation(
     session: AsyncSession,
     *,
@@ -168,6 +266,38 @@ async def link_domain_to_job(
     await session.execute(stmt)
 
 
+async def resolve_domain_lookups(
+    session: AsyncSession,
+    *,
+    ids: Sequence[uuid.UUID] = (),
+    names: Sequence[tuple[str, str]] = (),
+) -> list[Row]:
+    """Domains matching any of ``ids`` or normalized ``(label, tld)`` pairs, in one query.
+
+    Rows carry ``id``, ``label``, ``tld`` and the current availability as
+    ``status`` and ``checked_at`` (``None`` when never checked).
+    """
+    conditions = []
+    if ids:
+        conditions.append(DomainName.id.in_(list(ids)))
+    if names:
+        conditions.append(tuple_(DomainName.label, DomainName.tld).in_(list(names)))
+    if not conditions:
+        return []
+    stmt = (
+        select(
+            DomainName.id,
+            DomainName.label,
+            DomainName.tld,
+            DomainAvailabilityStatus.status,
+            DomainAvailabilityStatus.created_at.label("checked_at"),
+        )
+        .outerjoin(DomainAvailabilityStatus, DomainAvailabilityStatus.domain_id == DomainName.id)
+        .where(or_(*conditions))
+    )
+    return list((await session.execute(stmt)).all())
+
+
 async def get_domain_by_id(session: AsyncSession, domain_id: uuid.UUID) -> DomainName | None:
     stmt: Select[tuple[DomainName]] = (
         select(DomainName)
@@ -182,7 +312,36 @@ async def get_domain_by_id(session: AsyncSession, domain_id: uuid.UUID) -> Domai
     return result.scalar_one_or_none()
 
 
-async def list_domains(
+async def get_domain_version(session: AsyncSession, domain_id: uuid.UUID) -> tuple | None:
+    """Timestamps that change whenever ``get_domain_by_id`` would render differently."""
+    stmt = (
+        select(
+            DomainName.created_at,
+            DomainAvailabilityStatus.created_at,
+            DomainEvaluation.created_at,
+            DomainSeoAnalysis.created_at,
+        )
+        .outerjoin(DomainAvailabilityStatus, DomainName.id == DomainAvailabilityStatus.domain_id)
+        .outerjoin(DomainEvaluation, DomainName.id == DomainEvaluation.domain_id)
+        .outerjoin(DomainSeoAnalysis, DomainName.id == DomainSeoAnalysis.domain_id)
+        .where(DomainName.id == domain_id)
+    )
+    row = (await session.execute(stmt)).first()
+    return tuple(row) if row is not None else None
+
+
+async def get_domains_version(session: AsyncSession) -> tuple:
+    """Validator for domain listings and their filter metadata.
+
+    A trigger bumps the counter at commit of every transaction that changes
+    ``domain_summary``, so this is a single-row primary key read. Schemas
+    created without migrations have no counter row.
+    """
+    stmt = select(DomainSummaryVersion.version)
+    return ((await session.execute(stmt)).scalar_one_or_none(),)
+
+
+async def list_domain_rows(
     session: AsyncSession,
     *,
     limit: int,
@@ -196,96 +355,110 @@ async def list_domains(
     score_ranges: dict[str, tuple[int | None, int | None]] | None = None,
     sort_by: str = "created_at",
     sort_dir: str = "desc",
-) -> list[DomainName]:
-    availability_alias = aliased(DomainAvailabilityStatus)
-    evaluation_alias = aliased(DomainEvaluation)
-    job_link_alias = aliased(JobDomainLink)
-    seo_alias = aliased(DomainSeoAnalysis)
-
-    stmt: Select[tuple[DomainName]] = (
-        select(DomainName)
-        .options(
-            selectinload(DomainName.availability),
-            selectinload(DomainName.evaluation),
-            selectinload(DomainName.seo_analysis),
-        )
-        .outerjoin(availability_alias, DomainName.id == availability_alias.domain_id)
-        .outerjoin(evaluation_alias, DomainName.id == evaluation_alias.domain_id)
-        .outerjoin(job_link_alias, DomainName.id == job_link_alias.domain_id)
-        .outerjoin(seo_alias, DomainName.id == seo_alias.domain_id)
-    )
+) -> list[RowMapping]:
+    """Explorer listing served from the ``domain_summary`` read model.
 
+    Filters run against a single table, without joins or DISTINCT. Rows are
+    labelled for ``serialize_domain_row``.
+    """
     filters: list = []
 
     if search:
         pattern = f"%{search.lower()}%"
-        full_domain_expr = func.concat_ws(".", DomainName.label, DomainName.tld)
         filters.append(
             or_(
-                func.lower(DomainName.label).like(pattern),
-                func.lower(DomainName.display_name).like(pattern),
-                func.lower(full_domain_expr).like(pattern),
+                func.lower(DomainSummary.label).like(pattern),
+                func.lower(DomainSummary.display_name).like(pattern),
+                DomainSummary.full_domain.like(pattern),
             )
         )
 
     if statuses:
         status_values = [status.lower() for status in statuses if status]
         if status_values:
-            filters.append(availability_alias.status.in_(status_values))
+            filters.append(DomainSummary.availability_status.in_(status_values))
 
     if tlds:
-        filters.append(func.lower(DomainName.tld).in_([t.lower() for t in tlds]))
+        filters.append(func.lower(DomainSummary.tld).in_([t.lower() for t in tlds]))
 
     if agent_models:
-        filters.append(DomainName.agent_model.in_(agent_models))
+        filters.append(DomainSummary.agent_model.in_(agent_models))
 
     if categories:
-        filters.append(evaluation_alias.possible_categories.op("&&")(array(categories)))
+        filters.append(DomainSummary.evaluation_possible_categories.op("&&")(array(categories)))
 
     if job_id:
-        filters.append(job_link_alias.job_id == job_id)
+        filters.append(DomainSummary.job_ids.contains([job_id]))
 
     score_mapping = {
-        "memorability": evaluation_alias.memorability_score,
-        "pronounceability": evaluation_alias.pronounceability_score,
-        "brandability": evaluation_alias.brandability_score,
-        "overall": evaluation_alias.overall_score,
-        "seo_keyword_relevance": seo_alias.seo_keyword_relevance_score,
+        "memorability": DomainSummary.evaluation_memorability_score,
+        "pronounceability": DomainSummary.evaluation_pronounceability_score,
+        "brandability": DomainSummary.evaluation_brandability_score,
+        "overall": DomainSummary.evaluation_overall_score,
+        "seo_keyword_relevance": DomainSummary.seo_keyword_relevance_score,
     }
-    if score_ranges:
-        for key, column in score_mapping.items():
-            min_val, max_val = score_ranges.get(key, (None, None)) if score_ranges else (None, None)
-            if min_val is not None:
-                filters.append(column >= int(min_val))
-            if max_val is not None:
-                filters.append(column <= int(max_val))
+    for key, (min_val, max_val) in (score_ranges or {}).items():
+        column = score_mapping.get(key)
+        if column is None:
+            continue
+        if min_val is not None:
+            filters.append(column >= int(min_val))
+        if max_val is not None:
+            filters.append(column <= int(max_val))
 
-    if filters:
-        stmt = stmt.where(and_(*filters))
+    if cursor is not None:
+        filters.append(DomainSummary.created_at < cursor)
 
-    order_column = DomainName.created_at
+    order_column = DomainSummary.created_at
     if sort_by == "label":
-        order_column = DomainName.label
+        order_column = DomainSummary.label
     elif sort_by == "overall_score":
-        order_column = evaluation_alias.overall_score
+        order_column = DomainSummary.evaluation_overall_score
+    descending = sort_dir.lower() == "desc"
 
-    order_direction = order_column.desc() if sort_dir.lower() == "desc" else order_column.asc()
-    
-    if cursor is not None:
-        stmt = stmt.where(DomainName.created_at < cursor)
+    stmt = (
+        select(DomainSummary.__table__)
+        .order_by(
+            order_column.desc().nulls_last() if descending else order_column.asc().nulls_last(),
+            DomainSummary.created_at.desc(),
+            DomainSummary.id,
+        )
+        .limit(limit)
+    )
+    if filters:
+        stmt = stmt.where(and_(*filters))
+    result = await session.execute(stmt)
+    return list(result.mappings().all())
 
-    stmt = stmt.distinct(DomainName.id).order_by(DomainName.id, order_direction, DomainName.created_at.desc()).limit(limit)
 
-    result = await session.execute(stmt)
-    return list(result.scalars().unique().all())
+async def backfill_domain_summary(session: AsyncSession, *, batch_size: int = 1000) -> int:
+    """Rebuild ``domain_summary`` for every domain, committing one batch at a time.
+
+    Returns the number of domains refreshed.
+    """
+    refreshed = 0
+    last_id: uuid.UUID | None = None
+    while True:
+        stmt = select(DomainName.id).order_by(DomainName.id).limit(batch_size)
+        if last_id is not None:
+            stmt = stmt.where(DomainName.id > last_id)
+        ids = list((await session.execute(stmt)).scalars().all())
+        if not ids:
+            return refreshed
+        await session.execute(select(func.refresh_domain_summaries(array(ids))))
+        await session.commit()
+        refreshed += len(ids)
+        last_id = ids[-1]
 
 
 async def get_domain_filters_metadata(session: AsyncSession) -> dict[str, list[str]]:
-    statuses_stmt = select(func.distinct(DomainAvailabilityStatus.status)).where(DomainAvailabilityStatus.status.isnot(None))
-    tld_stmt = select(func.distinct(DomainName.tld)).where(DomainName.tld.isnot(None))
-    agent_models_stmt = select(func.distinct(DomainName.agent_model)).where(DomainName.agent_model.isnot(None))
-    industries_stmt = select(func.distinct(func.unnest(DomainEvaluation.possible_categories))).where(
-        DomainEvaluation.possible_categories.isnot(None)
+    statuses_stmt = select(func.distinct(DomainSummary.availability_status)).where(
+        DomainSummary.availability_status.isnot(None)
+    )
+    tld_stmt = select(func.distinct(DomainSummary.tld))
+    agent_models_stmt = select(func.distinct(DomainSummary.agent_model)).where(DomainSummary.agent_model.isnot(None))
+    industries_stmt = select(func.distinct(func.unnest(DomainSummary.evaluation_possible_categories))).where(
+        DomainSummary.evaluation_possible_categories.isnot(None)
     )
 
     statuses = [row[0] for row in (await session.execute(statuses_stmt)).all() if row[0]]
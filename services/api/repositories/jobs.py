@@ -5,11 +5,16 @@ import uuid
 from datetime import datetime
 from typing import Any, Sequence
 
-from sqlalchemy import Select, select
+from sqlalchemy import Float, Integer, Row, Select, Text, and_, column, func, insert, literal, or_, select
+from sqlalchemy.dialects.postgresql import JSONB, array
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from ..db.models import AgentRun, Job
+from ..db.models import AgentRun, AvailabilityJobResult, Job, JobDomainLink
+
+# ``jobs.type`` of generation runs; availability re-checks share the table.
+_GENERATION_JOB_TYPE = "generate"
 
 
 async def create_job(
@@ -19,6 +24,7 @@ async def create_job(
     job_type: str,
     created_by: uuid.UUID | None,
     params: dict[str, Any] | None,
+    inputs_hash: str | None = None,
 ) -> Job:
     job = Job(
         entry_path=entry_path,
@@ -26,12 +32,113 @@ async def create_job(
         status="queued",
         created_by=created_by,
         params=params,
+        inputs_hash=inputs_hash,
     )
     session.add(job)
     await session.flush()
     return job
 
 
+async def create_jobs(
+    session: AsyncSession,
+    *,
+    job_type: str,
+    created_by: uuid.UUID | None,
+    jobs: Sequence[dict[str, Any]],
+) -> list[Job]:
+    """Insert several queued jobs in a single statement.
+
+    Each mapping takes ``entry_path``, ``params`` and optionally
+    ``inputs_hash``. Returned jobs are in input order.
+    """
+    if not jobs:
+        return []
+    stmt = insert(Job).returning(Job, sort_by_parameter_order=True)
+    rows = [
+        {
+            "id": uuid.uuid4(),
+            "entry_path": job["entry_path"],
+            "type": job_type,
+            "status": "queued",
+            "created_by": created_by,
+            "params": job.get("params"),
+            "inputs_hash": job.get("inputs_hash"),
+        }
+        for job in jobs
+    ]
+    return list((await session.scalars(stmt, rows)).all())
+
+
+async def lock_inputs_hashes(session: AsyncSession, inputs_hashes: Sequence[str]) -> None:
+    """Serialize submissions of the same inputs until the transaction ends.
+
+    Locks are taken in sorted order so concurrent batches cannot deadlock.
+    """
+    if not inputs_hashes:
+        return
+    hashes = func.unnest(array(sorted(set(inputs_hashes)))).table_valued("value").alias("hashes")
+    stmt = select(func.pg_advisory_xact_lock(func.hashtext(hashes.c.value))).order_by(hashes.c.value)
+    await session.execute(stmt)
+
+
+async def find_coalescable_jobs(
+    session: AsyncSession,
+    *,
+    inputs_hashes: Sequence[str],
+    active_since: datetime,
+    succeeded_since: datetime,
+) -> dict[str, Job]:
+    """Newest job per hash that a new identical job can attach to.
+
+    Candidates are queued or running jobs created after ``active_since`` and
+    jobs that succeeded after ``succeeded_since``. Jobs that are themselves
+    attached to another job are never returned.
+    """
+    if not inputs_hashes:
+        return {}
+    stmt = (
+        select(Job)
+        .distinct(Job.inputs_hash)
+        .where(
+            Job.inputs_hash.in_(set(inputs_hashes)),
+            ~Job.params.has_key("coalesced_with"),
+            or_(
+                and_(Job.status.in_(("queued", "running")), Job.created_at >= active_since),
+                and_(Job.status == "succeeded", Job.finished_at >= succeeded_since),
+            ),
+        )
+        .order_by(Job.inputs_hash, Job.created_at.desc())
+    )
+    jobs = (await session.scalars(stmt)).all()
+    return {job.inputs_hash: job for job in jobs}
+
+
+async def adopt_job_results(session: AsyncSession, *, job: Job, source: Job, finished_at: datetime) -> Job:
+    """Complete ``job`` with the domains, progress and models of ``source``."""
+    links = select(literal(job.id, JobDomainLink.job_id.type), JobDomainLink.domain_id).where(
+        JobDomainLink.job_id == source.id
+    )
+    await session.execute(
+        pg_insert(JobDomainLink)
+        .from_select(["job_id", "domain_id"], links)
+        .on_conflict_do_nothing()
+    )
+    source_params = source.params or {}
+    params = dict(job.params or {})
+    for key in ("generation_model", "scoring_model", "progress"):
+        if key in source_params:
+            params[key] = source_params[key]
+    params["coalesced_with"] = str(source.id)
+    job.params = params
+    return await update_job_status(
+        session,
+        job,
+        status="succeeded",
+        started_at=job.started_at or finished_at,
+        finished_at=finished_at,
+    )
+
+
 async def get_job(session: AsyncSession, job_id: uuid.UUID) -> Job | None:
     stmt: Select[tuple[Job]] = (
         select(Job)
@@ -42,6 +149,36 @@ async def get_job(session: AsyncSession, job_id: uuid.UUID) -> Job | None:
     return result.scalar_one_or_none()
 
 
+async def get_job_version(session: AsyncSession, job_id: uuid.UUID) -> Row | None:
+    """Owner plus the mutable job columns, read without loading the ORM entity."""
+    stmt = select(
+        Job.created_by,
+        Job.status,
+        Job.started_at,
+        Job.finished_at,
+        Job.error,
+        Job.params["progress"],
+    ).where(Job.id == job_id)
+    return (await session.execute(stmt)).first()
+
+
+async def get_jobs_version(session: AsyncSession, *, created_by: uuid.UUID | None) -> tuple:
+    """Aggregate validator for ``list_jobs``.
+
+    ``updated_at`` moves with every change to a job, including progress
+    written mid-run, so its maximum plus the row count change with any
+    listed job.
+    """
+    stmt = select(
+        func.count(Job.id),
+        func.max(Job.created_at),
+        func.max(Job.updated_at),
+    ).where(Job.type == _GENERATION_JOB_TYPE)
+    if created_by is not None:
+        stmt = stmt.where(Job.created_by == created_by)
+    return tuple((await session.execute(stmt)).one())
+
+
 async def list_jobs(
     session: AsyncSession,
     *,
@@ -49,7 +186,10 @@ async def list_jobs(
     limit: int,
     cursor: datetime | None,
 ) -> Sequence[Job]:
-    stmt: Select[tuple[Job]] = select(Job).order_by(Job.created_at.desc()).limit(limit)
+    """Generation jobs, newest first; availability re-checks are served by their own endpoint."""
+    stmt: Select[tuple[Job]] = (
+        select(Job).where(Job.type == _GENERATION_JOB_TYPE).order_by(Job.created_at.desc()).limit(limit)
+    )
     stmt = stmt.options(selectinload(Job.runs))
     if cursor is not None:
         stmt = stmt.where(Job.created_at < cursor)
@@ -59,6 +199,67 @@ async def list_jobs(
     return result.scalars().all()
 
 
+async def add_availability_job_results(
+    session: AsyncSession, job_id: uuid.UUID, results: Sequence[dict[str, Any]]
+) -> None:
+    """Append results (``full_domain``, ``status``, ``checked_at``) to an availability job."""
+    if not results:
+        return
+    stmt = pg_insert(AvailabilityJobResult).values([{"job_id": job_id, **result} for result in results])
+    await session.execute(stmt.on_conflict_do_nothing(index_elements=["job_id", "full_domain"]))
+
+
+async def list_availability_job_results(session: AsyncSession, job_id: uuid.UUID) -> Sequence[Row]:
+    stmt = (
+        select(AvailabilityJobResult.full_domain, AvailabilityJobResult.status, AvailabilityJobResult.checked_at)
+        .where(AvailabilityJobResult.job_id == job_id)
+        .order_by(AvailabilityJobResult.checked_at, AvailabilityJobResult.full_domain)
+    )
+    return (await session.execute(stmt)).all()
+
+
+async def summarize_job_usage(
+    session: AsyncSession,
+    *,
+    created_by: uuid.UUID | None,
+    since: datetime | None,
+) -> tuple[int, Sequence[Row]]:
+    """Job count and per-model LLM usage summed over ``params['usage']``.
+
+    Rows carry ``model``, ``calls``, ``prompt_tokens``, ``completion_tokens``
+    and ``cost_usd``.
+    """
+    filters = [Job.type == _GENERATION_JOB_TYPE, Job.params.has_key("usage")]
+    if created_by is not None:
+        filters.append(Job.created_by == created_by)
+    if since is not None:
+        filters.append(Job.created_at >= since)
+
+    jobs = (await session.execute(select(func.count(Job.id)).where(*filters))).scalar_one()
+
+    entries = func.jsonb_each(Job.params["usage"]["by_model"]).table_valued(
+        column("key", Text), column("value", JSONB), joins_implicitly=True
+    )
+
+    def _sum(key: str, type_):
+        return func.coalesce(func.sum(entries.c.value[key].astext.cast(type_)), 0)
+
+    stmt = (
+        select(
+            entries.c.key.label("model"),
+            _sum("calls", Integer).label("calls"),
+            _sum("prompt_tokens", Integer).label("prompt_tokens"),
+            _sum("completion_tokens", Integer).label("completion_tokens"),
+            _sum("cost_usd", Float).label("cost_usd"),
+        )
+        .select_from(Job, entries)
+        .where(*filters)
+        .group_by(entries.c.key)
+        .order_by(entries.c.key)
+    )
+    return jobs, (await session.execute(stmt)).all()
+
+
 async def update_job_status(
     session: AsyncSession,
     job: Job,
@@ -106,3 +307,32 @@ async def record_agent_run(
     session.add(run)
     await session.flush()
     return run
+
+
+async def record_agent_runs(
+    session: AsyncSession,
+    *,
+    job_id: uuid.UUID,
+    runs: Sequence[dict[str, Any]],
+) -> list[AgentRun]:
+    """Insert several ``AgentRun`` rows for one job with a single flush.
+
+    Each mapping takes the keyword arguments of ``record_agent_run``.
+    """
+    records = [
+        AgentRun(
+            job_id=job_id,
+            agent_name=run["agent_name"],
+            status=run["status"],
+            input=run.get("input_payload"),
+            output=run.get("output_payload"),
+            started_at=run.get("started_at"),
+            finished_at=run.get("finished_at"),
+            trace_id=run.get("trace_id"),
+            eval_scores=run.get("eval_scores"),
+        )
+        for run in runs
+    ]
+    session.add_all(records)
+    await session.flush()
+    return records
@@ -1,4 +1,4 @@
 """API Routers."""
-from . import domains, health, jobs
+from . import availability, domains, health, jobs, metrics
 
-__all__ = ["domains", "health", "jobs"]
+__all__ = ["availability", "domains", "health", "jobs", "metrics"]
@@ -0,0 +1,167 @@
+"""Availability re-check API router."""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import logging
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from packages.shared_py.namesmith_schemas.base import EntryPath, JobStatus
+from packages.shared_py.namesmith_schemas.jobs import (
+    AvailabilityCheckBatchResponse,
+    AvailabilityCheckRequest,
+    AvailabilityCheckResult,
+    DomainLookupByFullDomain,
+    DomainLookupById,
+)
+
+from ..auth import UserContext, get_current_user
+from ..dependencies import db_session
+from ..metrics import JOBS_IN_FLIGHT
+from ..repositories import (
+    add_availability_job_results,
+    create_job,
+    get_job,
+    list_availability_job_results,
+    normalize_label,
+    resolve_domain_lookups,
+)
+from ..settings import settings
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/v1/availability", tags=["availability"])
+
+# Loaded on first use for the same reason as the generation executor: the
+# registrar providers pull in the agent stack.
+_RECHECK_MODULE = "services.agents.availability_recheck"
+_FRESH_STATUSES = {"available", "registered"}
+
+
+async def _load_recheck_module():
+    return await asyncio.to_thread(importlib.import_module, _RECHECK_MODULE)
+
+
+def _split_full_domain(full_domain: str) -> tuple[str, str]:
+    label, _, tld = full_domain.strip().partition(".")
+    if not label or not tld:
+        raise HTTPException(status_code=400, detail=f"Invalid domain '{full_domain}'")
+    return normalize_label(label), tld.lower()
+
+
+async def _resolve_targets(
+    session: AsyncSession, request: AvailabilityCheckRequest
+) -> tuple[list[str], dict[str, UUID | None], dict[str, AvailabilityCheckResult]]:
+    """Requested domains in order, their catalogue ids and any fresh stored results."""
+    ids: list[UUID] = []
+    names: list[tuple[str, str]] = []
+    for lookup in request.domains:
+        if isinstance(lookup, DomainLookupById):
+            ids.append(lookup.id)
+        elif isinstance(lookup, DomainLookupByFullDomain):
+            names.append(_split_full_domain(lookup.full_domain))
+        else:
+            names.append((normalize_label(lookup.label), lookup.tld.strip().lower().lstrip(".")))
+
+    rows = await resolve_domain_lookups(session, ids=ids, names=names)
+    by_id = {row.id: row for row in rows}
+    missing = [str(domain_id) for domain_id in ids if domain_id not in by_id]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Unknown domain ids: {', '.join(missing)}")
+
+    # Keyed by full domain in request order; domains not in the catalogue
+    # are still checked but have no id to store results against.
+    domain_ids: dict[str, UUID | None] = {}
+    for label, tld in [(by_id[domain_id].label, by_id[domain_id].tld) for domain_id in ids] + names:
+        domain_ids.setdefault(f"{label}.{tld}", None)
+
+    fresh_after = datetime.now(timezone.utc) - timedelta(seconds=settings.availability_cache_ttl_seconds)
+    fresh: dict[str, AvailabilityCheckResult] = {}
+    for row in rows:
+        full_domain = f"{row.label}.{row.tld}"
+        domain_ids[full_domain] = row.id
+        if row.status in _FRESH_STATUSES and row.checked_at is not None and row.checked_at >= fresh_after:
+            fresh[full_domain] = AvailabilityCheckResult(
+                full_domain=full_domain, status=row.status, checked_at=row.checked_at
+            )
+    return list(domain_ids), domain_ids, fresh
+
+
+@router.post("/check", response_model=AvailabilityCheckBatchResponse)
+async def check_availability(
+    request: AvailabilityCheckRequest,
+    session: AsyncSession = Depends(db_session),
+    user: UserContext = Depends(get_current_user),
+) -> AvailabilityCheckBatchResponse:
+    """Re-check registrar availability for stored or arbitrary domains.
+
+    Fresh stored results are returned directly. Small sets of stale domains
+    are checked inline; larger ones continue as an ``availability`` job whose
+    id is returned together with the results known so far.
+    """
+    ordered, domain_ids, fresh = await _resolve_targets(session, request)
+    stale = {full_domain: domain_ids[full_domain] for full_domain in ordered if full_domain not in fresh}
+
+    if len(stale) <= settings.availability_sync_max_domains:
+        results = dict(fresh)
+        if stale:
+            recheck = await _load_recheck_module()
+            for result in await recheck.recheck_domains(session, stale):
+                results[result.full_domain] = AvailabilityCheckResult(
+                    full_domain=result.full_domain, status=result.status, checked_at=result.checked_at
+                )
+            await session.commit()
+        return AvailabilityCheckBatchResponse(
+            status=JobStatus.SUCCEEDED, results=[results[full_domain] for full_domain in ordered]
+        )
+
+    job = await create_job(
+        session,
+        # Re-checks are not tied to an entry path; the column is required.
+        entry_path=EntryPath.BUSINESS.value,
+        job_type="availability",
+        created_by=user.id,
+        params={"progress": {"checked": 0, "total": len(stale)}},
+    )
+    await add_availability_job_results(session, job.id, [result.model_dump() for result in fresh.values()])
+    await session.commit()
+
+    async def _run_job() -> None:
+        JOBS_IN_FLIGHT.inc()
+        try:
+            recheck = await _load_recheck_module()
+            await recheck.run_availability_job(job.id, stale)
+        except Exception:  # noqa: BLE001
+            logger.exception("Availability job %s failed", job.id)
+        finally:
+            JOBS_IN_FLIGHT.dec()
+
+    asyncio.create_task(_run_job())
+    return AvailabilityCheckBatchResponse(status=JobStatus.QUEUED, job_id=job.id, results=list(fresh.values()))
+
+
+@router.get("/check/{job_id}", response_model=AvailabilityCheckBatchResponse)
+async def get_availability_check(
+    job_id: UUID,
+    # Primary, not a replica: clients poll this while the job writes results.
+    session: AsyncSession = Depends(db_session),
+    user: UserContext = Depends(get_current_user),
+) -> AvailabilityCheckBatchResponse:
+    job = await get_job(session, job_id)
+    if job is None or job.type != "availability":
+        raise HTTPException(status_code=404, detail="Availability check not found")
+    if user.id is not None and job.created_by and job.created_by != user.id:
+        raise HTTPException(status_code=403, detail="Not authorized to view this availability check")
+    rows = await list_availability_job_results(session, job.id)
+    return AvailabilityCheckBatchResponse(
+        status=JobStatus(job.status),
+        job_id=job.id,
+        results=[
+            AvailabilityCheckResult(full_domain=row.full_domain, status=row.status, checked_at=row.checked_at)
+            for row in rows
+        ],
+    )
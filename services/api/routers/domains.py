@@ -6,14 +6,21 @@ from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from packages.shared_py.namesmith_schemas.domain import Domain, DomainFiltersMetadata, DomainListResponse
+from packages.shared_py.namesmith_schemas.domain import Domain, DomainListResponse
 
-from ..dependencies import db_session
-from ..repositories import get_domain_by_id, get_domain_filters_metadata, list_domains
-from ..serializers import serialize_domain
+from ..dependencies import db_read_session
+from ..etags import etag_matches, make_etag, not_modified
+from ..repositories import (
+    get_domain_by_id,
+    get_domain_filters_metadata,
+    get_domain_version,
+    get_domains_version,
+    list_domain_rows,
+)
+from ..serializers import dump_json, serialize_domain, serialize_domain_row
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +38,7 @@ def _parse_cursor(cursor: Optional[str]) -> Optional[datetime]:
 
 @router.get("", response_model=DomainListResponse)
 async def list_domain_names(
+    request: Request,
     limit: int = Query(default=20, ge=1, le=100),
     cursor: Optional[str] = Query(default=None),
     search: Optional[str] = Query(default=None),
@@ -51,8 +59,9 @@ async def list_domain_names(
     seo_keyword_relevance_max: Optional[int] = Query(default=None),
     sort_by: str = Query(default="created_at"),
     sort_dir: str = Query(default="desc"),
-    session: AsyncSession = Depends(db_session),
-) -> DomainListResponse:
+    if_none_match: Optional[str] = Header(default=None),
+    session: AsyncSession = Depends(db_read_session),
+) -> Response:
     dt_cursor = _parse_cursor(cursor)
     statuses = [value for value in (status.split(",") if status else []) if value]
     tlds = [value for value in (tld.split(",") if tld else []) if value]
@@ -72,7 +81,12 @@ async def list_domain_names(
         score_ranges["seo_keyword_relevance"] = (seo_keyword_relevance_min, seo_keyword_relevance_max)
 
     try:
-        domains = await list_domains(
+        version = await get_domains_version(session)
+        etag = make_etag(sorted(request.query_params.multi_items()), version)
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
+        rows = await list_domain_rows(
             session,
             limit=limit,
             cursor=dt_cursor,
@@ -86,11 +100,13 @@ async def list_domain_names(
             sort_by=sort_by,
             sort_dir=sort_dir,
         )
-        items = [serialize_domain(domain) for domain in domains]
-        next_cursor = domains[-1].created_at.isoformat() if domains and len(domains) == limit else None
+        items = [serialize_domain_row(row) for row in rows]
+        next_cursor = rows[-1]["created_at"].isoformat() if rows and len(rows) == limit else None
         metadata = await get_domain_filters_metadata(session)
-        filters = DomainFiltersMetadata.model_validate(metadata)
-        return DomainListResponse(items=items, next_cursor=next_cursor, filters=filters)
+        # The payload already has the DomainListResponse shape; returning raw bytes
+        # keeps FastAPI from validating and re-encoding every item a second time.
+        payload = {"items": items, "next_cursor": next_cursor, "filters": metadata}
+        return Response(content=dump_json(payload), media_type="application/json", headers={"ETag": etag})
     except Exception as e:
         logger.exception("Error listing domains with job_id=%s: %s", job_id, str(e))
         raise HTTPException(status_code=500, detail=f"Error listing domains: {str(e)}") from e
@@ -99,9 +115,19 @@ async def list_domain_names(
 @router.get("/{domain_id}", response_model=Domain)
 async def get_domain(
     domain_id: UUID,
-    session: AsyncSession = Depends(db_session),
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    session: AsyncSession = Depends(db_read_session),
 ) -> Domain:
+    version = await get_domain_version(session, domain_id)
+    if version is None:
+        raise HTTPException(status_code=404, detail="Domain not found")
+    etag = make_etag(domain_id, version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
     domain = await get_domain_by_id(session, domain_id)
     if domain is None:
         raise HTTPException(status_code=404, detail="Domain not found")
+    response.headers["ETag"] = etag
     return serialize_domain(domain)
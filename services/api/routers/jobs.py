@@ -2,21 +2,43 @@
 from __future__ import annotations
 
 import asyncio
+import importlib
 import logging
-from datetime import datetime
-from typing import Optional
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Sequence
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from packages.shared_py.namesmith_schemas.jobs import JobCreateRequest, JobListResponse, JobResponse
+from packages.shared_py.namesmith_schemas.jobs import (
+    JobBatchCreateRequest,
+    JobBatchResponse,
+    JobCreateRequest,
+    JobListResponse,
+    JobResponse,
+    JobUsageRollupResponse,
+)
 
-from ..auth import UserContext, get_current_user
-from ..dependencies import db_session
-from ..repositories import create_job, get_job, list_jobs, upsert_user
-from ..serializers import serialize_job
-from ...agents.executor import run_generation_job
+from ..auth import UserContext, get_current_user, user_context_cache
+from ..db.models import Job
+from ..dependencies import db_read_session, db_session
+from ..etags import etag_matches, make_etag, not_modified
+from ..metrics import JOBS_IN_FLIGHT
+from ..repositories import (
+    create_job,
+    create_jobs,
+    find_coalescable_jobs,
+    get_job,
+    get_job_version,
+    get_jobs_version,
+    list_jobs,
+    lock_inputs_hashes,
+    summarize_job_usage,
+    upsert_user,
+)
+from ..serializers import serialize_job, serialize_usage_rollup
+from ..settings import settings
 from ...agents.settings import settings as agent_settings
 from ...agents.state import GenerationInputs
 
@@ -24,6 +46,16 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/v1/jobs", tags=["jobs"])
 
+# The agent stack (LangGraph, LiteLLM, registrar clients) is imported on the first
+# job submission rather than at worker boot, so workers that only serve reads never
+# pay for it. The import runs in a thread to keep the event loop responsive.
+_EXECUTOR_MODULE = "services.agents.executor"
+
+
+async def _load_run_generation_job():
+    module = await asyncio.to_thread(importlib.import_module, _EXECUTOR_MODULE)
+    return module.run_generation_job
+
 
 def _parse_cursor(cursor: Optional[str]) -> Optional[datetime]:
     if not cursor:
@@ -34,12 +66,12 @@ def _parse_cursor(cursor: Optional[str]) -> Optional[datetime]:
         raise HTTPException(status_code=400, detail="Invalid cursor format; expected ISO timestamp") from exc
 
 
-@router.post("/generate", response_model=JobResponse)
-async def create_generation_job(
-    request: JobCreateRequest,
-    session: AsyncSession = Depends(db_session),
-    user: UserContext = Depends(get_current_user),
-) -> JobResponse:
+async def _load_run_generation_jobs():
+    module = await asyncio.to_thread(importlib.import_module, _EXECUTOR_MODULE)
+    return module.run_generation_jobs
+
+
+def _check_models(request: JobCreateRequest) -> None:
     allowlist = agent_settings.model_allowlist
     if allowlist:
         if request.generation_model and request.generation_model not in allowlist:
@@ -47,21 +79,15 @@ async def create_generation_job(
         if request.scoring_model and request.scoring_model not in allowlist:
             raise HTTPException(status_code=400, detail="Requested scoring model is not supported")
 
-    if user.id is not None:
-        await upsert_user(session, user_id=user.id, email=user.email or "unknown@example.com", role=user.role)
 
-    job = await create_job(
-        session,
-        entry_path=request.entry_path.value if hasattr(request.entry_path, "value") else str(request.entry_path),
-        job_type="generate",
-        created_by=user.id,
-        params=request.model_dump(),
-    )
-    await session.commit()
+def _entry_path_value(request: JobCreateRequest) -> str:
+    return request.entry_path.value if hasattr(request.entry_path, "value") else str(request.entry_path)
 
-    inputs = GenerationInputs(
-        job_id=job.id,
-        user_id=user.id,
+
+def _generation_inputs(request: JobCreateRequest, *, job_id: UUID, user_id: UUID | None) -> GenerationInputs:
+    return GenerationInputs(
+        job_id=job_id,
+        user_id=user_id,
         entry_path=request.entry_path,
         topic=request.topic,
         prompt=request.prompt,
@@ -72,42 +98,192 @@ async def create_generation_job(
         scoring_model=request.scoring_model,
     )
 
+
+def _inputs_hash(request: JobCreateRequest) -> str:
+    inputs = _generation_inputs(request, job_id=UUID(int=0), user_id=None)
+    return inputs.model_copy(
+        update={
+            "generation_model": request.generation_model or agent_settings.generation_model,
+            "scoring_model": request.scoring_model or agent_settings.scoring_model,
+        }
+    ).fingerprint()
+
+
+async def _coalescing_targets(session: AsyncSession, inputs_hashes: Sequence[str]) -> dict[str, Job]:
+    """Existing jobs, by inputs hash, that new identical jobs should attach to.
+
+    The advisory locks last until the caller commits, so concurrent identical
+    submissions see each other's jobs instead of all starting pipelines.
+    """
+    if not settings.job_coalescing_enabled:
+        return {}
+    await lock_inputs_hashes(session, inputs_hashes)
+    now = datetime.now(timezone.utc)
+    return await find_coalescable_jobs(
+        session,
+        inputs_hashes=inputs_hashes,
+        active_since=now - timedelta(seconds=settings.job_coalesce_max_wait_seconds),
+        succeeded_since=now - timedelta(seconds=settings.job_coalesce_window_seconds),
+    )
+
+
+def _job_params(request: JobCreateRequest, leader: Job | None) -> dict:
+    params = request.model_dump()
+    if leader is not None:
+        # The executor waits for the leader and adopts its results.
+        params["coalesced_with"] = str(leader.id)
+    return params
+
+
+async def _ensure_user(session: AsyncSession, user: UserContext) -> bool:
+    """Upsert the caller unless the cache says the row is current; returns whether it ran."""
+    upserted = user.id is not None and not user_context_cache.matches(user)
+    if upserted:
+        user_context_cache.invalidate(user.id)
+        await upsert_user(session, user_id=user.id, email=user.email or "unknown@example.com", role=user.role)
+    return upserted
+
+
+@router.post("/generate", response_model=JobResponse)
+async def create_generation_job(
+    request: JobCreateRequest,
+    session: AsyncSession = Depends(db_session),
+    user: UserContext = Depends(get_current_user),
+) -> JobResponse:
+    _check_models(request)
+
+    upserted = await _ensure_user(session, user)
+    inputs_hash = _inputs_hash(request)
+    leaders = await _coalescing_targets(session, [inputs_hash])
+    job = await create_job(
+        session,
+        entry_path=_entry_path_value(request),
+        job_type="generate",
+        created_by=user.id,
+        params=_job_params(request, leaders.get(inputs_hash)),
+        inputs_hash=inputs_hash,
+    )
+    await session.commit()
+    if upserted:
+        user_context_cache.put(user)
+
+    inputs = _generation_inputs(request, job_id=job.id, user_id=user.id)
+
     async def _run_job() -> None:
+        JOBS_IN_FLIGHT.inc()
         try:
+            run_generation_job = await _load_run_generation_job()
             await run_generation_job(inputs)
         except Exception:  # noqa: BLE001
             logger.exception("Generation job %s failed", job.id)
+        finally:
+            JOBS_IN_FLIGHT.dec()
 
     asyncio.create_task(_run_job())
     return serialize_job(job)
 
 
+@router.post("/generate:batch", response_model=JobBatchResponse)
+async def create_generation_jobs(
+    request: JobBatchCreateRequest,
+    session: AsyncSession = Depends(db_session),
+    user: UserContext = Depends(get_current_user),
+) -> JobBatchResponse:
+    """Queue many generation jobs with one insert and run them as one batch."""
+    for item in request.jobs:
+        _check_models(item)
+
+    upserted = await _ensure_user(session, user)
+    inputs_hashes = [_inputs_hash(item) for item in request.jobs]
+    leaders = await _coalescing_targets(session, inputs_hashes)
+    jobs = await create_jobs(
+        session,
+        job_type="generate",
+        created_by=user.id,
+        jobs=[
+            {
+                "entry_path": _entry_path_value(item),
+                "params": _job_params(item, leaders.get(inputs_hash)),
+                "inputs_hash": inputs_hash,
+            }
+            for item, inputs_hash in zip(request.jobs, inputs_hashes)
+        ],
+    )
+    await session.commit()
+    if upserted:
+        user_context_cache.put(user)
+
+    batch = [_generation_inputs(item, job_id=job.id, user_id=user.id) for item, job in zip(request.jobs, jobs)]
+
+    async def _run_batch() -> None:
+        JOBS_IN_FLIGHT.inc(len(batch))
+        try:
+            run_generation_jobs = await _load_run_generation_jobs()
+            await run_generation_jobs(batch)
+        except Exception:  # noqa: BLE001
+            logger.exception("Generation batch of %d jobs failed", len(batch))
+        finally:
+            JOBS_IN_FLIGHT.dec(len(batch))
+
+    asyncio.create_task(_run_batch())
+    return JobBatchResponse(items=[serialize_job(job) for job in jobs])
+
+
 @router.get("", response_model=JobListResponse)
 async def list_generation_jobs(
+    response: Response,
     limit: int = Query(default=20, ge=1, le=100),
     cursor: Optional[str] = Query(default=None),
-    session: AsyncSession = Depends(db_session),
+    if_none_match: Optional[str] = Header(default=None),
+    session: AsyncSession = Depends(db_read_session),
     user: UserContext = Depends(get_current_user),
 ) -> JobListResponse:
     dt_cursor = _parse_cursor(cursor)
+    version = await get_jobs_version(session, created_by=user.id)
+    etag = make_etag(user.id, limit, cursor, version)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag)
+
     jobs = await list_jobs(session, created_by=user.id, limit=limit, cursor=dt_cursor)
     items = [serialize_job(job, progress=(job.params or {}).get("progress")) for job in jobs]
     next_cursor = jobs[-1].created_at.isoformat() if jobs and len(jobs) == limit else None
+    response.headers["ETag"] = etag
     return JobListResponse(items=items, next_cursor=next_cursor)
 
 
+@router.get("/usage", response_model=JobUsageRollupResponse)
+async def get_usage_rollup(
+    since: Optional[datetime] = Query(default=None, description="Only count jobs created at or after this time"),
+    session: AsyncSession = Depends(db_read_session),
+    user: UserContext = Depends(get_current_user),
+) -> JobUsageRollupResponse:
+    jobs, rows = await summarize_job_usage(session, created_by=user.id, since=since)
+    return serialize_usage_rollup(jobs, rows, since=since)
+
+
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_generation_job(
     job_id: UUID,
+    response: Response,
+    if_none_match: Optional[str] = Header(default=None),
+    # Primary, not a replica: clients poll this right after creating the job.
     session: AsyncSession = Depends(db_session),
     user: UserContext = Depends(get_current_user),
 ) -> JobResponse:
     try:
+        version = await get_job_version(session, job_id)
+        if version is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        if user.id is not None and version.created_by and version.created_by != user.id:
+            raise HTTPException(status_code=403, detail="Not authorized to view this job")
+        etag = make_etag(job_id, tuple(version))
+        if etag_matches(if_none_match, etag):
+            return not_modified(etag)
+
         job = await get_job(session, job_id)
         if job is None:
             raise HTTPException(status_code=404, detail="Job not found")
-        if user.id is not None and job.created_by and job.created_by != user.id:
-            raise HTTPException(status_code=403, detail="Not authorized to view this job")
+        response.headers["ETag"] = etag
         return serialize_job(job, progress=(job.params or {}).get("progress"))
     except HTTPException:
         raise
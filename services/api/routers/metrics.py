@@ -0,0 +1,13 @@
+"""Prometheus scrape endpoint."""
+from __future__ import annotations
+
+from fastapi import APIRouter, Response
+
+from ..metrics import metrics_response
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    return metrics_response()
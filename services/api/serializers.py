@@ -1,13 +1,24 @@
 """Serialization helpers to map ORM models to shared schemas."""
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from typing import Any
+
+import orjson
+
 from packages.shared_py.namesmith_schemas.domain import (
     Domain,
     DomainAvailability,
     DomainEvaluation,
     DomainSeoAnalysis,
 )
-from packages.shared_py.namesmith_schemas.jobs import JobResponse
+from packages.shared_py.namesmith_schemas.jobs import (
+    JobResponse,
+    JobUsage,
+    JobUsageRollupResponse,
+    LLMUsageSummary,
+)
 from packages.shared_py.namesmith_schemas.base import JobStatus, JobType
 
 from .db.models import DomainName, Job
@@ -90,5 +101,97 @@ def serialize_job(job: Job, progress: dict[str, int] | None = None) -> JobRespon
             "progress": progress or {},
             "generation_model": params.get("generation_model"),
             "scoring_model": params.get("scoring_model"),
+            "usage": params.get("usage"),
         }
     )
+
+
+def serialize_usage_rollup(
+    jobs: int,
+    rows: Sequence[Any],
+    *,
+    since: datetime | None = None,
+) -> JobUsageRollupResponse:
+    """Build the rollup response from ``summarize_job_usage`` rows."""
+    by_model: dict[str, LLMUsageSummary] = {}
+    for row in rows:
+        by_model[row.model] = LLMUsageSummary(
+            calls=row.calls,
+            prompt_tokens=row.prompt_tokens,
+            completion_tokens=row.completion_tokens,
+            total_tokens=row.prompt_tokens + row.completion_tokens,
+            cost_usd=round(row.cost_usd, 6),
+        )
+    usage = JobUsage(
+        calls=sum(item.calls for item in by_model.values()),
+        prompt_tokens=sum(item.prompt_tokens for item in by_model.values()),
+        completion_tokens=sum(item.completion_tokens for item in by_model.values()),
+        total_tokens=sum(item.total_tokens for item in by_model.values()),
+        cost_usd=round(sum(item.cost_usd for item in by_model.values()), 6),
+        by_model=by_model,
+    )
+    return JobUsageRollupResponse(since=since, jobs=jobs, usage=usage)
+
+
+def serialize_domain_row(row: Mapping[str, Any]) -> dict[str, Any]:
+    """Build the JSON shape of ``Domain`` from a ``list_domain_rows`` projection.
+
+    Keys follow the schema's serialization aliases so the payload matches
+    ``serialize_domain(...).model_dump(by_alias=True)`` without building models.
+    """
+    availability = None
+    if row["availability_id"] is not None:
+        availability = {
+            "status": row["availability_status"],
+            "agent_model": row["availability_agent_model"],
+            "created_at": row["availability_created_at"],
+        }
+    evaluation = None
+    if row["evaluation_id"] is not None:
+        evaluation = {
+            "possible_categories": row["evaluation_possible_categories"] or [],
+            "possible_keywords": row["evaluation_possible_keywords"] or [],
+            "memorability_score": row["evaluation_memorability_score"],
+            "pronounceability_score": row["evaluation_pronounceability_score"],
+            "brandability_score": row["evaluation_brandability_score"],
+            "overall_score": row["evaluation_overall_score"],
+            "description": row["evaluation_description"],
+            "processed_by_agent": row["evaluation_processed_by_agent"],
+            "agent_model": row["evaluation_agent_model"],
+            "created_at": row["evaluation_created_at"],
+        }
+    seo_analysis = None
+    if row["seo_id"] is not None:
+        seo_analysis = {
+            "seo_keywords": row["seo_keywords"] or [],
+            "seo_keyword_relevance_score": row["seo_keyword_relevance_score"],
+            "industry_relevance_score": row["seo_industry_relevance_score"],
+            "domain_age": row["seo_domain_age"],
+            "potential_resale_value": row["seo_potential_resale_value"],
+            "language": row["seo_language"],
+            "trademark_status": row["seo_trademark_status"],
+            "scored_by_agent": row["seo_scored_by_agent"],
+            "agent_model": row["seo_agent_model"],
+            "description": row["seo_description"],
+            "created_at": row["seo_created_at"],
+        }
+
+    return {
+        "id": row["id"],
+        "label": row["label"],
+        "tld": row["tld"],
+        "full_domain": f"{row['label']}.{row['tld']}",
+        "display_name": row["display_name"],
+        "length": row["length"],
+        "processed_by_agent": row["processed_by_agent"],
+        "agent_model": row["agent_model"],
+        "created_at": row["created_at"],
+        "availability": availability,
+        "evaluation": evaluation,
+        "seo_analysis": seo_analysis,
+    }
+
+
+def dump_json(payload: Any) -> bytes:
+    """Encode a serializer payload the same way FastAPI renders the schema models."""
+    return orjson.dumps(payload, option=orjson.OPT_UTC_Z)
@@ -16,9 +16,60 @@ class Settings(BaseSettings):
     )
 
     database_url: str = Field(alias="DATABASE_URL")
+    # Read replicas for read-only endpoints, as a JSON list of URLs.
+    database_replica_urls: list[str] = Field(default_factory=list, alias="DATABASE_REPLICA_URLS")
+    # How long a replica that refused a connection is skipped before retrying it.
+    db_replica_cooldown_seconds: float = Field(default=30.0)
     default_tld: list[str] = Field(default_factory=lambda: ["com", "ai"])
     branding_name: str = Field(default="Namesmith")
     agent_model_name: str = Field(default="namesmith-agent")
+    user_cache_ttl_seconds: float = Field(default=60.0)
+    user_cache_max_entries: int = Field(default=4096)
+
+    # Connection pool for API request handlers.
+    db_pool_size: int = Field(default=5)
+    db_max_overflow: int = Field(default=10)
+    db_pool_timeout_seconds: float = Field(default=30.0)
+    # Recycle connections older than this; -1 disables recycling.
+    db_pool_recycle_seconds: int = Field(default=1800)
+    # Pre-ping costs a round trip per checkout; it can be disabled where
+    # recycling already covers idle server-side disconnects.
+    db_pool_pre_ping: bool = Field(default=True)
+    # Prepared statements cached per connection; 0 disables (needed behind
+    # pgbouncer in transaction pooling mode).
+    db_statement_cache_size: int = Field(default=100)
+    db_statement_timeout_ms: int | None = Field(default=None)
+
+    # Separate pool for background job persistence, so long-running jobs
+    # cannot hold every connection the request handlers need.
+    db_jobs_pool_size: int = Field(default=5)
+    db_jobs_max_overflow: int = Field(default=5)
+    db_jobs_statement_timeout_ms: int | None = Field(default=None)
+
+    # availability_checks history: payload size cap and maintenance defaults.
+    availability_raw_max_bytes: int = Field(default=1024)
+    availability_retention_months: int = Field(default=6)
+    availability_compact_after_days: int = Field(default=7)
+    availability_partitions_ahead: int = Field(default=3)
+    # POST /v1/availability/check: stored results younger than this are
+    # served as-is; up to availability_sync_max_domains stale ones are checked
+    # inline, larger requests continue as a background job.
+    availability_cache_ttl_seconds: int = Field(default=3600)
+    availability_sync_max_domains: int = Field(default=25)
+    # Off-peak refresher (python -m services.api.maintenance availability-refresh):
+    # re-checks statuses older than availability_refresh_ttl_seconds.
+    availability_refresh_ttl_seconds: int = Field(default=7 * 24 * 3600)
+    availability_refresh_max_domains: int = Field(default=5000)
+    availability_refresh_batch_size: int = Field(default=100)
+    availability_refresh_rate_per_second: float = Field(default=5.0)
+
+    # Coalescing of identical generation jobs: a new job attaches to a queued
+    # or running one created within job_coalesce_max_wait_seconds, or to one
+    # that succeeded within job_coalesce_window_seconds, instead of re-running.
+    job_coalescing_enabled: bool = Field(default=True)
+    job_coalesce_window_seconds: float = Field(default=600.0)
+    job_coalesce_max_wait_seconds: float = Field(default=300.0)
+    job_coalesce_poll_interval_seconds: float = Field(default=1.0)
 
 
 @lru_cache
@@ -5,7 +5,14 @@ cd /app
 
 alembic -c services/api/alembic.ini upgrade head
 
+# Workers share Prometheus samples through this directory; stale files from a
+# previous run would be double counted, so start from an empty one.
+export PROMETHEUS_MULTIPROC_DIR="${PROMETHEUS_MULTIPROC_DIR:-/tmp/namesmith-metrics}"
+rm -rf "${PROMETHEUS_MULTIPROC_DIR}"
+mkdir -p "${PROMETHEUS_MULTIPROC_DIR}"
+
 exec gunicorn services.api.main:app \
+  --config python:services.api.gunicorn_conf \
   --workers "${GUNICORN_WORKERS:-2}" \
   --worker-class uvicorn.workers.UvicornWorker \
   --bind "0.0.0.0:${PORT:-8000}" \
@@ -0,0 +1,47 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+# Modules that belong to the agent stack and must only load on first job submission.
+_AGENT_ONLY_PREFIXES = ("litellm", "langgraph", "langchain_core", "openai", "services.agents.executor")
+
+
+def _import_profile(module: str) -> dict[str, int]:
+    env = {**os.environ, "DATABASE_URL": os.environ.get("DATABASE_URL", "postgresql://localhost/namesmith")}
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=PROJECT_ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative: dict[str, int] = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative_us, name = (part.strip() for part in line.split("|"))
+        if cumulative_us.isdigit():
+            cumulative[name] = int(cumulative_us)
+    return cumulative
+
+
+def test_api_import_does_not_load_agent_stack():
+    profile = _import_profile("services.api.main")
+    assert "services.api.main" in profile
+
+    leaked = sorted(name for name in profile if name.startswith(_AGENT_ONLY_PREFIXES))
+    assert not leaked, f"API import pulled in agent modules: {leaked[:10]}"
+
+
+def test_api_import_time_budget():
+    budget_ms = os.getenv("NAMESMITH_API_IMPORT_BUDGET_MS")
+    if budget_ms is None:
+        pytest.skip("NAMESMITH_API_IMPORT_BUDGET_MS not set; skipping import time budget")
+
+    total_ms = _import_profile("services.api.main")["services.api.main"] / 1000
+    assert total_ms <= float(budget_ms), f"services.api.main imported in {total_ms:.0f} ms"
@@ -0,0 +1,54 @@
+import base64
+import json
+import uuid
+
+import pytest
+
+from services.api import auth
+from services.api.auth import UserContext, UserContextCache, get_current_user
+
+
+def _token(user_id: uuid.UUID, email: str) -> str:
+    raw = json.dumps({"userId": str(user_id), "email": email}).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def test_user_context_cache_expires_and_evicts(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(auth.time, "monotonic", lambda: now[0])
+    cache = UserContextCache(max_entries=2, ttl_seconds=10)
+    users = [UserContext(id=uuid.uuid4(), email=f"u{i}@example.com") for i in range(3)]
+    for user in users:
+        cache.put(user)
+
+    assert cache.get(users[0].id) is None
+    assert cache.matches(users[1])
+    assert cache.get(users[2].id) == users[2]
+
+    now[0] += 10
+    assert cache.get(users[1].id) is None
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_reuses_cached_context(monkeypatch):
+    user_id = uuid.uuid4()
+    lookups: list[uuid.UUID] = []
+
+    class StoredUser:
+        id = user_id
+        email = "ada@example.com"
+        role = "admin"
+
+    async def fake_get_user_by_id(session, requested_id):
+        lookups.append(requested_id)
+        return StoredUser()
+
+    monkeypatch.setattr(auth, "get_user_by_id", fake_get_user_by_id)
+    monkeypatch.setattr(auth, "user_context_cache", UserContextCache(max_entries=8, ttl_seconds=60))
+
+    header = f"Bearer {_token(user_id, 'ada@example.com')}"
+    first = await get_current_user(authorization=header, session=None)
+    second = await get_current_user(authorization=header, session=None)
+
+    assert first == second == UserContext(id=user_id, email="ada@example.com", role="admin")
+    assert lookups == [user_id]
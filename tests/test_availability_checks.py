@@ -0,0 +1,82 @@
+from datetime import date
+
+import pytest
+
+from services.api.repositories.availability_checks import (
+    drop_expired_availability_partitions,
+    ensure_availability_partitions,
+    partition_name,
+    trim_provider_payload,
+)
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class _FakeSession:
+    def __init__(self, partitions):
+        self.partitions = partitions
+        self.statements: list[str] = []
+
+    async def execute(self, stmt, params=None):
+        sql = str(stmt)
+        if "pg_inherits" in sql:
+            return _Result(list(self.partitions))
+        self.statements.append(sql)
+        return _Result([])
+
+
+def test_small_payloads_are_kept_with_digest():
+    payload = {"status": "0", "taken": "1"}
+    stored, digest = trim_provider_payload(payload, max_bytes=1024)
+    assert stored == payload
+    assert len(digest) == 64
+    assert trim_provider_payload(None, max_bytes=1024) == (None, None)
+
+
+def test_large_payloads_keep_top_level_scalars_within_budget():
+    payload = {"status": "active", "whois_raw": "x" * 5000, "contacts": [{"name": "a"}] * 50, "expires": 2030}
+    stored, digest = trim_provider_payload(payload, max_bytes=400)
+
+    assert stored["_truncated"] is True
+    assert stored["status"] == "active"
+    assert stored["expires"] == 2030
+    assert "contacts" not in stored
+    assert len(stored["whois_raw"]) == 256
+    assert digest == trim_provider_payload(payload, max_bytes=10_000)[1]
+
+
+@pytest.mark.asyncio
+async def test_ensure_partitions_creates_missing_months():
+    session = _FakeSession([partition_name(date(2026, 10, 1))])
+
+    created = await ensure_availability_partitions(session, months_ahead=3, today=date(2026, 10, 19))
+
+    assert created == ["availability_checks_p202611", "availability_checks_p202612", "availability_checks_p202701"]
+    assert "FROM ('2026-12-01') TO ('2027-01-01')" in session.statements[1]
+
+
+@pytest.mark.asyncio
+async def test_drop_expired_partitions_keeps_retention_window():
+    session = _FakeSession(
+        [
+            "availability_checks_default",
+            "availability_checks_p202603",
+            "availability_checks_p202604",
+            "availability_checks_p202610",
+        ]
+    )
+
+    dropped = await drop_expired_availability_partitions(session, retention_months=6, today=date(2026, 10, 19))
+
+    assert dropped == ["availability_checks_p202603"]
+    assert any("DETACH PARTITION" in sql for sql in session.statements)
+    assert "availability_checks_default" in session.statements[-1]
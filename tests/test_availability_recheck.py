@@ -0,0 +1,258 @@
+import asyncio
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from packages.shared_py.namesmith_schemas.jobs import AvailabilityCheckRequest
+from services.agents import availability_recheck
+from services.agents.availability_recheck import iter_availability
+from services.agents.providers.base import AvailabilityProvider
+from services.agents.state import AvailabilityResult
+from services.api.auth import UserContext
+from services.api.repositories.domains import upsert_availability_many
+from services.api.routers import availability as availability_router
+
+
+class _SlowProvider(AvailabilityProvider):
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+
+    async def check(self, candidates):
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        candidate = list(candidates)[0]
+        if candidate.label == "boom":
+            raise RuntimeError("registrar down")
+        return [AvailabilityResult(full_domain=candidate.full_domain, status="available")]
+
+
+@pytest.mark.asyncio
+async def test_iter_availability_bounds_concurrency_and_isolates_failures():
+    provider = _SlowProvider()
+    domains = ["a.com", "b.com", "boom.com", "c.ai", "d.io"]
+
+    results = [result async for result in iter_availability(provider, domains, concurrency=2)]
+
+    assert provider.peak == 2
+    assert {result.full_domain: result.status for result in results} == {
+        "a.com": "available",
+        "b.com": "available",
+        "boom.com": "error",
+        "c.ai": "available",
+        "d.io": "available",
+    }
+
+
+class _Session:
+    def __init__(self):
+        self.commits = 0
+
+    async def commit(self):
+        self.commits += 1
+
+
+def _row(label, tld, status=None, checked_at=None):
+    return SimpleNamespace(id=uuid.uuid4(), label=label, tld=tld, status=status, checked_at=checked_at)
+
+
+@pytest.mark.asyncio
+async def test_small_request_serves_fresh_rows_and_rechecks_the_rest(monkeypatch):
+    now = datetime.now(timezone.utc)
+    fresh = _row("fresh", "com", "registered", now)
+    stale = _row("stale", "com", "available", now - timedelta(days=2))
+    lookups = []
+
+    async def fake_resolve(session, *, ids, names):
+        lookups.append((list(ids), list(names)))
+        return [fresh, stale]
+
+    checked = []
+
+    async def fake_recheck(session, domain_ids):
+        checked.append(dict(domain_ids))
+        return [AvailabilityResult(full_domain=name, status="registered") for name in domain_ids]
+
+    async def fake_load():
+        return SimpleNamespace(recheck_domains=fake_recheck)
+
+    monkeypatch.setattr(availability_router, "resolve_domain_lookups", fake_resolve)
+    monkeypatch.setattr(availability_router, "_load_recheck_module", fake_load)
+
+    request = AvailabilityCheckRequest.model_validate(
+        {"domains": [{"id": str(fresh.id)}, {"full_domain": "Stale.com"}, {"label": "new", "tld": ".AI"}]}
+    )
+    session = _Session()
+    response = await availability_router.check_availability(request, session=session, user=UserContext())
+
+    assert lookups == [([fresh.id], [("stale", "com"), ("new", "ai")])]
+    assert checked == [{"stale.com": stale.id, "new.ai": None}]
+    assert [(result.full_domain, result.status) for result in response.results] == [
+        ("fresh.com", "registered"),
+        ("stale.com", "registered"),
+        ("new.ai", "registered"),
+    ]
+    assert response.status.value == "succeeded"
+    assert response.job_id is None
+    assert session.commits == 1
+
+
+@pytest.mark.asyncio
+async def test_unknown_ids_are_rejected(monkeypatch):
+    async def fake_resolve(session, *, ids, names):
+        return []
+
+    monkeypatch.setattr(availability_router, "resolve_domain_lookups", fake_resolve)
+    request = AvailabilityCheckRequest.model_validate({"domains": [{"id": str(uuid.uuid4())}]})
+
+    with pytest.raises(availability_router.HTTPException) as excinfo:
+        await availability_router.check_availability(request, session=_Session(), user=UserContext())
+    assert excinfo.value.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_upsert_availability_many_dedupes_current_status_and_keeps_history():
+    statements = []
+
+    class _RecordingSession:
+        async def execute(self, stmt):
+            statements.append(stmt)
+
+    domain_id = uuid.uuid4()
+    base = {"method": "registrar", "registrar": "whoapi", "raw_payload": {"status": "0"}}
+    updated = await upsert_availability_many(
+        _RecordingSession(),
+        results=[
+            {**base, "domain_id": domain_id, "status": "available"},
+            {**base, "domain_id": domain_id, "status": "registered"},
+        ],
+    )
+
+    assert updated == 1
+    status_stmt, history_stmt = statements
+    status_sql = str(status_stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (domain_id) DO UPDATE SET status = excluded.status" in status_sql
+    assert status_stmt.compile(dialect=postgresql.dialect()).params["status_m0"] == "registered"
+    assert len(history_stmt._multi_values[0]) == 2
+
+
+@pytest.mark.asyncio
+async def test_refresh_walks_stale_batches_and_skips_failed_domains(monkeypatch):
+    rows = [SimpleNamespace(id=uuid.uuid4(), full_domain=f"d{i}.com") for i in range(5)]
+    selections = []
+    recorded = []
+
+    async def fake_list(session, *, checked_before, limit):
+        selections.append(limit)
+        return rows[:limit]
+
+    async def fake_record(session, results, domain_ids):
+        recorded.extend(result.full_domain for result in results if result.status == "available")
+
+    class _Provider(AvailabilityProvider):
+        async def check(self, candidates):
+            candidate = list(candidates)[0]
+            status = "error" if candidate.label == "d1" else "available"
+            return [AvailabilityResult(full_domain=candidate.full_domain, status=status)]
+
+    monkeypatch.setattr(availability_recheck, "list_stale_availability", fake_list)
+    monkeypatch.setattr(availability_recheck, "record_availability_results", fake_record)
+    monkeypatch.setattr(availability_recheck, "build_availability_provider", lambda http_client: _Provider())
+
+    summary = await availability_recheck.refresh_stale_availability(
+        _Session(),
+        checked_before=datetime.now(timezone.utc),
+        max_domains=10,
+        batch_size=2,
+        rate_per_second=None,
+    )
+
+    assert summary == {"checked": 5, "updated": 4}
+    assert sorted(recorded) == ["d0.com", "d2.com", "d3.com", "d4.com"]
+    # The stale set is selected once per run, not once per batch.
+    assert selections == [10]
+
+
+@pytest.mark.asyncio
+async def test_job_listings_exclude_availability_jobs():
+    from services.api.repositories.jobs import get_jobs_version, list_jobs, summarize_job_usage
+
+    statements = []
+
+    class _RecordingSession:
+        async def execute(self, stmt):
+            statements.append(str(stmt.compile(dialect=postgresql.dialect())))
+            return self
+
+        def one(self):
+            return (0, None, None, None)
+
+        def scalar_one(self):
+            return 0
+
+        def scalars(self):
+            return self
+
+        def all(self):
+            return []
+
+    session = _RecordingSession()
+    await list_jobs(session, created_by=None, limit=10, cursor=None)
+    await get_jobs_version(session, created_by=None)
+    await summarize_job_usage(session, created_by=None, since=None)
+
+    assert len(statements) == 4
+    assert all("jobs.type = %(type_1)s" in sql for sql in statements)
+
+
+@pytest.mark.asyncio
+async def test_background_job_appends_results_per_flush(monkeypatch):
+    job = SimpleNamespace(id=uuid.uuid4(), params={"progress": {"checked": 0, "total": 5}})
+    appended = []
+    progress = []
+
+    class _JobSession(_Session):
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        async def commit(self):
+            await super().commit()
+            progress.append(job.params["progress"]["checked"])
+
+    async def fake_get_job(session, job_id):
+        return job
+
+    async def fake_update(session, job, *, status, **kwargs):
+        job.status = status
+
+    async def fake_append(session, job_id, results):
+        appended.append([result["full_domain"] for result in results])
+
+    async def fake_record(session, results, domain_ids):
+        pass
+
+    monkeypatch.setattr(availability_recheck, "_FLUSH_SIZE", 2)
+    monkeypatch.setattr(availability_recheck, "JobSessionFactory", _JobSession)
+    monkeypatch.setattr(availability_recheck, "get_job", fake_get_job)
+    monkeypatch.setattr(availability_recheck, "update_job_status", fake_update)
+    monkeypatch.setattr(availability_recheck, "add_availability_job_results", fake_append)
+    monkeypatch.setattr(availability_recheck, "record_availability_results", fake_record)
+    monkeypatch.setattr(availability_recheck, "build_availability_provider", lambda http_client: _SlowProvider())
+
+    domains = {f"d{i}.com": None for i in range(5)}
+    await availability_recheck.run_availability_job(job.id, domains)
+
+    # Each flush writes only its own results; params carry progress alone.
+    assert [len(batch) for batch in appended] == [2, 2, 1]
+    assert sorted(name for batch in appended for name in batch) == sorted(domains)
+    assert job.params == {"progress": {"checked": 5, "total": 5}}
+    assert job.status == "succeeded"
+    assert progress[1:4] == [2, 4, 5]
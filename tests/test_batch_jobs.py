@@ -0,0 +1,91 @@
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from packages.shared_py.namesmith_schemas.base import EntryPath
+from services.agents import executor
+from services.agents.state import GenerationInputs
+from services.api.repositories.jobs import create_jobs
+
+
+class _FakeSession:
+    def __init__(self):
+        self.calls = []
+
+    async def scalars(self, stmt, params):
+        self.calls.append((stmt, params))
+
+        class _Result:
+            def all(self_inner):
+                return [row["id"] for row in params]
+
+        return _Result()
+
+
+@pytest.mark.asyncio
+async def test_create_jobs_inserts_all_rows_in_one_statement():
+    session = _FakeSession()
+    created_by = uuid.uuid4()
+
+    jobs = await create_jobs(
+        session,
+        job_type="generate",
+        created_by=created_by,
+        jobs=[{"entry_path": "business", "params": {"topic": f"topic-{i}"}} for i in range(3)],
+    )
+
+    assert len(session.calls) == 1
+    stmt, rows = session.calls[0]
+    assert "INSERT INTO jobs" in str(stmt.compile(dialect=postgresql.dialect()))
+    assert [row["params"]["topic"] for row in rows] == ["topic-0", "topic-1", "topic-2"]
+    assert {row["created_by"] for row in rows} == {created_by}
+    assert jobs == [row["id"] for row in rows]
+
+
+@pytest.mark.asyncio
+async def test_run_generation_jobs_shares_providers_and_bounds_concurrency(monkeypatch):
+    built = []
+
+    def fake_build(*, generation_model, scoring_model, http_client):
+        built.append((generation_model, scoring_model, http_client))
+        return object(), object(), object()
+
+    active = 0
+    peak = 0
+    seen_providers = []
+
+    async def fake_run(inputs, *, build_providers):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        seen_providers.append(
+            build_providers(generation_model=inputs.generation_model, scoring_model="score-model")
+        )
+        await asyncio.sleep(0.01)
+        active -= 1
+        if inputs.topic == "boom":
+            raise RuntimeError("failed")
+        return inputs.topic
+
+    monkeypatch.setattr(executor, "build_default_providers", fake_build)
+    monkeypatch.setattr(executor, "run_generation_job", fake_run)
+
+    batch = [
+        GenerationInputs(
+            job_id=uuid.uuid4(),
+            entry_path=EntryPath.BUSINESS,
+            topic=topic,
+            generation_model="model-a" if i % 2 else "model-b",
+        )
+        for i, topic in enumerate(["a", "b", "c", "boom", "e"])
+    ]
+    results = await executor.run_generation_jobs(batch, concurrency=2)
+
+    assert results[:3] == ["a", "b", "c"]
+    assert isinstance(results[3], RuntimeError)
+    assert peak == 2
+    assert sorted(model for model, _, _ in built) == ["model-a", "model-b"]
+    assert len({id(client) for _, _, client in built}) == 1
+    assert len({id(providers) for providers in seen_providers}) == 2
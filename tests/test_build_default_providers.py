@@ -17,9 +17,12 @@ class DummyAgentSettings:
         self.generation_model = "dummy-generation"
         self.scoring_model = "dummy-scoring"
         self.registrar_provider = registrar_provider
+        self.registrar_fallback_providers = []
         self.whoapi_key = whoapi_key
         self.whoisjsonapi_key = whoisjson_key
         self.dns_timeout_seconds = 5.0
+        self.dns_prefilter_enabled = False
+        self.zone_index_dir = None
 
     def get_domain_availability_api_key(
         self, provider: DomainAvailabilityProvider | str
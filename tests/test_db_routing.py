@@ -0,0 +1,42 @@
+import pytest
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from services.api.db.routing import ReplicaRouter
+
+# Nothing listens on port 1, so connecting fails immediately.
+_UNREACHABLE = "postgresql+asyncpg://u:p@127.0.0.1:1/db"
+
+
+def test_healthy_replicas_rotate_and_skip_cooldown():
+    primary = create_async_engine(_UNREACHABLE)
+    first, second = create_async_engine(_UNREACHABLE), create_async_engine(_UNREACHABLE)
+    router = ReplicaRouter(primary, [first, second], cooldown_seconds=60)
+
+    assert router.healthy_replicas() == [first, second]
+    assert router.healthy_replicas() == [second, first]
+
+    router.mark_down(first)
+    assert router.healthy_replicas() == [second]
+    router.mark_up(first)
+    assert set(router.healthy_replicas()) == {first, second}
+
+
+@pytest.mark.asyncio
+async def test_unreachable_replicas_fail_over_to_primary():
+    primary = create_async_engine(_UNREACHABLE)
+    replicas = [create_async_engine(_UNREACHABLE), create_async_engine(_UNREACHABLE)]
+    router = ReplicaRouter(primary, replicas, cooldown_seconds=60)
+
+    async with router.session() as session:
+        assert session.bind is primary
+
+    assert router.healthy_replicas() == []
+
+
+@pytest.mark.asyncio
+async def test_without_replicas_sessions_use_primary():
+    primary = create_async_engine(_UNREACHABLE)
+    router = ReplicaRouter(primary)
+
+    async with router.session() as session:
+        assert session.bind is primary
@@ -0,0 +1,38 @@
+from services.api.db import session as db_session
+from services.api.settings import settings
+
+
+def test_api_and_job_engines_use_separate_pools():
+    api_pool = db_session.engine.sync_engine.pool
+    jobs_pool = db_session.jobs_engine.sync_engine.pool
+
+    assert api_pool is not jobs_pool
+    assert api_pool.size() == settings.db_pool_size
+    assert jobs_pool.size() == settings.db_jobs_pool_size
+    assert db_session.JobSessionFactory.kw["bind"] is db_session.jobs_engine
+
+
+def test_create_engine_applies_pool_overrides(monkeypatch):
+    monkeypatch.setattr(settings, "db_pool_recycle_seconds", 600)
+    monkeypatch.setattr(settings, "db_pool_pre_ping", False)
+
+    engine = db_session.create_engine(pool_size=2, max_overflow=1)
+    pool = engine.sync_engine.pool
+
+    assert pool.size() == 2
+    assert pool._max_overflow == 1
+    assert pool._recycle == 600
+    assert pool._pre_ping is False
+
+
+def test_connect_args_set_statement_timeout_and_cache(monkeypatch):
+    monkeypatch.setattr(settings, "db_statement_cache_size", 0)
+
+    args = db_session._connect_args(application_name="namesmith_jobs", statement_timeout_ms=15000)
+
+    assert args["server_settings"] == {"application_name": "namesmith_jobs", "statement_timeout": "15000"}
+    assert args["statement_cache_size"] == 0
+    assert args["prepared_statement_cache_size"] == 0
+    assert "statement_timeout" not in db_session._connect_args(
+        application_name="namesmith_api", statement_timeout_ms=None
+    )["server_settings"]
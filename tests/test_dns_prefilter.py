@@ -0,0 +1,82 @@
+import asyncio
+
+import dns.message
+import dns.rcode
+import dns.rrset
+import pytest
+
+from services.agents.providers.base import AvailabilityProvider
+from services.agents.providers.dns_prefilter import DnsPrefilterAvailabilityProvider, build_resolver
+from services.agents.state import AvailabilityResult, Candidate
+
+
+class _StubDnsServer(asyncio.DatagramProtocol):
+    """Answers NS queries for ``delegated`` names, NXDOMAIN for the rest, and ignores ``silent``."""
+
+    def __init__(self, delegated, silent=()):
+        self.delegated = set(delegated)
+        self.silent = set(silent)
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def datagram_received(self, data, addr):
+        query = dns.message.from_wire(data)
+        name = query.question[0].name.to_text(omit_final_dot=True)
+        if name in self.silent:
+            return
+        response = dns.message.make_response(query)
+        if name in self.delegated:
+            response.answer.append(
+                dns.rrset.from_text(f"{name}.", 300, "IN", "NS", "ns1.example.net.", "ns2.example.net.")
+            )
+        else:
+            response.set_rcode(dns.rcode.NXDOMAIN)
+        self.transport.sendto(response.to_wire(), addr)
+
+
+class _RecordingProvider(AvailabilityProvider):
+    def __init__(self):
+        self.checked = []
+
+    async def check(self, candidates):
+        candidates = list(candidates)
+        self.checked.extend(candidate.full_domain for candidate in candidates)
+        return [AvailabilityResult(full_domain=candidate.full_domain, status="available") for candidate in candidates]
+
+
+@pytest.mark.asyncio
+async def test_delegated_domains_skip_the_registrar():
+    loop = asyncio.get_running_loop()
+    transport, _ = await loop.create_datagram_endpoint(
+        lambda: _StubDnsServer(delegated={"taken.com", "google.io"}, silent={"flaky.com"}),
+        local_addr=("127.0.0.1", 0),
+    )
+    port = transport.get_extra_info("sockname")[1]
+    registrar = _RecordingProvider()
+    provider = DnsPrefilterAvailabilityProvider(
+        registrar, resolver=build_resolver(nameservers=["127.0.0.1"], port=port, timeout=0.3)
+    )
+
+    try:
+        results = await provider.check(
+            [
+                Candidate(label="taken", tld="com"),
+                Candidate(label="fresh", tld="com"),
+                Candidate(label="google", tld="io"),
+                Candidate(label="flaky", tld="com"),
+            ]
+        )
+    finally:
+        transport.close()
+
+    assert [(result.full_domain, result.status, result.registrar) for result in results] == [
+        ("taken.com", "registered", "dns"),
+        ("fresh.com", "available", None),
+        ("google.io", "registered", "dns"),
+        ("flaky.com", "available", None),
+    ]
+    assert results[0].raw_payload == {"nameservers": ["ns1.example.net.", "ns2.example.net."]}
+    # NXDOMAIN and timed-out lookups both fall through to the registrar.
+    assert sorted(registrar.checked) == ["flaky.com", "fresh.com"]
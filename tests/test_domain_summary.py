@@ -0,0 +1,112 @@
+import uuid
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from services.api.repositories.domains import backfill_domain_summary, get_domains_version, list_domain_rows
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def scalars(self):
+        return self
+
+    def mappings(self):
+        return self
+
+    def all(self):
+        return self._rows
+
+
+class _FakeSession:
+    def __init__(self, ids=()):
+        self.ids = sorted(ids)
+        self.statements = []
+        self.refreshed: list[list[uuid.UUID]] = []
+        self.commits = 0
+
+    async def execute(self, stmt, params=None):
+        self.statements.append(stmt)
+        compiled = stmt.compile(dialect=postgresql.dialect())
+        sql = str(compiled)
+        if "refresh_domain_summaries" in sql:
+            self.refreshed.append(list(compiled.params.values()))
+            return _Result([])
+        if "FROM domain_names" in sql:
+            after = [value for key, value in compiled.params.items() if key.startswith("id_")]
+            limit = next(value for key, value in compiled.params.items() if key.startswith("param_"))
+            remaining = [i for i in self.ids if not after or i > after[0]]
+            return _Result(remaining[:limit])
+        return _Result([])
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.mark.asyncio
+async def test_list_domain_rows_reads_only_the_summary_table():
+    session = _FakeSession()
+    job_id = uuid.uuid4()
+    await list_domain_rows(
+        session,
+        limit=20,
+        cursor=None,
+        search="brand",
+        statuses=["available"],
+        categories=["fintech"],
+        job_id=job_id,
+        score_ranges={"overall": (7, None)},
+        sort_by="overall_score",
+    )
+
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "FROM domain_summary" in sql
+    assert "JOIN" not in sql
+    assert "DISTINCT" not in sql
+    assert "domain_summary.job_ids @>" in sql
+    assert "ORDER BY domain_summary.evaluation_overall_score DESC NULLS LAST" in sql
+
+
+@pytest.mark.asyncio
+async def test_backfill_refreshes_in_batches():
+    ids = [uuid.uuid4() for _ in range(5)]
+    session = _FakeSession(ids)
+
+    refreshed = await backfill_domain_summary(session, batch_size=2)
+
+    assert refreshed == 5
+    assert [len(batch) for batch in session.refreshed] == [2, 2, 1]
+    assert [i for batch in session.refreshed for i in batch] == sorted(ids)
+    assert session.commits == 3
+
+
+@pytest.mark.asyncio
+async def test_unfiltered_listing_has_no_where_clause(recwarn):
+    session = _FakeSession()
+    await list_domain_rows(session, limit=20, cursor=None)
+
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "WHERE" not in sql
+    assert not [warning for warning in recwarn if issubclass(warning.category, DeprecationWarning)]
+
+
+@pytest.mark.asyncio
+async def test_listing_version_reads_the_counter_row_only():
+    class _VersionSession:
+        statement = None
+
+        async def execute(self, stmt):
+            self.statement = stmt
+            return self
+
+        def scalar_one_or_none(self):
+            return 42
+
+    session = _VersionSession()
+
+    assert await get_domains_version(session) == (42,)
+    sql = str(session.statement.compile(dialect=postgresql.dialect()))
+    assert "FROM domain_summary_version" in sql
+    assert "count(" not in sql and "max(" not in sql
@@ -0,0 +1,29 @@
+from datetime import datetime, timezone
+
+from services.api.etags import etag_matches, make_etag, not_modified
+
+
+def test_make_etag_is_stable_and_weak():
+    version = (datetime(2024, 5, 1, tzinfo=timezone.utc), None)
+    etag = make_etag("job", version)
+    assert etag == make_etag("job", version)
+    assert etag.startswith('W/"')
+    assert etag != make_etag("job", (version[0], datetime(2024, 5, 2, tzinfo=timezone.utc)))
+
+
+def test_etag_matches_uses_weak_comparison():
+    etag = make_etag("domain", 1)
+    strong = etag.removeprefix("W/")
+    assert etag_matches(etag, etag)
+    assert etag_matches(strong, etag)
+    assert etag_matches(f'"other", {strong}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
+
+
+def test_not_modified_carries_etag():
+    etag = make_etag("x")
+    response = not_modified(etag)
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
@@ -1,3 +1,4 @@
+import asyncio
 import json
 import uuid
 
@@ -113,3 +114,164 @@ async def test_generation_provider_invalid_json(monkeypatch):
     )
     with pytest.raises(ValueError):
         await provider.generate(inputs, trends=[], company_examples=[])
+
+
+@pytest.mark.asyncio
+async def test_generation_provider_streams_candidates_as_items_close(monkeypatch):
+    content = json.dumps(
+        {"items": [{"label": "novastra", "tld": "com"}, {"label": "quantflux", "tld": "ai"}]}
+    )
+    chunks = [content[i : i + 9] for i in range(0, len(content), 9)]
+    sent = []
+    captured: dict = {}
+
+    async def fake_stream():
+        for text in chunks:
+            sent.append(text)
+            yield {"choices": [{"delta": {"content": text}}]}
+        yield {"choices": [], "usage": {"prompt_tokens": 10, "completion_tokens": 20}}
+
+    async def fake_acompletion(**kwargs):
+        captured.update(kwargs)
+        return fake_stream()
+
+    monkeypatch.setattr(llm, "acompletion", fake_acompletion)
+
+    provider = LLMGenerationProvider(model_name="stub-model")
+    inputs = GenerationInputs(job_id=uuid.uuid4(), entry_path=EntryPath.INVESTOR, topic="ai", count=2)
+    received = []
+    async for candidate in provider.stream(inputs, trends=[], company_examples=[]):
+        received.append((candidate.full_domain, len(sent)))
+
+    assert [domain for domain, _ in received] == ["novastra.com", "quantflux.ai"]
+    # The first candidate arrived while the completion was still streaming.
+    assert received[0][1] < len(chunks)
+    assert captured["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_stalled_stream_times_out_and_is_recorded_against_the_model(monkeypatch):
+    from services.agents.providers import routing
+
+    content = json.dumps({"items": [{"label": "novastra", "tld": "com"}]})
+
+    async def fake_stream(model):
+        if model == "slow-model":
+            await asyncio.sleep(1)
+        yield {"choices": [{"delta": {"content": content}}]}
+
+    async def fake_acompletion(**kwargs):
+        if kwargs["model"] == "limited-model":
+            raise _RateLimited()
+        return fake_stream(kwargs["model"])
+
+    monkeypatch.setattr(llm, "acompletion", fake_acompletion)
+    monkeypatch.setattr(llm.settings, "model_allowlist", ["slow-model", "limited-model", "fast-model"])
+    monkeypatch.setattr(llm.settings, "llm_attempt_timeout_seconds", 0.05)
+    monkeypatch.setattr(routing, "_MODEL_STATS", {})
+    monkeypatch.setattr(routing, "_COOLDOWN_UNTIL", {})
+
+    provider = LLMGenerationProvider(model_name="slow-model")
+    inputs = GenerationInputs(job_id=uuid.uuid4(), entry_path=EntryPath.INVESTOR, topic="ai", count=1)
+    received = [candidate.full_domain async for candidate in provider.stream(inputs, trends=[], company_examples=[])]
+
+    assert received == ["novastra.com"]
+    assert routing.model_stats("slow-model").error_ewma > 0
+    assert "limited-model" in routing._COOLDOWN_UNTIL
+    assert routing.model_stats("fast-model").latency_ewma is not None
+
+
+class _RateLimited(Exception):
+    status_code = 429
+
+
+@pytest.mark.asyncio
+async def test_stream_closed_early_still_records_usage(monkeypatch):
+    from services.agents.instrumentation import PipelineTrace
+
+    items = [{"label": f"brand{i}", "tld": "com"} for i in range(3)]
+    content = json.dumps({"items": items})
+    chunks = [content[i : i + 12] for i in range(0, len(content), 12)]
+    closed = []
+
+    class _Stream:
+        def __init__(self):
+            self._chunks = iter(chunks)
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            try:
+                text = next(self._chunks)
+            except StopIteration:
+                raise StopAsyncIteration
+            return {
+                "id": "chatcmpl-1",
+                "object": "chat.completion.chunk",
+                "created": 1,
+                "model": "stub-model",
+                "choices": [{"index": 0, "delta": {"content": text}}],
+            }
+
+        async def aclose(self):
+            closed.append(True)
+
+    async def fake_acompletion(**kwargs):
+        return _Stream()
+
+    monkeypatch.setattr(llm, "acompletion", fake_acompletion)
+
+    provider = LLMGenerationProvider(model_name="stub-model")
+    inputs = GenerationInputs(job_id=uuid.uuid4(), entry_path=EntryPath.INVESTOR, topic="ai", count=3)
+    trace = PipelineTrace()
+    with trace.stage("generate"):
+        stream = provider.stream(inputs, trends=[], company_examples=[])
+        async for candidate in stream:
+            if candidate.label == "brand1":
+                break
+        await stream.aclose()
+
+    usage = trace.usage()
+    assert closed == [True]
+    assert usage["calls"] == 1
+    assert usage["prompt_tokens"] > 0 and usage["completion_tokens"] > 0
+
+
+@pytest.mark.asyncio
+async def test_candidates_record_the_models_that_answered(monkeypatch):
+    from services.agents.nodes.persist import answered_models
+    from services.agents.providers import routing
+
+    generated = [{"label": "novastra", "tld": "com"}]
+    scored_items = [{**generated[0], "memorability": 8, "pronounceability": 8, "brandability": 8, "overall": 8}]
+
+    async def fake_acompletion(**kwargs):
+        if kwargs["model"] == "primary-model":
+            raise _RateLimited()
+        items = scored_items if kwargs["response_format"] is llm.ScoredCandidateList else generated
+        return {"choices": [{"message": {"content": json.dumps({"items": items})}}]}
+
+    monkeypatch.setattr(llm, "acompletion", fake_acompletion)
+    monkeypatch.setattr(llm.settings, "model_allowlist", ["primary-model", "backup-model"])
+    monkeypatch.setattr(routing, "_MODEL_STATS", {})
+    monkeypatch.setattr(routing, "_COOLDOWN_UNTIL", {})
+
+    inputs = GenerationInputs(
+        job_id=uuid.uuid4(),
+        entry_path=EntryPath.INVESTOR,
+        topic="ai",
+        count=1,
+        generation_model="primary-model",
+        scoring_model="primary-model",
+    )
+    candidates = await LLMGenerationProvider(model_name="primary-model").generate(
+        inputs, trends=[], company_examples=[]
+    )
+    scored = await LLMScoringProvider(model_name="primary-model").score(candidates)
+
+    assert candidates[0].generation_model == "backup-model"
+    assert (scored[0].generation_model, scored[0].scoring_model) == ("backup-model", "backup-model")
+    assert answered_models(inputs, scored) == ("backup-model", "backup-model")
+    # Provenance is not part of the schema the LLM is asked to fill.
+    assert "generation_model" not in json.dumps(llm.CandidateList.model_json_schema())
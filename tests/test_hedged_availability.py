@@ -0,0 +1,83 @@
+import asyncio
+
+import pytest
+
+from services.agents.providers import hedged
+from services.agents.providers.base import AvailabilityProvider
+from services.agents.providers.hedged import HedgedAvailabilityProvider, provider_stats
+from services.agents.state import AvailabilityResult, Candidate
+
+
+class _Provider(AvailabilityProvider):
+    def __init__(self, name, *, delay=0.0, status="available", raises=False):
+        self.name = name
+        self.delay = delay
+        self.status = status
+        self.raises = raises
+        self.calls = 0
+        self.cancelled = 0
+
+    async def check(self, candidates):
+        self.calls += 1
+        candidate = list(candidates)[0]
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.raises:
+            raise RuntimeError(f"{self.name} down")
+        return [AvailabilityResult(full_domain=candidate.full_domain, status=self.status, registrar=self.name)]
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    hedged._STATS.clear()
+    yield
+    hedged._STATS.clear()
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged_and_loses():
+    primary = _Provider("primary", delay=1.0)
+    secondary = _Provider("secondary", delay=0.01, status="registered")
+    provider = HedgedAvailabilityProvider(
+        [("primary", primary), ("secondary", secondary)], hedge_delay_seconds=0.05
+    )
+
+    results = await provider.check([Candidate(label="brand", tld="com")])
+    await asyncio.sleep(0)
+
+    assert [(result.status, result.registrar) for result in results] == [("registered", "secondary")]
+    assert primary.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_errors_fall_back_immediately_and_reorder_providers():
+    primary = _Provider("primary", raises=True)
+    secondary = _Provider("secondary")
+    provider = HedgedAvailabilityProvider(
+        [("primary", primary), ("secondary", secondary)], hedge_delay_seconds=5.0
+    )
+
+    results = await provider.check([Candidate(label=f"name{i}", tld="com") for i in range(3)])
+
+    assert {result.registrar for result in results} == {"secondary"}
+    assert provider_stats("primary").error_ewma > 0.4
+    assert [name for name, _ in provider._ordered()] == ["secondary", "primary"]
+
+    # Once reordered, the failing provider is no longer asked first.
+    primary.calls = 0
+    await provider.check([Candidate(label="again", tld="com")])
+    assert primary.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_inconclusive_everywhere_prefers_unknown_over_error():
+    provider = HedgedAvailabilityProvider(
+        [("a", _Provider("a", status="unknown")), ("b", _Provider("b", raises=True))], hedge_delay_seconds=5.0
+    )
+
+    results = await provider.check([Candidate(label="brand", tld="zz")])
+
+    assert (results[0].status, results[0].registrar) == ("unknown", "a")
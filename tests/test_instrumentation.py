@@ -0,0 +1,86 @@
+import json
+import uuid
+
+import pytest
+
+from packages.shared_py.namesmith_schemas.base import EntryPath
+from services.agents.instrumentation import PipelineTrace, record_llm_usage
+from services.agents.nodes.generate import build_generate_node
+from services.agents.providers import llm
+from services.agents.providers.llm import LLMGenerationProvider
+from services.agents.state import GenerationInputs
+
+
+@pytest.mark.asyncio
+async def test_trace_records_timing_items_and_token_usage(monkeypatch):
+    async def fake_acompletion(**kwargs):
+        content = json.dumps({"items": [{"label": "novastra", "tld": "com"}, {"label": "quantflux", "tld": "ai"}]})
+        return {
+            "choices": [{"message": {"content": content}}],
+            "usage": {"prompt_tokens": 120, "completion_tokens": 40, "total_tokens": 160},
+        }
+
+    monkeypatch.setattr(llm, "acompletion", fake_acompletion)
+    monkeypatch.setattr(llm, "completion_cost", lambda completion_response: 0.0025)
+
+    trace = PipelineTrace()
+    node = trace.wrap("generate", build_generate_node(LLMGenerationProvider(model_name="stub-model")))
+    inputs = GenerationInputs(job_id=uuid.uuid4(), entry_path=EntryPath.BUSINESS, topic="ai", count=2)
+    await node({"inputs": inputs})
+
+    [metrics] = trace.nodes
+    output = metrics.as_output()
+    assert metrics.status == "succeeded"
+    assert metrics.finished_at is not None and output["duration_ms"] >= 0
+    assert output["items_out"] == 2
+    assert output["llm_calls"] == 1
+    assert output["models"] == ["stub-model"]
+    assert (output["prompt_tokens"], output["completion_tokens"], output["total_tokens"]) == (120, 40, 160)
+    assert output["cost_usd"] == 0.0025
+
+
+@pytest.mark.asyncio
+async def test_trace_records_failed_node():
+    trace = PipelineTrace(trace_id="trace-1")
+
+    def broken(state):
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await trace.wrap("dedupe", broken)({"candidates": []})
+
+    [metrics] = trace.nodes
+    assert trace.trace_id == "trace-1"
+    assert metrics.status == "failed"
+    assert metrics.errors == 1
+    assert metrics.error == "boom"
+    assert metrics.items_in == 0
+
+
+@pytest.mark.asyncio
+async def test_trace_usage_sums_nodes_by_model():
+    trace = PipelineTrace()
+
+    def calls(*usages):
+        def node(state):
+            for model, prompt_tokens, completion_tokens, cost in usages:
+                response = {"usage": {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens}}
+                record_llm_usage(model, response, cost_usd=cost)
+            return {}
+
+        return node
+
+    await trace.wrap("generate", calls(("big", 1000, 400, 0.02)))({})
+    await trace.wrap("score", calls(("small", 300, 100, 0.001), ("small", 200, 50, 0.0005)))({})
+
+    usage = trace.usage()
+    assert (usage["calls"], usage["prompt_tokens"], usage["completion_tokens"]) == (3, 1500, 550)
+    assert usage["total_tokens"] == 2050
+    assert usage["cost_usd"] == pytest.approx(0.0215)
+    assert usage["by_model"]["small"] == {
+        "calls": 2,
+        "prompt_tokens": 500,
+        "completion_tokens": 150,
+        "total_tokens": 650,
+        "cost_usd": 0.0015,
+    }
@@ -0,0 +1,118 @@
+import uuid
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from packages.shared_py.namesmith_schemas.base import EntryPath
+from services.agents import executor
+from services.agents.state import GenerationInputs
+from services.api.repositories import jobs as jobs_repo
+
+
+def _inputs(**overrides):
+    values = {
+        "job_id": uuid.uuid4(),
+        "entry_path": EntryPath.BUSINESS,
+        "topic": "AI  analytics",
+        "categories": ["Fintech", "saas"],
+        "tlds": ["com", ".ai"],
+        "count": 10,
+        "generation_model": "gen",
+        "scoring_model": "score",
+    }
+    values.update(overrides)
+    return GenerationInputs(**values)
+
+
+def test_fingerprint_ignores_ids_order_case_and_whitespace():
+    base = _inputs().fingerprint()
+
+    assert _inputs(user_id=uuid.uuid4()).fingerprint() == base
+    assert _inputs(topic="ai analytics ", categories=["SaaS", "fintech"], tlds=["ai", "com"]).fingerprint() == base
+    assert _inputs(count=11).fingerprint() != base
+    assert _inputs(scoring_model="other").fingerprint() != base
+
+
+class _RecordingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, stmt):
+        self.statements.append(stmt)
+
+    async def scalars(self, stmt):
+        self.statements.append(stmt)
+        return SimpleNamespace(all=lambda: [])
+
+
+def _sql(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+@pytest.mark.asyncio
+async def test_locks_and_leader_lookup_are_single_statements():
+    session = _RecordingSession()
+    now = datetime.now(timezone.utc)
+
+    await jobs_repo.lock_inputs_hashes(session, ["b", "a", "b"])
+    found = await jobs_repo.find_coalescable_jobs(
+        session, inputs_hashes=["a", "b"], active_since=now, succeeded_since=now
+    )
+
+    assert found == {}
+    lock_sql, lookup_sql = (_sql(stmt) for stmt in session.statements)
+    assert "pg_advisory_xact_lock(hashtext(" in lock_sql
+    assert "DISTINCT ON (jobs.inputs_hash)" in lookup_sql
+    assert "NOT (jobs.params ? " in lookup_sql
+
+
+@pytest.mark.asyncio
+async def test_follower_adopts_leader_results(monkeypatch):
+    leader_id = uuid.uuid4()
+    leader = SimpleNamespace(id=leader_id)
+    job = SimpleNamespace(id=uuid.uuid4(), params={"coalesced_with": str(leader_id)}, started_at=None)
+    adopted = []
+
+    async def fake_wait(job_id):
+        assert job_id == leader_id
+        return "succeeded"
+
+    async def fake_get_job(session, job_id):
+        return leader
+
+    async def fake_adopt(session, *, job, source, finished_at):
+        adopted.append(source)
+        job.params = dict(job.params) | {"progress": {"persisted": 4}}
+        return job
+
+    class _Session:
+        async def commit(self):
+            pass
+
+    monkeypatch.setattr(executor, "_wait_for_leader", fake_wait)
+    monkeypatch.setattr(executor, "get_job", fake_get_job)
+    monkeypatch.setattr(executor, "adopt_job_results", fake_adopt)
+
+    state = await executor._adopt_leader_results(_Session(), job, _inputs())
+
+    assert adopted == [leader]
+    assert state.progress == {"persisted": 4}
+
+
+@pytest.mark.asyncio
+async def test_follower_runs_itself_when_leader_fails(monkeypatch):
+    job = SimpleNamespace(id=uuid.uuid4(), params={"coalesced_with": str(uuid.uuid4()), "topic": "x"})
+
+    async def fake_wait(job_id):
+        return "failed"
+
+    class _Session:
+        async def commit(self):
+            pass
+
+    monkeypatch.setattr(executor, "_wait_for_leader", fake_wait)
+
+    assert await executor._adopt_leader_results(_Session(), job, _inputs()) is None
+    assert job.params == {"topic": "x"}
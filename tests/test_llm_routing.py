@@ -0,0 +1,94 @@
+import asyncio
+
+import pytest
+
+from services.agents.providers import routing
+from services.agents.providers.routing import route_completion, route_models
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+@pytest.fixture(autouse=True)
+def _reset_health():
+    routing._MODEL_STATS.clear()
+    routing._COOLDOWN_UNTIL.clear()
+    yield
+    routing._MODEL_STATS.clear()
+    routing._COOLDOWN_UNTIL.clear()
+
+
+def _call(behaviour, calls):
+    async def call(model):
+        calls.append(model)
+        delay, outcome = behaviour[model]
+        await asyncio.sleep(delay)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    return call
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_model_falls_back_and_cools_down():
+    calls = []
+    call = _call({"primary": (0, _StatusError(429)), "backup": (0, "from backup")}, calls)
+
+    model, response = await route_completion(
+        "generation", call, models=route_models("primary", ["primary", "backup"])
+    )
+
+    assert (model, response) == ("backup", "from backup")
+    assert calls == ["primary", "backup"]
+    assert route_models("primary", ["primary", "backup"]) == ["backup", "primary"]
+
+
+@pytest.mark.asyncio
+async def test_slow_model_is_hedged_and_the_fastest_answer_wins(monkeypatch):
+    monkeypatch.setattr(routing.settings, "llm_hedge_delay_seconds", 0.05)
+    calls = []
+    call = _call({"primary": (1.0, "from primary"), "backup": (0.01, "from backup")}, calls)
+
+    model, response = await route_completion("scoring", call, models=["primary", "backup"])
+
+    assert (model, response) == ("backup", "from backup")
+    assert calls == ["primary", "backup"]
+
+
+@pytest.mark.asyncio
+async def test_attempt_deadline_moves_on_to_the_next_model():
+    calls = []
+    call = _call({"primary": (1.0, "late"), "backup": (0, "on time")}, calls)
+
+    model, response = await route_completion(
+        "generation", call, models=["primary", "backup"], attempt_timeout_seconds=0.05, hedge=False
+    )
+
+    assert (model, response) == ("backup", "on time")
+    assert routing.model_stats("primary").error_ewma > 0
+
+
+@pytest.mark.asyncio
+async def test_non_retryable_errors_are_raised_without_fallback():
+    calls = []
+    call = _call({"primary": (0, _StatusError(400)), "backup": (0, "unused")}, calls)
+
+    with pytest.raises(_StatusError):
+        await route_completion("generation", call, models=["primary", "backup"])
+    assert calls == ["primary"]
+
+
+@pytest.mark.asyncio
+async def test_rejected_hedge_does_not_fail_a_healthy_primary(monkeypatch):
+    monkeypatch.setattr(routing.settings, "llm_hedge_delay_seconds", 0.05)
+    calls = []
+    call = _call({"primary": (0.2, "from primary"), "backup": (0, _StatusError(401))}, calls)
+
+    model, response = await route_completion("generation", call, models=["primary", "backup"])
+
+    assert (model, response) == ("primary", "from primary")
+    assert calls == ["primary", "backup"]
@@ -0,0 +1,50 @@
+import time
+
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+
+from services.api.main import app
+from services.api.metrics import observe_llm_request, record_cache_lookup
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+def test_metrics_endpoint_labels_requests_by_route_template():
+    client = TestClient(app)
+    before = _sample("namesmith_http_requests_total", method="GET", route="/healthz", status="200")
+
+    assert client.get("/healthz").status_code == 200
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "namesmith_http_requests_total" in response.text
+    after = _sample("namesmith_http_requests_total", method="GET", route="/healthz", status="200")
+    assert after == before + 1
+
+
+def test_observe_llm_request_counts_tokens_and_errors():
+    labels = {"model": "test-model", "kind": "generation"}
+    prompt_before = _sample("namesmith_llm_tokens_total", type="prompt", **labels)
+    errors_before = _sample("namesmith_llm_requests_total", outcome="error", **labels)
+
+    observe_llm_request("test-model", "generation", time.perf_counter(), (120, 30))
+    observe_llm_request("test-model", "generation", time.perf_counter(), None)
+
+    assert _sample("namesmith_llm_tokens_total", type="prompt", **labels) == prompt_before + 120
+    assert _sample("namesmith_llm_tokens_total", type="completion", **labels) >= 30
+    assert _sample("namesmith_llm_requests_total", outcome="error", **labels) == errors_before + 1
+
+
+def test_record_cache_lookup_splits_hits_and_misses():
+    hits = _sample("namesmith_cache_requests_total", cache="test", result="hit")
+    misses = _sample("namesmith_cache_requests_total", cache="test", result="miss")
+
+    record_cache_lookup("test", True)
+    record_cache_lookup("test", False)
+    record_cache_lookup("test", False)
+
+    assert _sample("namesmith_cache_requests_total", cache="test", result="hit") == hits + 1
+    assert _sample("namesmith_cache_requests_total", cache="test", result="miss") == misses + 2
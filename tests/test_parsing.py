@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+from services.agents.parsing import JsonItemStream, extract_json_payload, parse_candidates, parse_scored_candidates
+
+
+def test_extract_json_payload_strips_code_fences():
+    content = "```json\n" + json.dumps({"items": [{"label": "novastra", "tld": "com"}]}) + "\n```"
+    assert extract_json_payload(content) == {"items": [{"label": "novastra", "tld": "com"}]}
+
+
+def test_extract_json_payload_rejects_invalid_json():
+    with pytest.raises(ValueError, match="not valid JSON"):
+        extract_json_payload("not json")
+
+
+def test_parse_candidates_accepts_items_object_and_list():
+    items = [{"label": "NovaStra", "tld": ".COM"}]
+    from_object = parse_candidates(json.dumps({"items": items}))
+    from_list = parse_candidates(json.dumps(items))
+
+    assert from_object == from_list
+    assert from_object[0].full_domain == "novastra.com"
+    assert from_object[0].display_name == "Novastra"
+
+
+def test_parse_scored_candidates_defaults_missing_overall():
+    content = json.dumps(
+        {
+            "items": [
+                {"label": "quantflux", "tld": "ai", "memorability": 6, "pronounceability": 8, "brandability": 9},
+                {"label": "novastra", "tld": "com", "memorability": 8, "pronounceability": 8, "brandability": 9, "overall": 9},
+            ]
+        }
+    )
+    scored = parse_scored_candidates(content)
+
+    assert [candidate.overall for candidate in scored] == [7.0, 9.0]
+
+
+def test_json_item_stream_emits_items_as_their_objects_close():
+    payload = '```json\n{"items": [{"label": "brace}", "tld": "com"}, {"label": "quo\\"te", "tld": "ai", "tags": [{"x": 1}]}]}\n```'
+    stream = JsonItemStream()
+    emitted = []
+    for i in range(0, len(payload), 7):
+        emitted.append(stream.feed(payload[i : i + 7]))
+
+    items = [item for chunk in emitted for item in chunk]
+    assert [item["label"] for item in items] == ["brace}", 'quo"te']
+    assert items[1]["tags"] == [{"x": 1}]
+    # The first item is available before the rest of the payload arrives.
+    first_chunk = next(i for i, chunk in enumerate(emitted) if chunk)
+    assert first_chunk < len(emitted) - 3
+    assert stream.started
@@ -0,0 +1,42 @@
+import pytest
+
+from services.agents.benchmark import NODE_NAMES, BenchmarkConfig, run_benchmark
+from services.agents.providers.fake import LatencyProfile
+
+# Persist round trips for a 10-name job; lower this when the write path gets cheaper.
+_MAX_ROUND_TRIPS_PER_JOB = 52
+
+
+@pytest.mark.asyncio
+async def test_pipeline_benchmark_runs_end_to_end():
+    config = BenchmarkConfig(
+        jobs=4,
+        count=10,
+        generation_latency=LatencyProfile(),
+        scoring_latency=LatencyProfile(),
+        availability_latency=LatencyProfile(),
+        availability_error_rate=0.0,
+    )
+    result = await run_benchmark(config, concurrency=2)
+
+    assert result.failed == 0
+    assert result.jobs_per_second > 0
+    assert set(NODE_NAMES) <= set(result.node_seconds)
+    assert all(len(result.node_seconds[name]) == config.jobs for name in NODE_NAMES)
+    assert 0 < result.round_trips_per_job <= _MAX_ROUND_TRIPS_PER_JOB
+
+
+@pytest.mark.asyncio
+async def test_pipeline_benchmark_counts_simulated_failures():
+    config = BenchmarkConfig(
+        jobs=3,
+        count=5,
+        generation_latency=LatencyProfile(),
+        scoring_latency=LatencyProfile(),
+        availability_latency=LatencyProfile(),
+        generation_error_rate=1.0,
+    )
+    result = await run_benchmark(config, concurrency=3)
+
+    assert result.failed == 3
+    assert result.db_round_trips == 0
@@ -0,0 +1,72 @@
+"""Query-plan regression tests for the hot list/filter shapes.
+
+These need a Postgres database migrated to head; point
+``NAMESMITH_TEST_DATABASE_URL`` at a scratch database to run them. Sequential
+scans are disabled for each EXPLAIN so the planner picks an index whenever one
+is usable, independent of how many rows the scratch tables hold.
+"""
+from __future__ import annotations
+
+import json
+import os
+from typing import Any, Iterator
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+_DATABASE_URL = os.environ.get("NAMESMITH_TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(
+    not _DATABASE_URL, reason="NAMESMITH_TEST_DATABASE_URL is not set"
+)
+
+_USER_ID = "00000000-0000-0000-0000-000000000001"
+_JOB_ID = "00000000-0000-0000-0000-000000000002"
+
+# (query, index the plan must use)
+_CASES = [
+    (
+        f"SELECT * FROM jobs WHERE created_by = '{_USER_ID}' ORDER BY created_at DESC LIMIT 20",
+        "ix_jobs_created_by_created_at",
+    ),
+    (
+        "SELECT job_id FROM job_domain_links WHERE domain_id = '00000000-0000-0000-0000-000000000003'",
+        "ix_job_domain_links_domain_id",
+    ),
+    ("SELECT max(created_at) FROM domain_names", "ix_domain_names_created_at"),
+    ("SELECT id FROM domain_names WHERE agent_model IN ('gpt-4o-mini')", "ix_domain_names_agent_model"),
+    ("SELECT domain_id FROM dn_evaluations WHERE overall_score >= 8", "ix_dn_evaluations_overall_score"),
+    (
+        "SELECT domain_id FROM dn_evaluations WHERE possible_categories && ARRAY['fintech']::varchar[]",
+        "ix_dn_evaluations_possible_categories",
+    ),
+    (
+        f"SELECT d.id FROM domain_names d JOIN job_domain_links l ON l.domain_id = d.id WHERE l.job_id = '{_JOB_ID}'",
+        "pk_job_domain_links",
+    ),
+]
+
+
+def _index_names(plan: dict[str, Any]) -> Iterator[str]:
+    if "Index Name" in plan:
+        yield plan["Index Name"]
+    for child in plan.get("Plans", []):
+        yield from _index_names(child)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("query", "index_name"), _CASES)
+async def test_hot_queries_use_index(query: str, index_name: str):
+    url = _DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+    engine = create_async_engine(url)
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SET LOCAL enable_seqscan = off"))
+            raw = (await conn.execute(text(f"EXPLAIN (FORMAT JSON) {query}"))).scalar_one()
+            await conn.rollback()
+    finally:
+        await engine.dispose()
+
+    plan = (json.loads(raw) if isinstance(raw, str) else raw)[0]["Plan"]
+    assert index_name in set(_index_names(plan)), json.dumps(plan, indent=2)
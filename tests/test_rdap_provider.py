@@ -0,0 +1,150 @@
+import os
+import time
+
+import httpx
+import orjson
+import pytest
+
+from services.agents.providers import rdap
+from services.agents.providers.rdap import RdapAvailabilityProvider, RdapBootstrap
+from services.agents.state import Candidate
+
+BOOTSTRAP_URL = "https://bootstrap.test/rdap/dns.json"
+BOOTSTRAP = {
+    "services": [
+        [["com", "net"], ["http://rdap.registry.test/", "https://rdap.registry.test/"]],
+        [["io"], ["https://rdap.io.test/rdap"]],
+    ]
+}
+
+
+class _FakeRdapServer:
+    def __init__(self, registered=(), bootstrap_status=200):
+        self.registered = set(registered)
+        self.bootstrap_status = bootstrap_status
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        if str(request.url) == BOOTSTRAP_URL:
+            return httpx.Response(self.bootstrap_status, json=BOOTSTRAP)
+        domain = request.url.path.rsplit("/", 1)[-1]
+        if domain in self.registered:
+            return httpx.Response(200, json={"objectClassName": "domain", "ldhName": domain})
+        return httpx.Response(404, json={"errorCode": 404})
+
+
+@pytest.fixture(autouse=True)
+def _clear_bootstrap_cache():
+    rdap._BOOTSTRAP_CACHE.clear()
+    yield
+    rdap._BOOTSTRAP_CACHE.clear()
+
+
+def _provider(server, cache_path, refresh_seconds=3600):
+    bootstrap = RdapBootstrap(url=BOOTSTRAP_URL, cache_path=cache_path, refresh_seconds=refresh_seconds)
+    client = httpx.AsyncClient(transport=httpx.MockTransport(server))
+    return client, RdapAvailabilityProvider(
+        client=client, bootstrap=bootstrap, max_connections_per_host=2, requests_per_second_per_host=1000
+    )
+
+
+@pytest.mark.asyncio
+async def test_maps_404_to_available_and_200_to_registered(tmp_path):
+    server = _FakeRdapServer(registered={"taken.com"})
+    client, provider = _provider(server, tmp_path / "dns.json")
+
+    async with client:
+        results = await provider.check(
+            [
+                Candidate(label="taken", tld="com"),
+                Candidate(label="free", tld="io"),
+                Candidate(label="nowhere", tld="zz"),
+            ]
+        )
+
+    assert [(result.full_domain, result.status) for result in results] == [
+        ("taken.com", "registered"),
+        ("free.io", "available"),
+        ("nowhere.zz", "unknown"),
+    ]
+    assert results[0].raw_payload["ldhName"] == "taken.com"
+    lookups = [str(request.url) for request in server.requests if str(request.url) != BOOTSTRAP_URL]
+    assert sorted(lookups) == ["https://rdap.io.test/rdap/domain/free.io", "https://rdap.registry.test/domain/taken.com"]
+    assert all(request.headers["accept"] == "application/rdap+json" for request in server.requests[1:])
+
+
+@pytest.mark.asyncio
+async def test_bootstrap_is_fetched_once_and_reused_from_disk(tmp_path):
+    cache_path = tmp_path / "dns.json"
+    server = _FakeRdapServer()
+    client, provider = _provider(server, cache_path)
+
+    async with client:
+        await provider.check([Candidate(label="a", tld="com"), Candidate(label="b", tld="net")])
+        await provider.check([Candidate(label="c", tld="com")])
+
+    assert [str(request.url) for request in server.requests].count(BOOTSTRAP_URL) == 1
+    assert orjson.loads(cache_path.read_bytes()) == BOOTSTRAP
+
+    # A new process (empty memory cache) reads the fresh file instead of fetching.
+    rdap._BOOTSTRAP_CACHE.clear()
+    server = _FakeRdapServer()
+    client, provider = _provider(server, cache_path)
+    async with client:
+        await provider.check([Candidate(label="d", tld="com")])
+    assert BOOTSTRAP_URL not in [str(request.url) for request in server.requests]
+
+
+@pytest.mark.asyncio
+async def test_stale_bootstrap_is_used_when_refresh_fails(tmp_path):
+    cache_path = tmp_path / "dns.json"
+    cache_path.write_bytes(orjson.dumps(BOOTSTRAP))
+    old = time.time() - 7200
+    os.utime(cache_path, (old, old))
+    server = _FakeRdapServer(bootstrap_status=503)
+    client, provider = _provider(server, cache_path, refresh_seconds=3600)
+
+    async with client:
+        results = await provider.check([Candidate(label="free", tld="com")])
+
+    assert results[0].status == "available"
+    assert str(server.requests[0].url) == BOOTSTRAP_URL
+
+
+@pytest.mark.asyncio
+async def test_failed_first_bootstrap_is_retried_instead_of_cached(tmp_path):
+    cache_path = tmp_path / "dns.json"
+    server = _FakeRdapServer(bootstrap_status=503)
+    client, provider = _provider(server, cache_path)
+
+    async with client:
+        results = await provider.check([Candidate(label="free", tld="com")])
+        assert results[0].status == "unknown"
+
+        # The empty result is kept only for the short retry delay, not the refresh period.
+        expires_at, services = rdap._BOOTSTRAP_CACHE[str(cache_path)]
+        assert services == {} and expires_at <= time.time() + rdap._RETRY_AFTER_FAILURE_SECONDS
+        rdap._BOOTSTRAP_CACHE[str(cache_path)] = (time.time() - 1, services)
+        server.bootstrap_status = 200
+        results = await provider.check([Candidate(label="free", tld="com")])
+
+    assert results[0].status == "available"
+    assert [str(request.url) for request in server.requests].count(BOOTSTRAP_URL) == 2
+
+
+@pytest.mark.asyncio
+async def test_checks_without_a_shared_client_open_their_own(tmp_path, monkeypatch):
+    server = _FakeRdapServer(registered={"taken.com"})
+    real_client = httpx.AsyncClient
+
+    def client_factory(**kwargs):
+        return real_client(transport=httpx.MockTransport(server), **kwargs)
+
+    monkeypatch.setattr(rdap.httpx, "AsyncClient", client_factory)
+    bootstrap = RdapBootstrap(url=BOOTSTRAP_URL, cache_path=tmp_path / "dns.json", refresh_seconds=3600)
+    provider = RdapAvailabilityProvider(bootstrap=bootstrap, max_connections_per_host=2)
+
+    results = await provider.check([Candidate(label="taken", tld="com")])
+
+    assert results[0].status == "registered"
@@ -1,8 +1,15 @@
+from collections import namedtuple
 from datetime import datetime, timezone
+import json
 import uuid
 
 from services.api.db.models import DomainAvailabilityStatus, DomainEvaluation, DomainName
-from services.api.serializers import serialize_domain
+from services.api.serializers import (
+    dump_json,
+    serialize_domain,
+    serialize_domain_row,
+    serialize_usage_rollup,
+)
 
 
 def test_serialize_domain_handles_relationships():
@@ -37,3 +44,70 @@ def test_serialize_domain_handles_relationships():
     assert schema.full_domain == "sparkwave.com"
     assert schema.availability and schema.availability.status == "available"
     assert schema.evaluation and schema.evaluation.memorability_score == 8
+
+
+def test_serialize_domain_row_matches_model_serialization():
+    created = datetime.now(timezone.utc)
+    domain_id = uuid.uuid4()
+    row = {
+        "id": domain_id,
+        "label": "sparkwave",
+        "tld": "com",
+        "display_name": "Sparkwave",
+        "length": 9,
+        "processed_by_agent": None,
+        "agent_model": "gpt-4o-mini",
+        "created_at": created,
+        "availability_id": uuid.uuid4(),
+        "availability_status": "available",
+        "availability_agent_model": None,
+        "availability_created_at": created,
+        "evaluation_id": uuid.uuid4(),
+        "evaluation_possible_categories": ["ai"],
+        "evaluation_possible_keywords": None,
+        "evaluation_memorability_score": 8,
+        "evaluation_pronounceability_score": 7,
+        "evaluation_brandability_score": 9,
+        "evaluation_overall_score": 8,
+        "evaluation_description": "Well-balanced brand name",
+        "evaluation_processed_by_agent": None,
+        "evaluation_agent_model": None,
+        "evaluation_created_at": created,
+        "seo_id": None,
+    }
+    domain = DomainName(
+        id=domain_id,
+        label="sparkwave",
+        tld="com",
+        display_name="Sparkwave",
+        length=9,
+        agent_model="gpt-4o-mini",
+        created_at=created,
+    )
+    domain.availability = DomainAvailabilityStatus(status="available", created_at=created)
+    domain.evaluation = DomainEvaluation(
+        possible_categories=["ai"],
+        possible_keywords=None,
+        memorability_score=8,
+        pronounceability_score=7,
+        brandability_score=9,
+        overall_score=8,
+        description="Well-balanced brand name",
+        created_at=created,
+    )
+
+    expected = json.loads(serialize_domain(domain).model_dump_json(by_alias=True))
+    assert json.loads(dump_json(serialize_domain_row(row))) == expected
+
+
+def test_serialize_usage_rollup_totals_models():
+    Row = namedtuple("Row", "model calls prompt_tokens completion_tokens cost_usd")
+    rows = [Row("big", 4, 4000, 1600, 0.08), Row("small", 4, 1200, 300, 0.002)]
+
+    rollup = serialize_usage_rollup(3, rows)
+
+    assert rollup.jobs == 3
+    assert rollup.usage.calls == 8
+    assert rollup.usage.total_tokens == 7100
+    assert rollup.usage.cost_usd == 0.082
+    assert rollup.usage.by_model["small"].total_tokens == 1500
@@ -0,0 +1,195 @@
+import asyncio
+import json
+import uuid
+
+import pytest
+
+from packages.shared_py.namesmith_schemas.base import EntryPath
+from services.agents import pipeline
+from services.agents.instrumentation import PipelineTrace
+from services.agents.providers import llm
+from services.agents.providers.base import AvailabilityProvider, GenerationProvider, ScoringProvider
+from services.agents.state import AvailabilityResult, Candidate, GenerationInputs, GenerationState, ScoredCandidate
+
+
+class _StreamingGeneration(GenerationProvider):
+    def __init__(self, labels, delay=0.02):
+        self.labels = labels
+        self.delay = delay
+        self.emitted = 0
+
+    async def generate(self, inputs, *, trends, company_examples):
+        raise AssertionError("the streaming pipeline must use stream()")
+
+    async def stream(self, inputs, *, trends, company_examples):
+        for label in self.labels:
+            await asyncio.sleep(self.delay)
+            self.emitted += 1
+            yield Candidate(label=label, tld="com")
+
+
+class _Scoring(ScoringProvider):
+    def __init__(self, fail=False):
+        self.batches = []
+        self.fail = fail
+
+    async def score(self, candidates):
+        if self.fail:
+            raise RuntimeError("scoring down")
+        self.batches.append([candidate.label for candidate in candidates])
+        return [
+            ScoredCandidate(
+                label=candidate.label,
+                tld=candidate.tld,
+                memorability=7,
+                pronounceability=7,
+                brandability=7,
+                overall=7,
+            )
+            for candidate in candidates
+        ]
+
+
+class _Availability(AvailabilityProvider):
+    def __init__(self, generation):
+        self.generation = generation
+        self.emitted_at_first_check = None
+
+    async def check(self, candidates):
+        if self.emitted_at_first_check is None:
+            self.emitted_at_first_check = self.generation.emitted
+        candidate = list(candidates)[0]
+        if candidate.label == "broken":
+            raise RuntimeError("registrar down")
+        return [AvailabilityResult(full_domain=candidate.full_domain, status="available")]
+
+
+class _Session:
+    def __init__(self):
+        self.commits = 0
+
+    async def commit(self):
+        self.commits += 1
+
+
+@pytest.fixture
+def persisted(monkeypatch):
+    batches = []
+
+    async def fake_persist(session, inputs, scored, availability):
+        batches.append(([candidate.label for candidate in scored], [result.status for result in availability]))
+        return [str(uuid.uuid4()) for _ in scored]
+
+    async def fake_record(session, inputs, scored, *, count, started_at, trace_id):
+        batches.append(("run", count))
+
+    monkeypatch.setattr(pipeline, "persist_candidates", fake_persist)
+    monkeypatch.setattr(pipeline, "record_generation_run", fake_record)
+    monkeypatch.setattr(pipeline.settings, "streaming_score_batch_size", 2)
+    monkeypatch.setattr(pipeline.settings, "streaming_batch_wait_seconds", 0.01)
+    return batches
+
+
+def _inputs(count):
+    return GenerationInputs(job_id=uuid.uuid4(), entry_path=EntryPath.BUSINESS, topic="fintech", count=count)
+
+
+@pytest.mark.asyncio
+async def test_candidates_stream_through_every_stage(persisted):
+    labels = ["alpha", "alpha", "bo", "bravo", "broken", "delta", "echo", "foxtrot", "golf", "hotel"]
+    generation = _StreamingGeneration(labels)
+    scoring = _Scoring()
+    availability = _Availability(generation)
+    trace = PipelineTrace()
+    session = _Session()
+
+    final_state = await pipeline.run_streaming_pipeline(
+        {"inputs": _inputs(count=5)},
+        generation_provider=generation,
+        scoring_provider=scoring,
+        availability_provider=availability,
+        session=session,
+        trace=trace,
+    )
+
+    # Online dedupe drops the duplicate and the short label, and generation
+    # stops once enough candidates were accepted.
+    assert sorted(candidate.label for candidate in final_state["scored"]) == [
+        "alpha", "bravo", "broken", "delta", "echo"
+    ]
+    assert generation.emitted < len(labels)
+    assert all(len(batch) <= 2 for batch in scoring.batches)
+    # Availability checks started while generation was still streaming.
+    assert availability.emitted_at_first_check < generation.emitted
+    statuses = {result.full_domain: result.status for result in final_state["availability"]}
+    assert statuses["broken.com"] == "error" and statuses["alpha.com"] == "available"
+    assert 5 < final_state["progress"]["generated"] <= generation.emitted
+    assert final_state["progress"] == {
+        "generated": final_state["progress"]["generated"],
+        "filtered": 5,
+        "scored": 5,
+        "availability_checked": 5,
+        "persisted": 5,
+    }
+    assert persisted[-1] == ("run", 5)
+    assert session.commits >= 2
+    assert [node.node for node in trace.nodes] == [
+        "gather_context", "generate", "dedupe", "score", "availability", "persist"
+    ]
+    assert GenerationState(**final_state).progress["persisted"] == 5
+
+
+@pytest.mark.asyncio
+async def test_stage_failure_cancels_the_pipeline(persisted):
+    trace = PipelineTrace()
+
+    with pytest.raises(RuntimeError, match="scoring down"):
+        await asyncio.wait_for(
+            pipeline.run_streaming_pipeline(
+                {"inputs": _inputs(count=3)},
+                generation_provider=_StreamingGeneration(["alpha", "bravo", "charlie"], delay=0),
+                scoring_provider=_Scoring(fail=True),
+                availability_provider=_Availability(_StreamingGeneration([])),
+                session=_Session(),
+                trace=trace,
+            ),
+            timeout=2,
+        )
+    assert next(node for node in trace.nodes if node.node == "score").status == "failed"
+
+
+@pytest.mark.asyncio
+async def test_early_stop_keeps_generation_usage(persisted, monkeypatch):
+    content = json.dumps({"items": [{"label": f"brand{i}", "tld": "com"} for i in range(20)]})
+
+    async def fake_stream():
+        for start in range(0, len(content), 16):
+            await asyncio.sleep(0)
+            yield {
+                "id": "chatcmpl-1",
+                "object": "chat.completion.chunk",
+                "created": 1,
+                "model": "stub-model",
+                "choices": [{"index": 0, "delta": {"content": content[start : start + 16]}}],
+            }
+
+    async def fake_acompletion(**kwargs):
+        return fake_stream()
+
+    monkeypatch.setattr(llm, "acompletion", fake_acompletion)
+    trace = PipelineTrace()
+
+    final_state = await pipeline.run_streaming_pipeline(
+        {"inputs": _inputs(count=2)},
+        generation_provider=llm.LLMGenerationProvider(model_name="stub-model"),
+        scoring_provider=_Scoring(),
+        availability_provider=_Availability(_StreamingGeneration([])),
+        session=_Session(),
+        trace=trace,
+    )
+
+    # Generation stopped long before the completion ended, and was still billed.
+    assert final_state["progress"]["generated"] < 20
+    generate = next(node for node in trace.nodes if node.node == "generate")
+    assert generate.usage_by_model["stub-model"].calls == 1
+    assert trace.usage()["completion_tokens"] > 0
@@ -0,0 +1,99 @@
+import gzip
+import struct
+
+import pytest
+
+from services.agents.providers import zone_index
+from services.agents.providers.base import AvailabilityProvider
+from services.agents.providers.zone_index import (
+    ZoneIndex,
+    ZoneIndexAvailabilityProvider,
+    iter_zone_labels,
+    label_hash,
+    write_zone_index,
+)
+from services.agents.state import AvailabilityResult, Candidate
+from services.agents.zone_ingest import build_index
+
+ZONE = """\
+$ORIGIN COM.
+$TTL 900
+@ IN SOA a.gtld-servers.net. nstld.verisign-grs.com. (
+    1700000000 1800 900 604800 86400 )
+@ 172800 IN NS a.gtld-servers.net.
+EXAMPLE NS NS1.EXAMPLE.NET.
+        NS NS2.EXAMPLE.NET.
+Taken 86400 IN NS ns1.host.net. ; comment
+ns1.taken A 192.0.2.1
+other.com. 172800 in ns ns1.other.net.
+sub.deep.com. 172800 in ns ns1.other.net.
+elsewhere.net. 172800 in ns ns1.other.net.
+"""
+
+
+def test_iter_zone_labels_reads_delegations_only():
+    labels = list(iter_zone_labels(ZONE.splitlines(), tld="com"))
+
+    assert labels == ["example", "example", "taken", "other"]
+
+
+class _RecordingProvider(AvailabilityProvider):
+    def __init__(self):
+        self.checked = []
+
+    async def check(self, candidates):
+        candidates = list(candidates)
+        self.checked.extend(candidate.full_domain for candidate in candidates)
+        return [AvailabilityResult(full_domain=candidate.full_domain, status="available") for candidate in candidates]
+
+
+@pytest.mark.asyncio
+async def test_index_answers_hits_and_defers_misses(tmp_path):
+    zone_path = tmp_path / "com.zone.gz"
+    with gzip.open(zone_path, "wt") as handle:
+        handle.write(ZONE)
+    index_dir = tmp_path / "zones"
+
+    target, count = build_index(zone_path, tld="com", out_dir=index_dir)
+
+    assert count == 3
+    index = ZoneIndex(target)
+    assert len(index) == 3
+    assert "example" in index and "TAKEN" in index and "fresh" not in index
+
+    live = _RecordingProvider()
+    provider = ZoneIndexAvailabilityProvider(live, index_dir=index_dir)
+    results = await provider.check(
+        [Candidate(label="example", tld="com"), Candidate(label="fresh", tld="com"), Candidate(label="example", tld="io")]
+    )
+
+    assert [(result.full_domain, result.status, result.registrar) for result in results] == [
+        ("example.com", "registered", "zone"),
+        ("fresh.com", "available", None),
+        ("example.io", "available", None),
+    ]
+    assert live.checked == ["fresh.com", "example.io"]
+
+
+def test_index_files_are_little_endian(tmp_path):
+    labels = ["example", "taken", "other"]
+    path = tmp_path / "com.zidx"
+
+    assert write_zone_index(labels, path) == 3
+
+    data = path.read_bytes()
+    assert struct.unpack_from("<8sQ", data) == (b"NSZONE1\0", 3)
+    assert list(struct.unpack_from("<3Q", data, 16)) == sorted(label_hash(label) for label in labels)
+
+
+def test_index_round_trips_when_hashes_are_swapped(tmp_path, monkeypatch):
+    # What a big-endian host does on both sides of the file.
+    monkeypatch.setattr(zone_index, "_SWAP_BYTES", True)
+    path = tmp_path / "com.zidx"
+    write_zone_index(["example", "taken", "other"], path)
+
+    index = ZoneIndex(path)
+
+    assert len(index) == 3
+    assert "taken" in index and "example" in index
+    assert "free" not in index